@@ -23,6 +23,7 @@ from inspect import isawaitable
 from os import environ
 from pathlib import Path
 from socket import socket
+from time import perf_counter
 from traceback import format_exc
 from types import SimpleNamespace
 from typing import (
@@ -73,6 +74,12 @@ from sanic.helpers import Default, _default
 from sanic.http import Stage
 from sanic.log import LOGGING_CONFIG_DEFAULTS, error_logger, logger
 from sanic.logging.setup import setup_logging
+from sanic.metrics import (
+    WEBSOCKETS,
+    WEBSOCKETS_OPEN,
+    MetricsTable,
+    WorkerMetrics,
+)
 from sanic.middleware import Middleware, MiddlewareLocation
 from sanic.mixins.listeners import ListenerEvent
 from sanic.mixins.startup import StartupMixin
@@ -87,12 +94,31 @@ from sanic.models.futures import (
 )
 from sanic.models.handler_types import ListenerType, MiddlewareType
 from sanic.models.handler_types import Sanic as SanicVar
+from sanic.offload import Offloader
+from sanic.pipeline import RoutePipeline, route_events
 from sanic.request import Request
 from sanic.response import BaseHTTPResponse, HTTPResponse, ResponseStream
+from sanic.response.cache import ResponseCache
 from sanic.router import Router
+from sanic.server.admission import (
+    AdmissionControl,
+    AdmissionHook,
+    ConcurrencyLimit,
+    concurrency_limits,
+    report_limits,
+)
+from sanic.server.monitor import LoopMonitor
 from sanic.server.websockets.impl import ConnectionClosed
-from sanic.signals import Event, Signal, SignalRouter
+from sanic.signals import Event, Signal, SignalDispatcher, SignalRouter
 from sanic.touchup import TouchUp, TouchUpMeta
+from sanic.tracing import (
+    BODY,
+    ROUTING,
+    SEND,
+    RequestTrace,
+    Tracer,
+    TraceSink,
+)
 from sanic.types.shared_ctx import SharedContext
 from sanic.worker.inspector import Inspector
 from sanic.worker.loader import CertLoader
@@ -112,6 +138,7 @@ if OS_IS_WINDOWS:  # no cov
 
 ctx_type = TypeVar("ctx_type")
 config_type = TypeVar("config_type", bound=Config)
+result_type = TypeVar("result_type")
 
 
 class Sanic(
@@ -183,6 +210,7 @@ class Sanic(
         "_run_request_middleware",
     )
     __slots__ = (
+        "_admission_hooks",
         "_asgi_app",
         "_asgi_lifespan",
         "_asgi_client",
@@ -197,11 +225,15 @@ class Sanic(
         "_future_signals",
         "_future_statics",
         "_inspector",
+        "_loop_monitor",
         "_manager",
+        "_metrics_table",
         "_state",
         "_task_registry",
         "_test_client",
         "_test_manager",
+        "_trace_sinks",
+        "admission",
         "blueprints",
         "certloader_class",
         "config",
@@ -211,9 +243,11 @@ class Sanic(
         "inspector_class",
         "go_fast",
         "listeners",
+        "metrics",
         "multiplexer",
         "named_request_middleware",
         "named_response_middleware",
+        "offloader",
         "request_class",
         "request_middleware",
         "response_middleware",
@@ -222,6 +256,7 @@ class Sanic(
         "signal_router",
         "sock",
         "strict_slashes",
+        "tracer",
         "websocket_enabled",
         "websocket_tasks",
     )
@@ -352,6 +387,7 @@ class Sanic(
             self.config.INSPECTOR = inspector
 
         # Then we can do the rest
+        self._admission_hooks: List[AdmissionHook] = []
         self._asgi_app: Optional[ASGIApp] = None
         self._asgi_lifespan: Optional[Lifespan] = None
         self._asgi_client: Any = None
@@ -359,11 +395,15 @@ class Sanic(
         self._delayed_tasks: List[str] = []
         self._future_registry: FutureRegistry = FutureRegistry()
         self._inspector: Optional[Inspector] = None
+        self._loop_monitor: Optional[LoopMonitor] = None
         self._manager: Optional[WorkerManager] = None
+        self._metrics_table: Optional[MetricsTable] = None
         self._state: ApplicationState = ApplicationState(app=self)
         self._task_registry: Dict[str, Union[Task, None]] = {}
         self._test_client: Any = None
         self._test_manager: Any = None
+        self._trace_sinks: List[TraceSink] = []
+        self.admission: Optional[AdmissionControl] = None
         self.asgi = False
         self.auto_reload = False
         self.blueprints: Dict[str, Blueprint] = {}
@@ -375,8 +415,10 @@ class Sanic(
         self.error_handler: ErrorHandler = error_handler or ErrorHandler()
         self.inspector_class: Type[Inspector] = inspector_class or Inspector
         self.listeners: Dict[str, List[ListenerType[Any]]] = defaultdict(list)
+        self.metrics: Optional[WorkerMetrics] = None
         self.named_request_middleware: Dict[str, Deque[Middleware]] = {}
         self.named_response_middleware: Dict[str, Deque[Middleware]] = {}
+        self.offloader: Optional[Offloader] = None
         self.request_class = request_class or Request
         self.request_middleware: Deque[Middleware] = deque()
         self.response_middleware: Deque[Middleware] = deque()
@@ -385,6 +427,7 @@ class Sanic(
         self.signal_router: SignalRouter = signal_router or SignalRouter()
         self.sock: Optional[socket] = None
         self.strict_slashes: bool = strict_slashes
+        self.tracer: Optional[Tracer] = None
         self.websocket_enabled: bool = False
         self.websocket_tasks: Set[Future[Any]] = set()
 
@@ -610,15 +653,33 @@ class Sanic(
             params["handler"] = websocket_handler
 
         ctx = params.pop("route_context")
+        cache = params.pop("cache", None)
+        offload = params.pop("offload", None)
+        max_concurrency = params.pop("max_concurrency", None)
+        queue = params.pop("queue", 0)
 
         with self.amend():
             routes = self.router.add(**params)
             if isinstance(routes, Route):
                 routes = [routes]
 
+            # The routes of every host share a limit
+            limit = (
+                ConcurrencyLimit(max_concurrency, queue, name=routes[0].name)
+                if max_concurrency
+                else None
+            )
+
             for r in routes:
                 r.extra.websocket = websocket
                 r.extra.static = params.get("static", False)
+                r.extra.response_cache = (
+                    ResponseCache(cache) if cache else None
+                )
+                r.extra.offload = offload
+                r.extra.max_concurrency = max_concurrency
+                r.extra.queue = queue
+                r.extra.concurrency_limit = limit
                 r.ctx.__dict__.update(ctx)
 
         return routes
@@ -830,6 +891,92 @@ class Sanic(
 
         return report
 
+    async def offload(
+        self, func: Callable[..., result_type], *args, **kwargs
+    ) -> result_type:
+        """Run a blocking function on a thread, and wait for its result.
+
+        The event loop keeps handling other requests while the function
+        runs. The function is run on the threads that the sync handlers of
+        routes are offloaded to, see `OFFLOAD_THREADS` and
+        `OFFLOAD_QUEUE_SIZE`.
+
+        ```python
+        @app.get("/report")
+        async def report(request):
+            data = await app.offload(build_report, request.args.get("day"))
+            return json(data)
+        ```
+
+        Args:
+            func (Callable[..., result_type]): The function.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Raises:
+            SanicException: If the application has not been started.
+            ServiceUnavailable: If the threads and the queue are all taken.
+
+        Returns:
+            result_type: The result of the function.
+        """
+        if self.offloader is None:
+            raise SanicException(
+                "Cannot offload a function before the application has started"
+            )
+        return await self.offloader.run(func, *args, **kwargs)
+
+    def admission_bypass(self, hook: AdmissionHook) -> AdmissionHook:
+        """Register a hook that lets requests bypass admission control.
+
+        When `ADMISSION_MAX_REQUESTS` is set, a worker only handles that
+        many requests at once, and sheds the requests that cannot wait
+        for their turn with a 503 response. A request that a hook returns
+        `True` for is handled at once instead, which is typically used
+        for health checks and critical routes. The hook is called with the
+        request as soon as its head has been received, before it has been
+        routed, and only while the worker is at its limit.
+
+        ```python
+        @app.admission_bypass
+        def health_checks(request):
+            return request.path == "/health"
+        ```
+
+        Args:
+            hook (AdmissionHook): The hook to register.
+
+        Returns:
+            AdmissionHook: The hook that was registered.
+        """
+        self._admission_hooks.append(hook)
+        return hook
+
+    def trace_sink(self, sink: TraceSink) -> TraceSink:
+        """Register a sink for the traces of requests.
+
+        When `TRACING` is enabled, the time taken by each stage of every
+        request is recorded in a `RequestTrace`. The traces are passed to
+        the sinks in batches, of up to `TRACING_BATCH_SIZE` traces, at
+        least every `TRACING_FLUSH_INTERVAL` seconds. A sink may be a
+        function or a coroutine function, and is typically used to send
+        the traces to an external service.
+
+        ```python
+        @app.trace_sink
+        async def export(traces):
+            await send_somewhere([trace.as_dict() for trace in traces])
+        ```
+
+        Args:
+            sink (TraceSink): The sink to register.
+
+        Returns:
+            TraceSink: The sink that was registered.
+        """
+        self._trace_sinks.append(sink)
+        return sink
+
     def enable_websocket(self, enable: bool = True) -> None:
         """Enable or disable the support for websocket.
 
@@ -1297,16 +1444,15 @@ class Sanic(
             context={"request": request},
         )
 
-        # Define `response` var here to remove warnings about
-        # allocation before assignment below.
-        response: Optional[
-            Union[
-                BaseHTTPResponse,
-                Coroutine[Any, Any, Optional[BaseHTTPResponse]],
-                ResponseStream,
-            ]
-        ] = None
         run_middleware = True
+        metrics = self.metrics
+        started = metrics.request_started() if metrics is not None else 0.0
+        tracer = self.tracer
+        trace = None
+        if tracer is not None:
+            trace = request.trace
+            if trace is None:
+                trace = request.trace = RequestTrace()
         try:
             await self.dispatch(
                 "http.routing.before",
@@ -1314,120 +1460,41 @@ class Sanic(
                 context={"request": request},
             )
             # Fetch handler from router
+            if trace is not None:
+                trace.begin(ROUTING)
             route, handler, kwargs = self.router.get(
                 request.path,
                 request.method,
-                request.headers.getone("host", None),
+                request.host_header,
             )
 
+            if handler is None:
+                raise ServerError(
+                    (
+                        "'None' was returned while requesting a "
+                        "handler from the router"
+                    )
+                )
+
+            # The router caches its results, so the parameters are shared
+            # by every request to the same path, and middleware may change
+            # them on the request
             request._match_info = {**kwargs}
             request.route = route
+            pipeline: RoutePipeline = route.extra.pipeline
 
-            await self.dispatch(
-                "http.routing.after",
-                inline=True,
-                context={
-                    "request": request,
-                    "route": route,
-                    "kwargs": kwargs,
-                    "handler": handler,
-                },
-            )
-
-            if (
-                request.stream
-                and request.stream.request_body
-                and not route.extra.ignore_body
-            ):
-                if hasattr(handler, "is_stream"):
-                    # Streaming handler: lift the size limit
-                    request.stream.request_max_size = float("inf")
-                else:
-                    # Non-streaming handler: preload body
-                    await request.receive_body()
+            if trace is not None:
+                trace.end(ROUTING)
+                trace.begin(BODY)
+            await pipeline.prepare(request, kwargs)
+            if trace is not None:
+                trace.end(BODY)
 
             # -------------------------------------------- #
-            # Request Middleware
+            # Request Middleware, Handler and Response
             # -------------------------------------------- #
             run_middleware = False
-            if request.route.extra.request_middleware:
-                response = await self._run_request_middleware(
-                    request, request.route.extra.request_middleware
-                )
-
-            # No middleware results
-            if not response:
-                # -------------------------------------------- #
-                # Execute Handler
-                # -------------------------------------------- #
-
-                if handler is None:
-                    raise ServerError(
-                        (
-                            "'None' was returned while requesting a "
-                            "handler from the router"
-                        )
-                    )
-
-                # Run response handler
-                await self.dispatch(
-                    "http.handler.before",
-                    inline=True,
-                    context={"request": request},
-                )
-                response = handler(request, **request.match_info)
-                if isawaitable(response):
-                    response = await response
-                await self.dispatch(
-                    "http.handler.after",
-                    inline=True,
-                    context={"request": request},
-                )
-
-            if request.responded:
-                if response is not None:
-                    error_logger.error(
-                        "The response object returned by the route handler "
-                        "will not be sent to client. The request has already "
-                        "been responded to."
-                    )
-                if request.stream is not None:
-                    response = request.stream.response
-            elif response is not None:
-                response = await request.respond(response)  # type: ignore
-            elif not hasattr(handler, "is_websocket"):
-                response = request.stream.response  # type: ignore
-
-            # Marked for cleanup and DRY with handle_request/handle_exception
-            # when ResponseStream is no longer supporder
-            if isinstance(response, BaseHTTPResponse):
-                await self.dispatch(
-                    "http.lifecycle.response",
-                    inline=True,
-                    context={
-                        "request": request,
-                        "response": response,
-                    },
-                )
-                ...
-                await response.send(end_stream=True)
-            elif isinstance(response, ResponseStream):
-                resp = await response(request)
-                await self.dispatch(
-                    "http.lifecycle.response",
-                    inline=True,
-                    context={
-                        "request": request,
-                        "response": resp,
-                    },
-                )
-                await response.eof()
-            else:
-                if not hasattr(handler, "is_websocket"):
-                    raise ServerError(
-                        f"Invalid response type {response!r} "
-                        "(need HTTPResponse)"
-                    )
+            await pipeline(request)
 
         except CancelledError:  # type: ignore
             raise
@@ -1436,6 +1503,13 @@ class Sanic(
             await self.handle_exception(
                 request, e, run_middleware=run_middleware
             )
+        finally:
+            if metrics is not None:
+                metrics.request_finished(request, started)
+            if tracer is not None and trace is not None:
+                if trace.marks[SEND * 2]:
+                    trace.end(SEND)
+                tracer.finish(request, trace)
 
     async def _websocket_handler(
         self, handler, request, *args, subprotocols=None, **kwargs
@@ -1459,6 +1533,10 @@ class Sanic(
         fut = ensure_future(handler(request, ws, *args, **kwargs))
         self.websocket_tasks.add(fut)
         cancelled = False
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.add(WEBSOCKETS)
+            metrics.add(WEBSOCKETS_OPEN)
         try:
             await fut
             await self.dispatch(
@@ -1481,6 +1559,8 @@ class Sanic(
             )
         finally:
             self.websocket_tasks.remove(fut)
+            if metrics is not None:
+                metrics.add(WEBSOCKETS_OPEN, -1)
             if cancelled:
                 ws.end_connection(1000)
             else:
@@ -1538,31 +1618,43 @@ class Sanic(
         self, request, middleware_collection
     ):  # no cov
         request._request_middleware_started = True
+        dispatch_before = self.signal_router.has_handlers(
+            "http.middleware.before"
+        )
+        dispatch_after = self.signal_router.has_handlers(
+            "http.middleware.after"
+        )
 
         for middleware in middleware_collection:
-            await self.dispatch(
-                "http.middleware.before",
-                inline=True,
-                context={
-                    "request": request,
-                    "response": None,
-                },
-                condition={"attach_to": "request"},
-            )
+            if dispatch_before:
+                await self.dispatch(
+                    "http.middleware.before",
+                    inline=True,
+                    context={
+                        "request": request,
+                        "response": None,
+                    },
+                    condition={"attach_to": "request"},
+                )
 
+            trace = request.trace
+            started = perf_counter() if trace is not None else 0.0
             response = middleware(request)
             if isawaitable(response):
                 response = await response
+            if trace is not None:
+                trace.add_middleware(middleware, started)
 
-            await self.dispatch(
-                "http.middleware.after",
-                inline=True,
-                context={
-                    "request": request,
-                    "response": None,
-                },
-                condition={"attach_to": "request"},
-            )
+            if dispatch_after:
+                await self.dispatch(
+                    "http.middleware.after",
+                    inline=True,
+                    context={
+                        "request": request,
+                        "response": None,
+                    },
+                    condition={"attach_to": "request"},
+                )
 
             if response:
                 return response
@@ -1571,30 +1663,43 @@ class Sanic(
     async def _run_response_middleware(
         self, request, response, middleware_collection
     ):  # no cov
+        dispatch_before = self.signal_router.has_handlers(
+            "http.middleware.before"
+        )
+        dispatch_after = self.signal_router.has_handlers(
+            "http.middleware.after"
+        )
+
         for middleware in middleware_collection:
-            await self.dispatch(
-                "http.middleware.before",
-                inline=True,
-                context={
-                    "request": request,
-                    "response": response,
-                },
-                condition={"attach_to": "response"},
-            )
+            if dispatch_before:
+                await self.dispatch(
+                    "http.middleware.before",
+                    inline=True,
+                    context={
+                        "request": request,
+                        "response": response,
+                    },
+                    condition={"attach_to": "response"},
+                )
 
+            trace = request.trace
+            started = perf_counter() if trace is not None else 0.0
             _response = middleware(request, response)
             if isawaitable(_response):
                 _response = await _response
+            if trace is not None:
+                trace.add_middleware(middleware, started)
 
-            await self.dispatch(
-                "http.middleware.after",
-                inline=True,
-                context={
-                    "request": request,
-                    "response": _response if _response else response,
-                },
-                condition={"attach_to": "response"},
-            )
+            if dispatch_after:
+                await self.dispatch(
+                    "http.middleware.after",
+                    inline=True,
+                    context={
+                        "request": request,
+                        "response": _response if _response else response,
+                    },
+                    condition={"attach_to": "response"},
+                )
 
             if _response:
                 response = _response
@@ -2292,8 +2397,9 @@ class Sanic(
 
         This method completes the routing setup by calling the router's
         finalize method, and it also finalizes any middleware that has been
-        added to the application. If the application is not in test mode,
-        any finalization errors will be raised.
+        added to the application and builds the request handling pipeline of
+        each route. If the application is not in test mode, any finalization
+        errors will be raised.
 
         Finalization consists of identifying defined routes and optimizing
         Sanic's performance to meet the application's specific needs. If
@@ -2320,13 +2426,30 @@ class Sanic(
             if not Sanic.test_mode:
                 raise e
         self.finalize_middleware()
+        self.finalize_pipelines()
+
+    def finalize_pipelines(self) -> None:
+        """Build the request handling pipeline for every route.
+
+        Each route gets a `RoutePipeline` on `route.extra.pipeline`, which
+        only contains the steps that actually apply to it. Therefore, this
+        must run after the middleware has been finalized.
+
+        .. note::
+            This method is usually called internally by `finalize` and does
+            not typically need to be invoked manually.
+        """
+        events = route_events(self)
+        for route in self.router.routes:
+            route.extra.pipeline = RoutePipeline(self, route, events)
 
     def signalize(self, allow_fail_builtin: bool = True) -> None:
         """Finalize the signal handling configuration for the Sanic application.
 
         This method completes the signal handling setup by calling the signal
         router's finalize method. If the application is not in test mode,
-        any finalization errors will be raised.
+        any finalization errors will be raised. When `SIGNAL_QUEUE_SIZE` is
+        set, it also sets up the queue for background signal dispatches.
 
         Finalization consists of identifying defined signaliz and optimizing
         Sanic's performance to meet the application's specific needs. If
@@ -2358,6 +2481,13 @@ class Sanic(
         except FinalizationError as e:
             if not Sanic.test_mode:
                 raise e
+        if self.config.SIGNAL_QUEUE_SIZE and not self.signal_router.dispatcher:
+            self.signal_router.dispatcher = SignalDispatcher(
+                self.signal_router,
+                self.config.SIGNAL_QUEUE_SIZE,
+                self.config.SIGNAL_QUEUE_WORKERS,
+                self.config.SIGNAL_QUEUE_OVERFLOW,
+            )
 
     async def _startup(self):
         self._future_registry.clear()
@@ -2393,6 +2523,47 @@ class Sanic(
 
         Sanic._check_uvloop_conflict()
 
+        if self.offloader is None:
+            self.offloader = Offloader(
+                self,
+                threads=self.config.OFFLOAD_THREADS,
+                queue_size=self.config.OFFLOAD_QUEUE_SIZE,
+            )
+
+        if self.config.ADMISSION_MAX_REQUESTS and self.admission is None:
+            self.admission = AdmissionControl(
+                self,
+                max_requests=self.config.ADMISSION_MAX_REQUESTS,
+                queue_size=self.config.ADMISSION_QUEUE_SIZE,
+                queue_timeout=self.config.ADMISSION_QUEUE_TIMEOUT,
+                retry_after=self.config.ADMISSION_RETRY_AFTER,
+                hooks=self._admission_hooks,
+            )
+
+        if self.config.TRACING and self.tracer is None:
+            self.tracer = Tracer(
+                self,
+                self._trace_sinks,
+                slow=self.config.TRACING_SLOW_REQUEST,
+                batch_size=self.config.TRACING_BATCH_SIZE,
+                interval=self.config.TRACING_FLUSH_INTERVAL,
+            )
+
+        if self.config.METRICS and self.metrics is None:
+            if self._metrics_table is None:
+                # Only one process: the table does not need to be shared
+                self._metrics_table = MetricsTable(
+                    rows=1,
+                    routes=self.config.METRICS_MAX_ROUTES,
+                    buckets=self.config.METRICS_BUCKETS,
+                    shared=False,
+                )
+            self.metrics = self._metrics_table.worker(
+                environ.get("SANIC_WORKER_NAME", "Sanic-Main")
+            )
+        if self.signal_router.dispatcher is not None:
+            self.signal_router.dispatcher.metrics = self.metrics
+
         # Startup time optimizations
         if self.state.primary:
             # TODO:
@@ -2444,6 +2615,13 @@ class Sanic(
         reverse = concern == "shutdown"
         if loop is None:
             loop = self.loop
+        if event == "server.init.after" and self.config.LOOP_MONITOR:
+            self._loop_monitor = LoopMonitor(
+                self,
+                self.config.LOOP_MONITOR_INTERVAL,
+                self.config.LOOP_MONITOR_THRESHOLD,
+            )
+            self._loop_monitor.start(loop)
         await self.dispatch(
             event,
             fail_not_found=False,
@@ -2454,6 +2632,40 @@ class Sanic(
                 "loop": loop,
             },
         )
+        if event == "server.init.after" and hasattr(self, "multiplexer"):
+            limits = concurrency_limits(self.router.routes)
+            if limits:
+                self.add_task(
+                    report_limits(self.multiplexer, limits),
+                    name="ReportConcurrencyLimits",
+                )
+        if (
+            event == "server.shutdown.before"
+            and self._loop_monitor is not None
+        ):
+            self._loop_monitor.stop()
+            self._loop_monitor = None
+        if event == "server.shutdown.after":
+            await self._shutdown_services()
+
+    async def _shutdown_services(self) -> None:
+        """Stop the services of the worker once the server has stopped.
+
+        The signal queue is drained first, since its handlers may offload
+        work, then the offloader and the tracer. They all may still update
+        the metrics, which are released last.
+        """
+        timeout = self.config.GRACEFUL_SHUTDOWN_TIMEOUT
+        if self.signal_router.dispatcher:
+            await self.signal_router.dispatcher.close(timeout)
+            self.signal_router.dispatcher = None
+        if self.offloader is not None:
+            await self.offloader.shutdown(timeout)
+        if self.tracer is not None:
+            await self.tracer.close()
+        if self.metrics is not None:
+            self.metrics.release()
+            self.metrics = None
 
     # -------------------------------------------------------------------- #
     # Process Management
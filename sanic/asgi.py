@@ -9,6 +9,7 @@ from sanic.exceptions import BadRequest, ServerError
 from sanic.helpers import Default
 from sanic.http import Stage
 from sanic.log import error_logger, logger
+from sanic.metrics import BYTES_RECEIVED, BYTES_SENT
 from sanic.models.asgi import ASGIReceive, ASGIScope, ASGISend, MockTransport
 from sanic.request import Request
 from sanic.response import BaseHTTPResponse
@@ -197,6 +198,9 @@ class ASGIApp:
             self.stage = Stage.REQUEST
         message = await self.transport.receive()
         body = message.get("body", b"")
+        metrics = self.sanic_app.metrics
+        if body and metrics is not None:
+            metrics.add(BYTES_RECEIVED, len(body))
         if not message.get("more_body", False):
             self.request_body = False
             if not body:
@@ -239,13 +243,17 @@ class ASGIApp:
             if response_body:
                 data = response_body + data if data else response_body
         self.stage = Stage.IDLE if end_stream else Stage.RESPONSE
+        body = data.encode() if hasattr(data, "encode") else data
         await self.transport.send(
             {
                 "type": "http.response.body",
-                "body": data.encode() if hasattr(data, "encode") else data,
+                "body": body,
                 "more_body": not end_stream,
             }
         )
+        metrics = self.sanic_app.metrics
+        if body and metrics is not None:
+            metrics.add(BYTES_SENT, len(body))
 
     _asgi_single_callable = True  # We conform to ASGI 3.0 single-callable
 
@@ -261,3 +269,5 @@ class ASGIApp:
                 await self.sanic_app.handle_exception(self.request, e)
             except Exception as exc:
                 await self.sanic_app.handle_exception(self.request, exc, False)
+        finally:
+            self.request._close_files()
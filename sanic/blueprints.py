@@ -38,6 +38,7 @@ from sanic.models.handler_types import (
     MiddlewareType,
     RouteHandler,
 )
+from sanic.server.admission import ConcurrencyLimit
 
 
 if TYPE_CHECKING:
@@ -93,10 +94,13 @@ class Blueprint(BaseSanic):
         version (Optional[Union[int, str, float]]): Version number of the API implemented by this blueprint.
         strict_slashes (Optional[bool]): Whether or not the URL should end with a slash.
         version_prefix (str): Prefix for the version. Default is "/v".
+        max_concurrency (Optional[int]): The number of requests that all the routes of the blueprint can handle at once in each worker. Default is no limit.
+        queue (int): The number of requests that can wait for the blueprint when it is at `max_concurrency`. The others get a 503 response. Default is `0`.
     """  # noqa: E501
 
     __slots__ = (
         "_apps",
+        "_concurrency_limit",
         "_future_routes",
         "_future_statics",
         "_future_middleware",
@@ -109,7 +113,9 @@ class Blueprint(BaseSanic):
         "exceptions",
         "host",
         "listeners",
+        "max_concurrency",
         "middlewares",
+        "queue",
         "routes",
         "statics",
         "strict_slashes",
@@ -127,10 +133,13 @@ class Blueprint(BaseSanic):
         version: Optional[Union[int, str, float]] = None,
         strict_slashes: Optional[bool] = None,
         version_prefix: str = "/v",
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
     ):
         super().__init__(name=name)
         self.reset()
         self._allow_route_overwrite = False
+        self._concurrency_limit: Optional[ConcurrencyLimit] = None
         self.copied_from = ""
         self.ctx = SimpleNamespace()
         self.host = host
@@ -142,6 +151,8 @@ class Blueprint(BaseSanic):
         )
         self.version = version
         self.version_prefix = version_prefix
+        self.max_concurrency = max_concurrency
+        self.queue = queue
 
     def __repr__(self) -> str:
         args = ", ".join(
@@ -246,6 +257,7 @@ class Blueprint(BaseSanic):
         new_bp = deepcopy(self)
         new_bp.name = name
         new_bp.copied_from = self.name
+        new_bp._concurrency_limit = None
 
         if not isinstance(url_prefix, Default):
             new_bp.url_prefix = url_prefix
@@ -363,6 +375,12 @@ class Blueprint(BaseSanic):
         listeners = defaultdict(list)
         registered = set()
 
+        # The routes of the blueprint share its concurrency limit
+        if self.max_concurrency and self._concurrency_limit is None:
+            self._concurrency_limit = ConcurrencyLimit(
+                self.max_concurrency, self.queue, name=self.name
+            )
+
         # Routes
         for future in self._future_routes:
             # Prepend the blueprint URI prefix if available
@@ -413,6 +431,10 @@ class Blueprint(BaseSanic):
                 version_prefix,
                 route_error_format,
                 future.route_context,
+                future.cache,
+                future.offload,
+                future.max_concurrency,
+                future.queue,
             )
 
             if (self, apply_route) in app._future_registry:
@@ -425,6 +447,10 @@ class Blueprint(BaseSanic):
 
             # If it is a copied BP, then make sure all of the names of routes
             # matchup with the new BP name
+            if self._concurrency_limit is not None:
+                for r in route:
+                    r.extra.blueprint_limit = self._concurrency_limit
+
             if self.copied_from:
                 for r in route:
                     r.name = r.name.replace(self.copied_from, self.name)
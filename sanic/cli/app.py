@@ -238,6 +238,7 @@ Or, a path to a directory to run as a simple HTTP server:
             "workers": self.args.workers,
             "auto_tls": self.args.auto_tls,
             "single_process": self.args.single,
+            "loop_monitor": self.args.loop_monitor,
         }
 
         for maybe_arg in ("auto_reload", "dev"):
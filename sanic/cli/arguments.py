@@ -305,3 +305,9 @@ class OutputGroup(Group):
             dest="noisy_exceptions",
             help="Output stack traces for all exceptions",
         )
+        self.add_bool_arguments(
+            "--loop-monitor",
+            dest="loop_monitor",
+            nullable=True,
+            help="Log the stack of handlers that block the event loop",
+        )
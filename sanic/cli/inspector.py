@@ -88,6 +88,23 @@ def make_inspector_parser(parser: ArgumentParser) -> None:
         help="Number of workers requested",
     )
 
+    profile = subparsers.add_parser(
+        "profile",
+        help="Profile a worker, and output its collapsed stacks",
+        formatter_class=SanicHelpFormatter,
+    )
+    profile.add_argument(
+        "--seconds",
+        type=float,
+        default=10,
+        help="How long to profile for [default 10]",
+    )
+    profile.add_argument(
+        "--worker",
+        default="0",
+        help="The index or the name of a server worker [default 0]",
+    )
+
     custom = subparsers.add_parser(
         "<custom>",
         help="Run a custom command",
@@ -9,10 +9,11 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Sequence, Union
 from warnings import filterwarnings
 
-from sanic.constants import LocalCertCreator
+from sanic.constants import LocalCertCreator, SignalOverflow
 from sanic.errorpages import DEFAULT_FORMAT, check_error_format
+from sanic.exceptions import SanicException
 from sanic.helpers import Default, _default
-from sanic.http import Http
+from sanic.http import HTTP1_PARSERS, Http
 from sanic.log import error_logger
 from sanic.utils import load_module_from_file_location, str_to_bool
 
@@ -37,13 +38,30 @@ SANIC_PREFIX = "SANIC_"
 DEFAULT_CONFIG = {
     "_FALLBACK_ERROR_FORMAT": _default,
     "ACCESS_LOG": False,
+    "ADMISSION_MAX_REQUESTS": 0,
+    "ADMISSION_QUEUE_SIZE": 0,
+    "ADMISSION_QUEUE_TIMEOUT": 1.0,
+    "ADMISSION_RETRY_AFTER": 1,
     "AUTO_EXTEND": True,
     "AUTO_RELOAD": False,
+    "COMPRESSION": False,
+    "COMPRESSION_ENCODINGS": ("br", "zstd", "gzip", "deflate"),
+    "COMPRESSION_MIN_SIZE": 500,
+    "COMPRESSION_TYPES": (
+        "text/",
+        "application/javascript",
+        "application/json",
+        "application/xml",
+        "image/svg+xml",
+        "+json",
+        "+xml",
+    ),
     "EVENT_AUTOREGISTER": False,
     "DEPRECATION_FILTER": "once",
     "FORWARDED_FOR_HEADER": "X-Forwarded-For",
     "FORWARDED_SECRET": None,
     "GRACEFUL_SHUTDOWN_TIMEOUT": 15.0,
+    "HTTP1_PARSER": "python",
     "INSPECTOR": False,
     "INSPECTOR_HOST": "localhost",
     "INSPECTOR_PORT": 6457,
@@ -56,20 +74,50 @@ DEFAULT_CONFIG = {
     "LOCAL_TLS_KEY": _default,
     "LOCAL_TLS_CERT": _default,
     "LOCALHOST": "localhost",
+    "LOOP_MONITOR": False,
+    "LOOP_MONITOR_INTERVAL": 0.1,
+    "LOOP_MONITOR_THRESHOLD": 0.5,
+    "METRICS": False,
+    "METRICS_BUCKETS": (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    ),
+    "METRICS_MAX_ROUTES": 256,
     "MOTD": True,
     "MOTD_DISPLAY": {},
     "NO_COLOR": False,
     "NOISY_EXCEPTIONS": False,
+    "OFFLOAD_QUEUE_SIZE": 0,
+    "OFFLOAD_SYNC_HANDLERS": False,
+    "OFFLOAD_THREADS": 0,
     "PROXIES_COUNT": None,
     "REAL_IP_HEADER": None,
+    "REQUEST_BODY_SPOOL_THRESHOLD": None,
     "REQUEST_BUFFER_SIZE": 65536,
+    "REQUEST_FILE_SPOOL_THRESHOLD": 2**20,  # 1 MiB
     "REQUEST_MAX_HEADER_SIZE": 8192,  # Cannot exceed 16384
     "REQUEST_ID_HEADER": "X-Request-ID",
     "REQUEST_MAX_SIZE": 100_000_000,
     "REQUEST_TIMEOUT": 60,
     "RESPONSE_TIMEOUT": 60,
+    "SIGNAL_QUEUE_OVERFLOW": SignalOverflow.BLOCK,
+    "SIGNAL_QUEUE_SIZE": 0,
+    "SIGNAL_QUEUE_WORKERS": 4,
     "TLS_CERT_PASSWORD": "",
     "TOUCHUP": _default,
+    "TRACING": False,
+    "TRACING_BATCH_SIZE": 100,
+    "TRACING_FLUSH_INTERVAL": 1.0,
+    "TRACING_SLOW_REQUEST": 1.0,
     "USE_UVLOOP": _default,
     "WEBSOCKET_MAX_SIZE": 2**20,  # 1 MiB
     "WEBSOCKET_PING_INTERVAL": 20,
@@ -96,13 +144,22 @@ class Config(dict, metaclass=DescriptorMeta):
     """
 
     ACCESS_LOG: bool
+    ADMISSION_MAX_REQUESTS: int
+    ADMISSION_QUEUE_SIZE: int
+    ADMISSION_QUEUE_TIMEOUT: float
+    ADMISSION_RETRY_AFTER: int
     AUTO_EXTEND: bool
     AUTO_RELOAD: bool
+    COMPRESSION: bool
+    COMPRESSION_ENCODINGS: Sequence[str]
+    COMPRESSION_MIN_SIZE: int
+    COMPRESSION_TYPES: Sequence[str]
     EVENT_AUTOREGISTER: bool
     DEPRECATION_FILTER: FilterWarningType
     FORWARDED_FOR_HEADER: str
     FORWARDED_SECRET: Optional[str]
     GRACEFUL_SHUTDOWN_TIMEOUT: float
+    HTTP1_PARSER: str
     INSPECTOR: bool
     INSPECTOR_HOST: str
     INSPECTOR_PORT: int
@@ -115,21 +172,39 @@ class Config(dict, metaclass=DescriptorMeta):
     LOCAL_TLS_KEY: Union[Path, str, Default]
     LOCAL_TLS_CERT: Union[Path, str, Default]
     LOCALHOST: str
+    LOOP_MONITOR: bool
+    LOOP_MONITOR_INTERVAL: float
+    LOOP_MONITOR_THRESHOLD: float
+    METRICS: bool
+    METRICS_BUCKETS: Sequence[float]
+    METRICS_MAX_ROUTES: int
     MOTD: bool
     MOTD_DISPLAY: Dict[str, str]
     NO_COLOR: bool
     NOISY_EXCEPTIONS: bool
+    OFFLOAD_QUEUE_SIZE: int
+    OFFLOAD_SYNC_HANDLERS: bool
+    OFFLOAD_THREADS: int
     PROXIES_COUNT: Optional[int]
     REAL_IP_HEADER: Optional[str]
+    REQUEST_BODY_SPOOL_THRESHOLD: Optional[int]
     REQUEST_BUFFER_SIZE: int
+    REQUEST_FILE_SPOOL_THRESHOLD: Optional[int]
     REQUEST_MAX_HEADER_SIZE: int
     REQUEST_ID_HEADER: str
     REQUEST_MAX_SIZE: int
     REQUEST_TIMEOUT: int
     RESPONSE_TIMEOUT: int
     SERVER_NAME: str
+    SIGNAL_QUEUE_OVERFLOW: Union[str, SignalOverflow]
+    SIGNAL_QUEUE_SIZE: int
+    SIGNAL_QUEUE_WORKERS: int
     TLS_CERT_PASSWORD: str
     TOUCHUP: Union[Default, bool]
+    TRACING: bool
+    TRACING_BATCH_SIZE: int
+    TRACING_FLUSH_INTERVAL: float
+    TRACING_SLOW_REQUEST: float
     USE_UVLOOP: Union[Default, bool]
     WEBSOCKET_MAX_SIZE: int
     WEBSOCKET_PING_INTERVAL: int
@@ -242,8 +317,36 @@ class Config(dict, metaclass=DescriptorMeta):
             self.LOCAL_CERT_CREATOR = LocalCertCreator[
                 self.LOCAL_CERT_CREATOR.upper()
             ]
+        elif attr == "SIGNAL_QUEUE_OVERFLOW" and not isinstance(
+            self.SIGNAL_QUEUE_OVERFLOW, SignalOverflow
+        ):
+            self.SIGNAL_QUEUE_OVERFLOW = SignalOverflow[
+                self.SIGNAL_QUEUE_OVERFLOW.upper()
+            ]
+        elif attr in (
+            "COMPRESSION_ENCODINGS",
+            "COMPRESSION_TYPES",
+        ) and isinstance(value, str):
+            self[attr] = tuple(
+                item.strip().lower()
+                for item in value.split(",")
+                if item.strip()
+            )
+        elif attr == "METRICS_BUCKETS" and isinstance(value, str):
+            self[attr] = tuple(
+                sorted(
+                    float(item.strip())
+                    for item in value.split(",")
+                    if item.strip()
+                )
+            )
         elif attr == "DEPRECATION_FILTER":
             self._configure_warnings()
+        elif attr == "HTTP1_PARSER" and value not in HTTP1_PARSERS:
+            options = ", ".join(HTTP1_PARSERS)
+            raise SanicException(
+                f"Unknown HTTP1_PARSER '{value}'. Choose from: {options}"
+            )
 
     @property
     def FALLBACK_ERROR_FORMAT(self) -> str:
@@ -23,6 +23,14 @@ class LocalCertCreator(UpperStrEnum):
     MKCERT = auto()
 
 
+class SignalOverflow(UpperStrEnum):
+    """What to do with a background signal when the signal queue is full."""
+
+    BLOCK = auto()
+    DROP = auto()
+    COUNT = auto()
+
+
 HTTP_METHODS = tuple(HTTPMethod.__members__.values())
 SAFE_HTTP_METHODS = (HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS)
 IDEMPOTENT_HTTP_METHODS = (
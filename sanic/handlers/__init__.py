@@ -1,10 +1,13 @@
-from .content_range import ContentRangeHandler
+from .content_range import ContentRangeHandler, ContentStats
 from .directory import DirectoryHandler
 from .error import ErrorHandler
+from .static_cache import StaticFileCache
 
 
 __all__ = (
     "ContentRangeHandler",
+    "ContentStats",
     "DirectoryHandler",
     "ErrorHandler",
+    "StaticFileCache",
 )
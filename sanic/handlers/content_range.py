@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import os
 
-from typing import TYPE_CHECKING
+from email.utils import parsedate_to_datetime
+from secrets import token_hex
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple, Union
 
 from sanic.exceptions import (
     HeaderNotFound,
@@ -16,61 +18,244 @@ if TYPE_CHECKING:
     from sanic import Request
 
 
+class ContentStats(NamedTuple):
+    """The stats of content that is not a file, for `ContentRangeHandler`.
+
+    Args:
+        st_size (int): The size of the content, in bytes.
+        st_mtime (Optional[float], optional): When the content was last
+            modified, as a timestamp. Defaults to `None`.
+    """
+
+    st_size: int
+    st_mtime: Optional[float] = None
+
+
 class ContentRangeHandler(Range):
     """Parse and process the incoming request headers to extract the content range information.
 
+    Any number of ranges may be requested, as in `bytes=0-99,200-299`.
+    Ranges that overlap, or that are separated by less than `coalesce`
+    bytes, are merged. Ranges that start beyond the end of the file are
+    left out. When more than one range remains, the response is sent as
+    `multipart/byteranges`, see `multipart`.
+
+    When the request has an `If-Range` header that does not match the
+    current representation, or when the `Range` header is not valid, as
+    in `bytes=5-1`, the range is ignored and `HeaderNotFound` is raised,
+    so that the whole file is sent. `RangeNotSatisfiable` is only raised
+    when none of the valid ranges can be satisfied.
+
     Args:
         request (Request): The incoming request object.
-        stats (os.stat_result): The stats of the file being served.
+        stats (Union[os.stat_result, ContentStats]): The stats of the file
+            or content being served.
+        etag (Optional[str], optional): The ETag of the file, to validate
+            `If-Range` against. Without it, only a date can match.
+            Defaults to `None`.
+        max_ranges (int, optional): The number of ranges allowed in one
+            request. Defaults to `16`.
+        coalesce (int, optional): The largest gap between two ranges that
+            are merged into one. Defaults to `80`.
     """  # noqa: E501
 
-    __slots__ = ("start", "end", "size", "total", "headers")
+    __slots__ = (
+        "start",
+        "end",
+        "size",
+        "total",
+        "headers",
+        "ranges",
+        "boundary",
+    )
 
-    def __init__(self, request: Request, stats: os.stat_result) -> None:
+    def __init__(
+        self,
+        request: Request,
+        stats: Union[os.stat_result, ContentStats],
+        etag: Optional[str] = None,
+        max_ranges: int = 16,
+        coalesce: int = 80,
+    ) -> None:
         self.total = stats.st_size
         _range = request.headers.getone("range", None)
         if _range is None:
             raise HeaderNotFound("Range Header Not Found")
+        if_range = request.headers.getone("if-range", None)
+        if if_range is not None and not self._if_range_matches(
+            if_range.strip(), stats, etag
+        ):
+            raise HeaderNotFound("If-Range does not match")
         unit, _, value = tuple(map(str.strip, _range.partition("=")))
         if unit != "bytes":
             raise InvalidRangeType(
                 "%s is not a valid Range Type" % (unit,), self
             )
-        start_b, _, end_b = tuple(map(str.strip, value.partition("-")))
+        specs = [spec.strip() for spec in value.split(",") if spec.strip()]
+        if not specs:
+            raise HeaderNotFound("Invalid for Content Range parameters")
+        if len(specs) > max_ranges:
+            raise RangeNotSatisfiable("Too many ranges requested", self)
+
+        # Every range is parsed first, since a header with an invalid
+        # range is ignored as a whole
+        parsed = [self._parse(spec) for spec in specs]
+        ranges = [r for r in map(self._satisfiable, parsed) if r is not None]
+        if not ranges:
+            raise RangeNotSatisfiable(
+                "Invalid for Content Range parameters", self
+            )
+        self.ranges = self._coalesce(ranges, coalesce)
+        self.start = self.ranges[0][0]
+        self.end = self.ranges[-1][1]
+        self.size = sum(end - start + 1 for start, end in self.ranges)
+        if self.multipart:
+            self.boundary: Optional[str] = token_hex(16)
+            self.headers = {}
+        else:
+            self.boundary = None
+            self.headers = {
+                "Content-Range": "bytes %s-%s/%s"
+                % (self.start, self.end, self.total)
+            }
+
+    def __bool__(self):
+        return hasattr(self, "size") and self.size > 0
+
+    @property
+    def multipart(self) -> bool:
+        """Whether the response has more than one part.
+
+        Returns:
+            bool: `True` if the ranges must be sent as
+                `multipart/byteranges`.
+        """
+        return len(self.ranges) > 1
+
+    @property
+    def content_type(self) -> str:
+        """The content type of a `multipart/byteranges` response.
+
+        Returns:
+            str: The content type, with the boundary.
+        """
+        return f"multipart/byteranges; boundary={self.boundary}"
+
+    @property
+    def multipart_end(self) -> bytes:
+        """The delimiter that ends a `multipart/byteranges` body.
+
+        Returns:
+            bytes: The closing delimiter.
+        """
+        return f"\r\n--{self.boundary}--\r\n".encode()
+
+    def parts(self, content_type: str) -> List[Tuple[bytes, int, int]]:
+        """The parts of a `multipart/byteranges` body.
+
+        Args:
+            content_type (str): The content type of the file.
+
+        Returns:
+            List[Tuple[bytes, int, int]]: The headers of each part,
+                followed by the offset and the size of its range.
+        """
+        parts: List[Tuple[bytes, int, int]] = []
+        for start, end in self.ranges:
+            header = (
+                f"--{self.boundary}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Range: bytes {start}-{end}/{self.total}\r\n\r\n"
+            ).encode()
+            # Every part but the first starts on a new line
+            if parts:
+                header = b"\r\n" + header
+            parts.append((header, start, end - start + 1))
+        return parts
+
+    def multipart_size(self, content_type: str) -> int:
+        """The length of a `multipart/byteranges` body.
+
+        Args:
+            content_type (str): The content type of the file.
+
+        Returns:
+            int: The number of bytes in the body.
+        """
+        return sum(
+            len(header) + size for header, _, size in self.parts(content_type)
+        ) + len(self.multipart_end)
+
+    @staticmethod
+    def _parse(spec: str) -> Tuple[Optional[int], Optional[int]]:
+        start_b, _, end_b = tuple(map(str.strip, spec.partition("-")))
         try:
-            self.start = int(start_b) if start_b else None
+            start = int(start_b) if start_b else None
         except ValueError:
-            raise RangeNotSatisfiable(
-                "'%s' is invalid for Content Range" % (start_b,), self
+            raise HeaderNotFound(
+                "'%s' is invalid for Content Range" % (start_b,)
             )
         try:
-            self.end = int(end_b) if end_b else None
+            end = int(end_b) if end_b else None
         except ValueError:
-            raise RangeNotSatisfiable(
-                "'%s' is invalid for Content Range" % (end_b,), self
+            raise HeaderNotFound(
+                "'%s' is invalid for Content Range" % (end_b,)
             )
-        if self.end is None:
-            if self.start is None:
-                raise RangeNotSatisfiable(
-                    "Invalid for Content Range parameters", self
-                )
+        if end is None:
+            if start is None:
+                raise HeaderNotFound("Invalid for Content Range parameters")
+        elif end < 0 or (start is not None and start > end):
+            raise HeaderNotFound("Invalid for Content Range parameters")
+        return start, end
+
+    def _satisfiable(
+        self, spec: Tuple[Optional[int], Optional[int]]
+    ) -> Optional[Tuple[int, int]]:
+        start, end = spec
+        if start is None:
+            # this case represents `Content-Range: bytes -5`
+            if not end:
+                return None
+            start = max(self.total - end, 0)
+            end = self.total - 1
+        elif end is None:
+            # this case represents `Content-Range: bytes 5-`
+            end = self.total - 1
+        if start >= self.total:
+            return None
+        return start, min(end, self.total - 1)
+
+    @staticmethod
+    def _coalesce(
+        ranges: List[Tuple[int, int]], gap: int
+    ) -> List[Tuple[int, int]]:
+        if len(ranges) == 1:
+            return ranges
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1 + gap:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
             else:
-                # this case represents `Content-Range: bytes 5-`
-                self.end = self.total - 1
-        else:
-            if self.start is None:
-                # this case represents `Content-Range: bytes -5`
-                self.start = self.total - self.end
-                self.end = self.total - 1
-        if self.start > self.end:
-            raise RangeNotSatisfiable(
-                "Invalid for Content Range parameters", self
-            )
-        self.size = self.end - self.start + 1
-        self.headers = {
-            "Content-Range": "bytes %s-%s/%s"
-            % (self.start, self.end, self.total)
-        }
+                merged.append((start, end))
+        return merged
 
-    def __bool__(self):
-        return hasattr(self, "size") and self.size > 0
+    @staticmethod
+    def _if_range_matches(
+        if_range: str,
+        stats: Union[os.stat_result, ContentStats],
+        etag: Optional[str],
+    ) -> bool:
+        if if_range.startswith(("W/", '"')):
+            # Only a strong ETag may match
+            return (
+                etag is not None
+                and not etag.startswith("W/")
+                and if_range == etag
+            )
+        try:
+            date = parsedate_to_datetime(if_range)
+        except (TypeError, ValueError):
+            return False
+        if stats.st_mtime is None:
+            return False
+        return int(date.timestamp()) == int(stats.st_mtime)
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import os
+
+from collections import OrderedDict
+from email.utils import formatdate
+from stat import S_ISREG
+from time import monotonic as current_time
+from typing import Optional, Union
+
+from sanic.compat import open_async
+
+
+class CachedFile:
+    """A static file held in memory.
+
+    Args:
+        path (str): Location of the file.
+        stats (os.stat_result): The stats of the file when it was read.
+        body (bytes): The content of the file.
+
+    The content type is the one guessed from the path of the file, as a
+    route may set its own.
+    """
+
+    __slots__ = (
+        "path",
+        "stats",
+        "body",
+        "etag",
+        "last_modified",
+        "content_type",
+        "checked",
+    )
+
+    def __init__(self, path: str, stats: os.stat_result, body: bytes):
+        self.path = path
+        self.stats = stats
+        self.body = body
+        self.etag = f'"{stats.st_mtime_ns:x}-{stats.st_size:x}"'
+        self.last_modified = formatdate(stats.st_mtime, usegmt=True)
+        self.content_type: Optional[str] = None
+        self.checked = current_time()
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+    def same_file(self, stats: os.stat_result) -> bool:
+        """Check whether the file is unchanged.
+
+        Args:
+            stats (os.stat_result): The current stats of the file.
+
+        Returns:
+            bool: `True` if the stats match the ones of the cached content.
+        """
+        return (
+            stats.st_mtime_ns == self.stats.st_mtime_ns
+            and stats.st_size == self.stats.st_size
+            and stats.st_ino == self.stats.st_ino
+        )
+
+    def matches(self, if_none_match: str) -> bool:
+        """Check an If-None-Match header value against the ETag.
+
+        Uses the weak comparison, as required for If-None-Match.
+
+        Args:
+            if_none_match (str): The header value.
+
+        Returns:
+            bool: `True` if the client already has this content.
+        """
+        if if_none_match.strip() == "*":
+            return True
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag == self.etag:
+                return True
+        return False
+
+
+class StaticFileCache:
+    """A per-worker LRU cache of small static files.
+
+    Files are kept in memory with their stats and the headers derived from
+    them, so that requests for them do not need to touch the filesystem.
+    Once an entry is older than `ttl` seconds it is revalidated with a
+    stat on the next request, and read again only if the file changed.
+
+    Args:
+        max_size (int, optional): The total size of the cached content,
+            in bytes. Defaults to `64 MiB`.
+        max_file_size (int, optional): Larger files are not cached.
+            Defaults to `1 MiB`.
+        ttl (float, optional): Seconds before a cached file is checked for
+            changes. Defaults to `2.0`.
+
+    Examples:
+        ```python
+        app.static("/static", "./static", cache=StaticFileCache(ttl=10))
+        ```
+    """
+
+    __slots__ = ("max_size", "max_file_size", "ttl", "size", "_entries")
+
+    def __init__(
+        self,
+        max_size: int = 64 * 1024 * 1024,
+        max_file_size: int = 1024 * 1024,
+        ttl: float = 2.0,
+    ) -> None:
+        self.max_size = max_size
+        self.max_file_size = min(max_file_size, max_size)
+        self.ttl = ttl
+        self.size = 0
+        self._entries: OrderedDict[str, CachedFile] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: Union[os.PathLike, str]) -> bool:
+        return str(path) in self._entries
+
+    def get(self, path: Union[os.PathLike, str]) -> Optional[CachedFile]:
+        """Get a cached file that does not need to be revalidated yet.
+
+        Args:
+            path (Union[os.PathLike, str]): Location of the file.
+
+        Returns:
+            Optional[CachedFile]: The cached file, if it is still fresh.
+        """
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is None or current_time() - entry.checked > self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    async def load(
+        self, path: Union[os.PathLike, str], stats: os.stat_result
+    ) -> Optional[CachedFile]:
+        """Revalidate a cached file, or read a file into the cache.
+
+        Args:
+            path (Union[os.PathLike, str]): Location of the file.
+            stats (os.stat_result): The current stats of the file.
+
+        Returns:
+            Optional[CachedFile]: The cached file, or `None` if the file
+                cannot be cached.
+        """
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.same_file(stats):
+                entry.checked = current_time()
+                self._entries.move_to_end(key)
+                return entry
+            self.discard(key)
+        if not S_ISREG(stats.st_mode) or stats.st_size > self.max_file_size:
+            return None
+        async with await open_async(key, mode="rb") as f:
+            body = await f.read()
+        if len(body) != stats.st_size:
+            # Changed while it was being read
+            return None
+        entry = CachedFile(key, stats, body)
+        self._entries[key] = entry
+        self.size += len(entry)
+        while self.size > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+        return entry
+
+    def discard(self, path: Union[os.PathLike, str]) -> None:
+        """Remove a file from the cache.
+
+        Args:
+            path (Union[os.PathLike, str]): Location of the file.
+        """
+        entry = self._entries.pop(str(path), None)
+        if entry is not None:
+            self.size -= len(entry)
+
+    def clear(self) -> None:
+        """Remove all files from the cache."""
+        self._entries.clear()
+        self.size = 0
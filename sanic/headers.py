@@ -5,6 +5,7 @@ import re
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 from urllib.parse import unquote
 
+from sanic.compat import Header
 from sanic.exceptions import InvalidHeader
 from sanic.helpers import STATUS_CODES
 
@@ -327,6 +328,40 @@ def parse_accept(accept: Optional[str]) -> AcceptList:
         raise InvalidHeader(f"Invalid header value in Accept: {accept}")
 
 
+def parse_accept_encoding(value: Optional[str]) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into the quality of each coding.
+
+    https://datatracker.ietf.org/doc/html/rfc9110#section-12.5.3
+
+    E.g. `gzip, br;q=0.8, *;q=0` to {'gzip': 1.0, 'br': 0.8, '*': 0.0}
+
+    Codings with an invalid quality value are ignored.
+
+    Args:
+        value (Optional[str]): The header value to parse.
+
+    Returns:
+        Dict[str, float]: The quality of each coding, by lowercase name.
+    """
+    codings: Dict[str, float] = {}
+    if not value:
+        return codings
+    for item in value.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, q = params.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(q)
+            except ValueError:
+                continue
+        codings[coding] = quality
+    return codings
+
+
 def parse_content_header(value: str) -> Tuple[str, Options]:
     """Parse content-type and content-disposition header values.
 
@@ -529,6 +564,34 @@ def format_http1_response(status: int, headers: HeaderBytesIterable) -> bytes:
     return ret
 
 
+def parse_http1_headers(head: bytes) -> Header:
+    """Parse the header fields of a raw HTTP/1.1 request head.
+
+    The request line is skipped. The head is expected to have been validated
+    by the HTTP/1.1 protocol handler, so every line contains a colon.
+
+    Args:
+        head (bytes): The request head without the terminating blank line.
+
+    Returns:
+        Header: The request headers, with lowercase names.
+    """
+    _, _, block = head.partition(b"\r\n")
+    if not block:
+        return Header()
+    return Header(
+        [
+            (name.lower(), value.lstrip())
+            for name, value in (
+                line.split(":", 1)
+                for line in block.decode(errors="surrogateescape").split(
+                    "\r\n"
+                )
+            )
+        ]
+    )
+
+
 def parse_credentials(
     header: Optional[str],
     prefixes: Optional[Union[List, Tuple, Set]] = None,
@@ -1,6 +1,6 @@
 from .constants import Stage
-from .http1 import Http
+from .http1 import HTTP1_PARSERS, Http, HttptoolsHttp
 from .http3 import Http3
 
 
-__all__ = ("Http", "Stage", "Http3")
+__all__ = ("Http", "HttptoolsHttp", "HTTP1_PARSERS", "Stage", "Http3")
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 
 if TYPE_CHECKING:
     from sanic.request import Request
     from sanic.response import BaseHTTPResponse
 
-from asyncio import CancelledError, sleep
+import re
+
+from asyncio import (
+    CancelledError,
+    SendfileNotAvailableError,
+    sleep,
+)
 from time import perf_counter
 
+from httptools import HttpParserUpgrade, HttpRequestParser
+from httptools.parser.errors import HttpParserInvalidURLError
+
 from sanic.compat import Header
 from sanic.exceptions import (
     BadRequest,
@@ -24,11 +33,30 @@ from sanic.helpers import has_message_body
 from sanic.http.constants import Stage
 from sanic.http.stream import Stream
 from sanic.log import access_logger, error_logger, logger
+from sanic.metrics import KEEP_ALIVE_REQUESTS
+from sanic.server.admission import RequestShed
 from sanic.touchup import TouchUpMeta
+from sanic.tracing import HEAD, SEND, SERIALIZATION, RequestTrace
 
 
 HTTP_CONTINUE = b"HTTP/1.1 100 Continue\r\n\r\n"
 
+# Every header line must have a name followed by a colon
+HEADER_BLOCK = re.compile(r"[^:\r\n]+:[^\r\n]*(?:\r\n[^:\r\n]+:[^\r\n]*)*")
+# Header fields that the protocol handler needs to look at
+PROTOCOL_FIELDS = (
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "upgrade",
+    "expect",
+    "host",
+)
+PROTOCOL_HEADERS = re.compile(
+    rf"^({'|'.join(PROTOCOL_FIELDS)}):[ \t]*([^\r\n]*)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 class Http(Stream, metaclass=TouchUpMeta):
     """ "Internal helper for managing the HTTP/1.1 request/response cycle.
@@ -45,10 +73,13 @@ class Http(Stream, metaclass=TouchUpMeta):
 
     HEADER_CEILING = 16_384
     HEADER_MAX_SIZE = 0
+    VECTORED_WRITE_SIZE = 16_384
+    SENDFILE_CHUNK_SIZE = 65_536
     __touchup__ = (
         "http1_request_header",
         "http1_response_header",
         "read",
+        "readinto",
     )
     __slots__ = [
         "_send",
@@ -104,6 +135,10 @@ class Http(Stream, metaclass=TouchUpMeta):
 
     async def http1(self):
         """HTTP 1.1 connection handler"""
+        metrics = self.protocol._metrics
+        tracer = self.protocol.app.tracer
+        admission = self.protocol.app.admission
+        reused = False
         # Handle requests while the connection stays reusable
         while self.keep_alive and self.stage is Stage.IDLE:
             self.init_for_request()
@@ -111,12 +146,24 @@ class Http(Stream, metaclass=TouchUpMeta):
             if not self.recv_buffer:
                 await self._receive_more()
             self.stage = Stage.REQUEST
+            received = perf_counter() if tracer is not None else 0.0
+            admitted = False
             try:
                 # Receive and handle a request
                 self.response_func = self.http1_response_header
 
                 await self.http1_request_header()
 
+                if tracer is not None:
+                    self.request.trace = RequestTrace(received)
+                    self.request.trace.end(HEAD)
+                if admission is not None:
+                    admitted = await admission.acquire(self.request)
+                    if not admitted:
+                        raise RequestShed
+                if reused and metrics is not None:
+                    metrics.add(KEEP_ALIVE_REQUESTS)
+                reused = True
                 self.stage = Stage.HANDLER
                 self.perft0 = perf_counter()
                 self.request.conn_info = self.protocol.conn_info
@@ -144,9 +191,19 @@ class Http(Stream, metaclass=TouchUpMeta):
                 self.exception = None
                 self.keep_alive = False
                 await self.error_response(e)
+            except RequestShed:
+                # The connection is only kept when there is no body to skip
+                if self.request_body:
+                    self.keep_alive = False
+                    self.request_body = None
+                await self._send(admission.response(self.keep_alive))
+                self.stage = Stage.IDLE
             except Exception as e:
                 # Write an error response
                 await self.error_response(e)
+            finally:
+                if admitted:
+                    admission.release()
 
             # Try to consume any remaining request body
             if self.request_body:
@@ -169,6 +226,7 @@ class Http(Stream, metaclass=TouchUpMeta):
 
             # Clean up to free memory and for the next request
             if self.request:
+                self.request._close_files()
                 self.request.stream = None
                 if self.response:
                     self.response.stream = None
@@ -193,45 +251,17 @@ class Http(Stream, metaclass=TouchUpMeta):
         if pos >= self.HEADER_MAX_SIZE:
             raise PayloadTooLarge("Request header exceeds the size limit")
 
-        # Parse header content
-        try:
-            head = buf[:pos]
-            raw_headers = head.decode(errors="surrogateescape")
-            reqline, *split_headers = raw_headers.split("\r\n")
-            method, self.url, protocol = reqline.split(" ")
-
-            await self.dispatch(
-                "http.lifecycle.read_head",
-                inline=True,
-                context={"head": bytes(head)},
-            )
-
-            if protocol == "HTTP/1.1":
-                self.keep_alive = True
-            elif protocol == "HTTP/1.0":
-                self.keep_alive = False
-            else:
-                raise Exception  # Raise a Bad Request on try-except
-
-            self.head_only = method.upper() == "HEAD"
-            request_body = False
-            headers = []
-
-            for name, value in (h.split(":", 1) for h in split_headers):
-                name, value = h = name.lower(), value.lstrip()
-
-                if name in ("content-length", "transfer-encoding"):
-                    request_body = True
-                elif name == "connection":
-                    self.keep_alive = value.lower() == "keep-alive"
-
-                headers.append(h)
-        except Exception:
-            raise BadRequest("Bad Request")
+        head = bytes(buf[:pos])
+        await self.dispatch(
+            "http.lifecycle.read_head",
+            inline=True,
+            context={"head": head},
+        )
+        method, version, headers, fields = self._tokenize_head(head)
 
-        headers_instance = Header(headers)
+        self.head_only = method.upper() == "HEAD"
         self.upgrade_websocket = (
-            headers_instance.getone("upgrade", "").lower() == "websocket"
+            fields.get("upgrade", "").lower() == "websocket"
         )
 
         try:
@@ -242,13 +272,14 @@ class Http(Stream, metaclass=TouchUpMeta):
         # Prepare a Request object
         request = self.protocol.request_class(
             url_bytes=url_bytes,
-            headers=headers_instance,
-            head=bytes(head),
-            version=protocol[5:],
+            headers=headers,
+            head=head,
+            version=version,
             method=method,
             transport=self.protocol.transport,
             app=self.protocol.app,
         )
+        request._host_header = fields.get("host")
         self.protocol.request_class._current.set(request)
         await self.dispatch(
             "http.lifecycle.request",
@@ -258,9 +289,8 @@ class Http(Stream, metaclass=TouchUpMeta):
 
         # Prepare for request body
         self.request_bytes_left = self.request_bytes = 0
-        if request_body:
-            headers = request.headers
-            expect = headers.getone("expect", None)
+        if "content-length" in fields or "transfer-encoding" in fields:
+            expect = fields.get("expect")
 
             if expect is not None:
                 if expect.lower() == "100-continue":
@@ -268,13 +298,13 @@ class Http(Stream, metaclass=TouchUpMeta):
                 else:
                     raise ExpectationFailed(f"Unknown Expect: {expect}")
 
-            if headers.getone("transfer-encoding", None) == "chunked":
+            if fields.get("transfer-encoding") == "chunked":
                 self.request_body = "chunked"
                 pos -= 2  # One CRLF stays in buffer
             else:
                 self.request_body = True
                 self.request_bytes_left = self.request_bytes = int(
-                    headers["content-length"]
+                    fields["content-length"]
                 )
 
         # Remove header and its trailing CRLF
@@ -282,11 +312,57 @@ class Http(Stream, metaclass=TouchUpMeta):
         self.request, request.stream = request, self
         self.protocol.state["requests_count"] += 1
 
+    def _tokenize_head(
+        self, head: bytes
+    ) -> Tuple[str, str, Optional[Header], Dict[str, str]]:
+        """Split the request head into its request line and header fields.
+
+        Sets the URL and whether to keep the connection alive.
+
+        Returns:
+            Tuple[str, str, Optional[Header], Dict[str, str]]: The method,
+                the HTTP version, the headers, or `None` to parse them from
+                the head on first access, and the first value of each of
+                the fields that the protocol needs, by lowercase name.
+        """
+        # Only the fields needed by the protocol are extracted here, the
+        # request headers are built on first access.
+        try:
+            raw_headers = head.decode(errors="surrogateescape")
+            reqline, _, header_block = raw_headers.partition("\r\n")
+            method, self.url, protocol = reqline.split(" ")
+
+            if protocol == "HTTP/1.1":
+                self.keep_alive = True
+            elif protocol == "HTTP/1.0":
+                self.keep_alive = False
+            else:
+                raise Exception  # Raise a Bad Request on try-except
+
+            if header_block and not HEADER_BLOCK.fullmatch(header_block):
+                raise Exception  # Raise a Bad Request on try-except
+
+            fields: Dict[str, str] = {}
+
+            for name, value in PROTOCOL_HEADERS.findall(header_block):
+                name = name.lower()
+                if name == "connection":
+                    self.keep_alive = value.lower() == "keep-alive"
+
+                fields.setdefault(name, value)
+        except Exception:
+            raise BadRequest("Bad Request")
+
+        return method, protocol[5:], None, fields
+
     async def http1_response_header(
         self, data: bytes, end_stream: bool
     ) -> None:  # no cov
         """Format response header and send it."""
         res = self.response
+        trace = self.request.trace
+        if trace is not None:
+            trace.begin(SERIALIZATION)
 
         # Compatibility with simple response body
         if not data and getattr(res, "body", None):
@@ -345,8 +421,6 @@ class Http(Stream, metaclass=TouchUpMeta):
         headers["alt-svc"] = ""
 
         ret = format_http1_response(status, res.processed_headers)
-        if data:
-            ret += data
 
         # Send a 100-continue if expected and not Expectation Failed
         if self.expecting_continue:
@@ -358,7 +432,15 @@ class Http(Stream, metaclass=TouchUpMeta):
         if self.protocol.access_log:
             self.log_response()
 
-        await self._send(ret)
+        if trace is not None:
+            trace.end(SERIALIZATION)
+            trace.begin(SEND)
+
+        # Large bodies are written after the header without copying them
+        if len(data) < self.VECTORED_WRITE_SIZE:
+            await self._send(ret + data if data else ret)
+        else:
+            await self._send((ret, data))
         self.stage = Stage.IDLE if end_stream else Stage.RESPONSE
 
     def head_response_ignored(self, data: bytes, end_stream: bool) -> None:
@@ -373,7 +455,18 @@ class Http(Stream, metaclass=TouchUpMeta):
         """Format a part of response body in chunked encoding."""
         # Chunked encoding
         size = len(data)
-        if end_stream:
+        if size >= self.VECTORED_WRITE_SIZE:
+            await self._send(
+                (
+                    b"%x\r\n" % size,
+                    data,
+                    b"\r\n0\r\n\r\n" if end_stream else b"\r\n",
+                )
+            )
+            if end_stream:
+                self.response_func = None
+                self.stage = Stage.IDLE
+        elif end_stream:
             await self._send(
                 b"%x\r\n%b\r\n0\r\n\r\n" % (size, data)
                 if size
@@ -403,6 +496,60 @@ class Http(Stream, metaclass=TouchUpMeta):
             await self._send(data)
         self.response_bytes_left = bytes_left
 
+    async def sendfile(self, location, offset: int, count: int) -> int:
+        """Send part of a response body of known length from a file.
+
+        On plain TCP connections the kernel copies the file directly to the
+        socket, with the event loop's sendfile where it is supported, and
+        otherwise, as with uvloop, with os.sendfile. TLS transports cannot
+        do this, and then nothing is sent.
+
+        Args:
+            location: Path of the file to send.
+            offset (int): Position in the file to start from.
+            count (int): Number of bytes to send.
+
+        Returns:
+            int: Number of bytes sent. The caller is expected to send any
+                remaining bytes with the regular send().
+        """
+        protocol = self.protocol
+        transport = protocol.transport
+        if (
+            self.response_func != self.http1_response_normal
+            or transport is None
+            or transport.get_extra_info("sslcontext") is not None
+        ):
+            return 0
+
+        count = min(count, self.response_bytes_left)
+        file = await protocol.loop.run_in_executor(None, open, location, "rb")
+        sent = 0
+        try:
+            # The event loop's sendfile does not report its progress, so
+            # send in slices small enough that the response timeout keeps
+            # being reset, even for slow clients
+            while sent < count:
+                try:
+                    size = await protocol.sendfile(
+                        file,
+                        offset + sent,
+                        min(count - sent, self.SENDFILE_CHUNK_SIZE),
+                    )
+                except (NotImplementedError, SendfileNotAvailableError):
+                    break
+                if not size:
+                    break
+                sent += size
+        finally:
+            file.close()
+
+        self.response_bytes_left -= sent
+        if not self.response_bytes_left:
+            self.response_func = None
+            self.stage = Stage.IDLE
+        return sent
+
     async def error_response(self, exception: Exception) -> None:
         """Handle response when exception encountered"""
         # Disconnect after an error if in any other state than handler
@@ -491,7 +638,56 @@ class Http(Stream, metaclass=TouchUpMeta):
 
     async def read(self) -> Optional[bytes]:  # no cov
         """Read some bytes of request body."""
+        if not await self._body_ready():
+            return None
 
+        buf = self.recv_buffer
+        data = bytes(buf[: self.request_bytes_left])
+        size = len(data)
+
+        del buf[:size]
+
+        self.request_bytes_left -= size
+
+        await self.dispatch(
+            "http.lifecycle.read_body",
+            inline=True,
+            context={"body": data},
+        )
+
+        return data
+
+    async def readinto(self, buffer: memoryview) -> int:  # no cov
+        """Read some bytes of request body into a writable buffer.
+
+        Unlike read(), no intermediate bytes objects are created. Returns
+        the number of bytes read, which is zero at the end of the body.
+        """
+        if not await self._body_ready():
+            return 0
+
+        buf = self.recv_buffer
+        size = min(len(buf), self.request_bytes_left, len(buffer))
+        with memoryview(buf) as view:
+            buffer[:size] = view[:size]
+
+        del buf[:size]
+
+        self.request_bytes_left -= size
+
+        await self.dispatch(
+            "http.lifecycle.read_body",
+            inline=True,
+            context={"body": bytes(buffer[:size])},
+        )
+
+        return size
+
+    async def _body_ready(self) -> bool:
+        """Wait until request body bytes are available in the buffer.
+
+        Returns False at the end of the body.
+        """
         # Send a 100-continue if needed
         if self.expecting_continue:
             self.expecting_continue = False
@@ -532,7 +728,7 @@ class Http(Stream, metaclass=TouchUpMeta):
                 while len(buf) < pos:
                     await self._receive_more()
                 del buf[:pos]
-                return None
+                return False
 
             # Remove CRLF, chunk size and the CRLF that follows
             del buf[: pos + 2]
@@ -548,26 +744,12 @@ class Http(Stream, metaclass=TouchUpMeta):
         # End of request body?
         if not self.request_bytes_left:
             self.request_body = None
-            return None
+            return False
 
         # At this point we are good to read/return up to request_bytes_left
         if not buf:
             await self._receive_more()
-
-        data = bytes(buf[: self.request_bytes_left])
-        size = len(data)
-
-        del buf[:size]
-
-        self.request_bytes_left -= size
-
-        await self.dispatch(
-            "http.lifecycle.read_body",
-            inline=True,
-            context={"body": data},
-        )
-
-        return data
+        return True
 
     # Response methods
 
@@ -600,3 +782,87 @@ class Http(Stream, metaclass=TouchUpMeta):
             *sizes,
             cls.HEADER_CEILING,
         )
+
+
+class _HeadCollector:
+    """Receives the request line and header callbacks from httptools."""
+
+    __slots__ = ("url", "headers")
+
+    def __init__(self):
+        self.url = b""
+        self.headers = []
+
+    def on_url(self, url: bytes) -> None:
+        self.url += url
+
+    def on_header(self, name: bytes, value: bytes) -> None:
+        self.headers.append(
+            (
+                name.decode(errors="surrogateescape").lower(),
+                value.decode(errors="surrogateescape"),
+            )
+        )
+
+
+class HttptoolsHttp(Http):
+    """HTTP/1.1 handler that parses the request head with httptools.
+
+    The request line and headers are tokenized by the llhttp based parser
+    from httptools instead of being split in Python. Limits, errors and
+    signals are the same as with :class:`Http`. The request body framing
+    (including chunked encoding) is still handled by :meth:`Http.read`
+    because httptools cannot report where a message ends within the data
+    fed to it, which is needed to leave pipelined requests in the buffer.
+
+    Enable it with ``app.config.HTTP1_PARSER = "httptools"``.
+    """
+
+    __slots__ = ()
+
+    def _tokenize_head(
+        self, head: bytes
+    ) -> Tuple[str, str, Optional[Header], Dict[str, str]]:
+        collector = _HeadCollector()
+        parser = HttpRequestParser(collector)
+        try:
+            try:
+                parser.feed_data(head)
+                parser.feed_data(b"\r\n\r\n")
+            except HttpParserUpgrade:
+                # Parser pauses after the head of an upgrade request
+                pass
+            method = parser.get_method().decode()
+            version = parser.get_http_version()
+            self.url = collector.url.decode(errors="surrogateescape")
+
+            if version == "1.1":
+                self.keep_alive = True
+            elif version == "1.0":
+                self.keep_alive = False
+            else:
+                raise Exception  # Raise a Bad Request on try-except
+
+            headers = Header(collector.headers)
+            fields: Dict[str, str] = {}
+
+            for name, value in collector.headers:
+                if name in PROTOCOL_FIELDS:
+                    if name == "connection":
+                        self.keep_alive = value.lower() == "keep-alive"
+
+                    fields.setdefault(name, value)
+        except HttpParserInvalidURLError:
+            if not head.partition(b"\r\n")[0].isascii():
+                raise BadRequest("URL may only contain US-ASCII characters.")
+            raise BadRequest("Bad Request")
+        except Exception:
+            raise BadRequest("Bad Request")
+
+        return method, version, headers, fields
+
+
+HTTP1_PARSERS = {
+    "python": Http,
+    "httptools": HttptoolsHttp,
+}
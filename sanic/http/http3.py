@@ -29,6 +29,7 @@ from sanic.http.constants import Stage
 from sanic.http.stream import Stream
 from sanic.http.tls.context import CertSelector, SanicSSLContext
 from sanic.log import Colors, logger
+from sanic.metrics import BYTES_RECEIVED, BYTES_SENT
 from sanic.models.protocol_types import TransportProtocol
 from sanic.models.server_types import ConnInfo
 
@@ -226,6 +227,8 @@ class HTTPReceiver(Receiver, Stream):
             raise PayloadTooLarge("Request body exceeds the size limit")
 
         self.request.body += data
+        if self.protocol._metrics is not None:
+            self.protocol._metrics.add(BYTES_RECEIVED, len(data))
 
     async def send(self, data: bytes, end_stream: bool) -> None:
         """Send data to client"""
@@ -267,6 +270,8 @@ class HTTPReceiver(Receiver, Stream):
             end_stream=end_stream,
         )
         self.transmit()
+        if self.protocol._metrics is not None:
+            self.protocol._metrics.add(BYTES_SENT, len(data))
 
         if end_stream:
             self.stage = Stage.IDLE
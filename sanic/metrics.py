@@ -0,0 +1,510 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sanic.tracing import STAGES
+from sanic.worker.shared_memory import SharedBlock
+
+
+if TYPE_CHECKING:
+    from sanic.request import Request
+    from sanic.tracing import RequestTrace
+
+
+# The counters of a worker, in the order that they are stored
+REQUESTS = 0
+IN_FLIGHT = 1
+BYTES_RECEIVED = 2
+BYTES_SENT = 3
+CONNECTIONS = 4
+CONNECTIONS_OPEN = 5
+WEBSOCKETS = 6
+WEBSOCKETS_OPEN = 7
+KEEP_ALIVE_REQUESTS = 8
+SLOW_REQUESTS = 9
+OFFLOADED = 10
+OFFLOAD_PENDING = 11
+OFFLOAD_REJECTED = 12
+REQUESTS_QUEUED = 13
+REQUESTS_WAITING = 14
+REQUESTS_SHED = 15
+SIGNALS_QUEUED = 16
+SIGNALS_DISPATCHED = 17
+SIGNALS_FAILED = 18
+SIGNALS_BLOCKED = 19
+SIGNALS_DROPPED = 20
+SIGNALS_OVERFLOWED = 21
+# The microseconds spent in each stage of the traced requests follow
+STAGE_SECONDS = 22
+COUNTERS = STAGE_SECONDS + len(STAGES)
+# The counters of the responses by status, from 100 to 599, follow
+STATUS_FIRST = 100
+STATUSES = 500
+GAUGES = (
+    IN_FLIGHT,
+    CONNECTIONS_OPEN,
+    WEBSOCKETS_OPEN,
+    OFFLOAD_PENDING,
+    REQUESTS_WAITING,
+)
+# The size of the name of a worker or a route, with its length
+NAME_SIZE = 128
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# name, type, help, counter
+METRICS = (
+    ("sanic_requests_total", "counter", "Requests received", REQUESTS),
+    ("sanic_requests_in_flight", "gauge", "Requests being handled", IN_FLIGHT),
+    (
+        "sanic_received_bytes_total",
+        "counter",
+        "Bytes received from clients",
+        BYTES_RECEIVED,
+    ),
+    ("sanic_sent_bytes_total", "counter", "Bytes sent to clients", BYTES_SENT),
+    ("sanic_connections_total", "counter", "Connections made", CONNECTIONS),
+    ("sanic_connections_open", "gauge", "Open connections", CONNECTIONS_OPEN),
+    ("sanic_websockets_total", "counter", "Websockets opened", WEBSOCKETS),
+    ("sanic_websockets_open", "gauge", "Open websockets", WEBSOCKETS_OPEN),
+    (
+        "sanic_keep_alive_requests_total",
+        "counter",
+        "Requests on a connection that was kept alive",
+        KEEP_ALIVE_REQUESTS,
+    ),
+    (
+        "sanic_slow_requests_total",
+        "counter",
+        "Traced requests that were slower than the threshold",
+        SLOW_REQUESTS,
+    ),
+    (
+        "sanic_offloaded_total",
+        "counter",
+        "Functions run on the offload threads",
+        OFFLOADED,
+    ),
+    (
+        "sanic_offload_pending",
+        "gauge",
+        "Functions running or waiting on the offload threads",
+        OFFLOAD_PENDING,
+    ),
+    (
+        "sanic_offload_rejected_total",
+        "counter",
+        "Functions rejected because the offload queue was full",
+        OFFLOAD_REJECTED,
+    ),
+    (
+        "sanic_requests_queued_total",
+        "counter",
+        "Requests that waited to be admitted",
+        REQUESTS_QUEUED,
+    ),
+    (
+        "sanic_requests_waiting",
+        "gauge",
+        "Requests waiting to be admitted",
+        REQUESTS_WAITING,
+    ),
+    (
+        "sanic_requests_shed_total",
+        "counter",
+        "Requests rejected with a 503 because the worker was overloaded",
+        REQUESTS_SHED,
+    ),
+    (
+        "sanic_signals_queued_total",
+        "counter",
+        "Signal dispatches put on the signal queue",
+        SIGNALS_QUEUED,
+    ),
+    (
+        "sanic_signals_dispatched_total",
+        "counter",
+        "Signal dispatches run from the signal queue",
+        SIGNALS_DISPATCHED,
+    ),
+    (
+        "sanic_signals_failed_total",
+        "counter",
+        "Signal dispatches from the signal queue that raised an exception",
+        SIGNALS_FAILED,
+    ),
+    (
+        "sanic_signals_blocked_total",
+        "counter",
+        "Signal dispatches that waited for room on the signal queue",
+        SIGNALS_BLOCKED,
+    ),
+    (
+        "sanic_signals_dropped_total",
+        "counter",
+        "Signal dispatches discarded because the signal queue was full",
+        SIGNALS_DROPPED,
+    ),
+    (
+        "sanic_signals_overflowed_total",
+        "counter",
+        "Signal dispatches run in their own task because the signal queue "
+        "was full",
+        SIGNALS_OVERFLOWED,
+    ),
+)
+
+
+class MetricsTable(SharedBlock):
+    """The metrics of every worker, in shared memory.
+
+    Each worker has a row of counters, that only that worker writes to, so
+    updating a metric is an addition to an integer in shared memory, with
+    no lock and no message to another process. The rows are added up when
+    the metrics are collected.
+
+    A row belongs to a worker name, so that a worker that is restarted
+    carries on from the counters of the process that it replaces. The
+    latency of each route is kept in a histogram with `buckets`, for up
+    to `routes` routes per worker.
+
+    .. note::
+        This is used internally by Sanic when `METRICS` is enabled, and
+        should not typically need to be instantiated directly.
+
+    Args:
+        rows (int, optional): The number of workers that the table can
+            hold. Defaults to `16`.
+        routes (int, optional): The number of routes that latency is kept
+            for in each worker. Defaults to `256`.
+        buckets (Sequence[float], optional): The upper bounds of the latency
+            histogram buckets, in seconds. Defaults to `DEFAULT_BUCKETS`.
+        shared (bool, optional): Whether to keep the table in shared memory.
+            Defaults to `True`.
+    """
+
+    _shared_attrs = ("rows", "routes", "buckets")
+
+    def __init__(
+        self,
+        rows: int = 16,
+        routes: int = 256,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        shared: bool = True,
+    ) -> None:
+        if rows < 1 or routes < 0:
+            raise ValueError("MetricsTable must have at least 1 row")
+        self.rows = rows
+        self.routes = routes
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets))
+        super().__init__(rows * self._stride, shared)
+
+    @property
+    def _route_size(self) -> int:
+        # count, sum of microseconds, and the buckets with +Inf
+        return 2 + len(self.buckets) + 1
+
+    @property
+    def _names_size(self) -> int:
+        return NAME_SIZE * (1 + self.routes)
+
+    @property
+    def _stride(self) -> int:
+        ints = COUNTERS + STATUSES + self.routes * self._route_size
+        return self._names_size + ints * 8
+
+    def worker(self, name: str) -> WorkerMetrics:
+        """Get the metrics of a worker, to update them.
+
+        The gauges of the worker are reset, since the process that kept
+        them before has exited.
+
+        Args:
+            name (str): The name of the worker.
+
+        Raises:
+            RuntimeError: If there is no row left for the worker.
+
+        Returns:
+            WorkerMetrics: The metrics of the worker.
+        """
+        encoded = name.encode()[: NAME_SIZE - 2]
+        with self._lock:
+            target = None
+            for offset in self._offsets():
+                row_name = _read_name(self._buf, offset)
+                if row_name == encoded:
+                    target = offset
+                    break
+                if target is None and not row_name:
+                    target = offset
+            if target is None:
+                raise RuntimeError(
+                    f"MetricsTable is full, it has {self.rows} rows"
+                )
+            _write_name(self._buf, target, encoded)
+            metrics = WorkerMetrics(self, target)
+            for gauge in GAUGES:
+                metrics.counters[gauge] = 0
+        return metrics
+
+    def collect(self) -> Dict[str, Any]:
+        """Add up the metrics of every worker.
+
+        Returns:
+            Dict[str, Any]: The totals of the counters, the responses by
+                status, and the latency histograms by route.
+        """
+        counters = [0] * COUNTERS
+        statuses: Dict[int, int] = {}
+        routes: Dict[str, List[int]] = {}
+        for names, ints in self._views():
+            try:
+                for index in range(COUNTERS):
+                    counters[index] += ints[index]
+                for index in range(STATUSES):
+                    count = ints[COUNTERS + index]
+                    if count:
+                        status = STATUS_FIRST + index
+                        statuses[status] = statuses.get(status, 0) + count
+                for route, start in self._route_slots(names):
+                    values = ints[start : start + self._route_size].tolist()
+                    total = routes.setdefault(route, [0] * len(values))
+                    for index, value in enumerate(values):
+                        total[index] += value
+            finally:
+                names.release()
+                ints.release()
+        return {
+            "counters": {
+                name: counters[index] for name, _, _, index in METRICS
+            },
+            "stages": {
+                stage: counters[STAGE_SECONDS + index]
+                for index, stage in enumerate(STAGES)
+            },
+            "statuses": statuses,
+            "routes": routes,
+        }
+
+    def render(self) -> str:
+        """Render the metrics of every worker in the Prometheus text format.
+
+        Returns:
+            str: The metrics.
+        """
+        collected = self.collect()
+        lines = []
+        for name, kind, description, _ in METRICS:
+            lines.append(f"# HELP {name} {description}.")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {collected['counters'][name]}")
+
+        name = "sanic_request_stage_seconds_total"
+        lines.append(f"# HELP {name} Time spent in each stage of requests.")
+        lines.append(f"# TYPE {name} counter")
+        for stage, micros in collected["stages"].items():
+            lines.append(f'{name}{{stage="{stage}"}} {_number(micros / 1e6)}')
+
+        name = "sanic_responses_total"
+        lines.append(f"# HELP {name} Responses sent, by status.")
+        lines.append(f"# TYPE {name} counter")
+        for status, count in sorted(collected["statuses"].items()):
+            lines.append(f'{name}{{status="{status}"}} {count}')
+
+        name = "sanic_request_duration_seconds"
+        lines.append(f"# HELP {name} Time taken to handle requests.")
+        lines.append(f"# TYPE {name} histogram")
+        bounds = [*(_number(bucket) for bucket in self.buckets), "+Inf"]
+        for route, values in sorted(collected["routes"].items()):
+            label = _escape(route)
+            count, micros, *buckets = values
+            cumulative = 0
+            for bound, bucket in zip(bounds, buckets):
+                cumulative += bucket
+                lines.append(
+                    f'{name}_bucket{{route="{label}",le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(
+                f'{name}_sum{{route="{label}"}} {_number(micros / 1e6)}'
+            )
+            lines.append(f'{name}_count{{route="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def _offsets(self) -> range:
+        stride = self._stride
+        return range(0, self.rows * stride, stride)
+
+    def _views(self) -> Iterator[Tuple[memoryview, memoryview]]:
+        buf = self._buf
+        for offset in self._offsets():
+            if _read_name(buf, offset):
+                yield self._row(offset)
+
+    def _row(self, offset: int) -> Tuple[memoryview, memoryview]:
+        names_end = offset + self._names_size
+        return (
+            self._buf[offset:names_end],
+            self._buf[names_end : offset + self._stride].cast("q"),
+        )
+
+    def _route_slots(self, names: memoryview) -> Iterator[Tuple[str, int]]:
+        for slot in range(self.routes):
+            name = _read_name(names, NAME_SIZE * (1 + slot))
+            if not name:
+                break
+            yield name.decode(), self._route_start(slot)
+
+    def _route_start(self, slot: int) -> int:
+        return COUNTERS + STATUSES + slot * self._route_size
+
+
+class WorkerMetrics:
+    """The metrics of one worker, in its row of a `MetricsTable`.
+
+    Updates are plain additions to the integers of the row. They are made
+    from the HTTP/1, HTTP/3 and ASGI connections, and when a request has
+    been handled.
+
+    Args:
+        table (MetricsTable): The table that the row is in.
+        offset (int): Where the row starts in the table.
+    """
+
+    __slots__ = (
+        "buckets",
+        "counters",
+        "names",
+        "route_size",
+        "routes",
+        "table",
+        "_free_slot",
+    )
+
+    def __init__(self, table: MetricsTable, offset: int) -> None:
+        self.table = table
+        self.buckets = table.buckets
+        self.route_size = table._route_size
+        self.names, self.counters = table._row(offset)
+        self.routes: Dict[str, int] = dict(table._route_slots(self.names))
+        self._free_slot = len(self.routes)
+
+    def request_started(self) -> float:
+        """Count a request that has started.
+
+        Returns:
+            float: The time that the request started at.
+        """
+        counters = self.counters
+        counters[REQUESTS] += 1
+        counters[IN_FLIGHT] += 1
+        return perf_counter()
+
+    def request_finished(self, request: Request, started: float) -> None:
+        """Count a request that has been handled.
+
+        Args:
+            request (Request): The request.
+            started (float): The time returned by `request_started`.
+        """
+        elapsed = perf_counter() - started
+        counters = self.counters
+        counters[IN_FLIGHT] -= 1
+        response = getattr(request.stream, "response", None)
+        status = getattr(response, "status", None)
+        if status and STATUS_FIRST <= status < STATUS_FIRST + STATUSES:
+            counters[COUNTERS + status - STATUS_FIRST] += 1
+        route = request.route
+        if route is None:
+            return
+        start = self.routes.get(route.name)
+        if start is None:
+            start = self._add_route(route.name)
+            if start is None:
+                return
+        counters[start] += 1
+        counters[start + 1] += int(elapsed * 1_000_000)
+        counters[start + 2 + bisect_left(self.buckets, elapsed)] += 1
+
+    def request_traced(self, trace: RequestTrace, slow: bool) -> None:
+        """Add the time spent in each stage of a traced request.
+
+        Args:
+            trace (RequestTrace): The trace of the request.
+            slow (bool): Whether the request was slow.
+        """
+        counters = self.counters
+        if slow:
+            counters[SLOW_REQUESTS] += 1
+        marks = trace.marks
+        for index in range(len(STAGES)):
+            begin, end = marks[index * 2], marks[index * 2 + 1]
+            if begin and end > begin:
+                counters[STAGE_SECONDS + index] += int(
+                    (end - begin) * 1_000_000
+                )
+
+    def add(self, counter: int, amount: int = 1) -> None:
+        """Add to a counter, or to a gauge.
+
+        Args:
+            counter (int): The index of the counter, like `BYTES_SENT`.
+            amount (int, optional): The amount to add, which may be
+                negative for a gauge. Defaults to `1`.
+        """
+        self.counters[counter] += amount
+
+    def release(self) -> None:
+        """Stop updating the metrics, and release the row.
+
+        The row is swapped for a detached one first, so that the updates
+        made after the release, like those of the connections that are
+        still closing, are dropped instead of raising.
+        """
+        counters, names = self.counters, self.names
+        self.counters = memoryview(bytearray(counters.nbytes)).cast("q")
+        self.names = memoryview(bytearray(names.nbytes))
+        counters.release()
+        names.release()
+
+    def _add_route(self, name: str) -> Optional[int]:
+        slot = self._free_slot
+        if slot >= self.table.routes:
+            return None
+        self._free_slot += 1
+        _write_name(self.names, NAME_SIZE * (1 + slot), name.encode())
+        start = self.table._route_start(slot)
+        self.routes[name] = start
+        return start
+
+
+def _read_name(buf: memoryview, offset: int) -> bytes:
+    length = int.from_bytes(buf[offset : offset + 2], "little")
+    return bytes(buf[offset + 2 : offset + 2 + length])
+
+
+def _write_name(buf: memoryview, offset: int, name: bytes) -> None:
+    name = name[: NAME_SIZE - 2]
+    buf[offset + 2 : offset + 2 + len(name)] = name
+    # The length is written last, so that the name is complete when it
+    # can be seen
+    buf[offset : offset + 2] = len(name).to_bytes(2, "little")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
@@ -23,6 +23,8 @@ from sanic.errorpages import RESPONSE_MAPPING
 from sanic.mixins.base import BaseMixin
 from sanic.models.futures import FutureRoute, FutureStatic
 from sanic.models.handler_types import RouteHandler
+from sanic.offload import OFFLOAD_MODES
+from sanic.response.cache import CachePolicy
 from sanic.types import HashableDict
 
 
@@ -56,6 +58,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         static: bool = False,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        cache: Optional[CachePolicy] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteWrapper:
         """Decorate a function to be registered as a route.
@@ -81,6 +87,17 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                  value; default: `"/v"`.
             error_format (Optional[str]): Error format for the route.
+            cache (Optional[CachePolicy]): Cache the responses of the route
+                in each worker, see `CachePolicy`.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             ctx_kwargs (Any): Keyword arguments that begin with a `ctx_*`
                 prefix will be appended to the route context (`route.ctx`).
 
@@ -117,6 +134,18 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         if not methods and not websocket:
             methods = frozenset({"GET"})
 
+        if offload is not None and offload not in OFFLOAD_MODES:
+            raise ValueError(
+                f"Invalid offload mode {offload!r}, expected one of: "
+                f"{', '.join(OFFLOAD_MODES)}"
+            )
+
+        if (max_concurrency is not None and max_concurrency < 1) or queue < 0:
+            raise ValueError(
+                "The max_concurrency of a route must be at least 1, and its "
+                "queue cannot be negative"
+            )
+
         route_context = self._build_route_context(ctx_kwargs)
 
         def decorator(handler):
@@ -178,6 +207,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 version_prefix,
                 error_format,
                 route_context,
+                cache,
+                offload,
+                max_concurrency,
+                queue,
             )
             overwrite = getattr(self, "_allow_route_overwrite", False)
             if overwrite:
@@ -227,6 +260,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
         unquote: bool = False,
+        cache: Optional[CachePolicy] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """A helper method to register class-based view or functions as a handler to the application url routes.
@@ -243,6 +280,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version value; default: ``/v``.
             error_format (Optional[str]): Custom error format string.
             unquote (bool): Boolean specifying if the handler requires unquoting.
+            cache (Optional[CachePolicy]): Cache the responses of the route in each worker, see `CachePolicy`.
+            offload (Optional[str]): Run a handler that is not a coroutine function on the offload threads, with `"thread"`. Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that the route can handle at once in each worker. Defaults to no limit.
+            queue (int): The number of requests that can wait for the route when it is at `max_concurrency`. The others get a 503 response. Defaults to `0`.
             ctx_kwargs (Any): Keyword arguments that begin with a `ctx_*` prefix will be appended to the route context (``route.ctx``). See below for examples.
 
         Returns:
@@ -305,6 +346,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix=version_prefix,
             error_format=error_format,
             unquote=unquote,
+            cache=cache,
+            offload=offload,
+            max_concurrency=max_concurrency,
+            queue=queue,
             **ctx_kwargs,
         )(handler)
         return handler
@@ -320,6 +365,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         ignore_body: bool = True,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        cache: Optional[CachePolicy] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **GET** HTTP method.
@@ -340,6 +389,17 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            cache (Optional[CachePolicy]): Cache the responses of the route
+                in each worker, see `CachePolicy`.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a
                 `ctx_* prefix` will be appended to the route
                 context (`route.ctx`).
@@ -359,6 +419,10 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 ignore_body=ignore_body,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                cache=cache,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
@@ -373,6 +437,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         name: Optional[str] = None,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **POST** HTTP method.
@@ -391,6 +458,15 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a
                 `ctx_*` prefix will be appended to the route
                 context (`route.ctx`).
@@ -410,6 +486,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 name=name,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
@@ -424,6 +503,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         name: Optional[str] = None,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **PUT** HTTP method.
@@ -442,6 +524,15 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a
                 `ctx_*` prefix will be appended to the route
                 context (`route.ctx`).
@@ -461,6 +552,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 name=name,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
@@ -475,6 +569,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         ignore_body: bool = True,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **HEAD** HTTP method.
@@ -495,6 +592,15 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a
                 `ctx_*` prefix will be appended to the route
                 context (`route.ctx`).
@@ -514,6 +620,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 ignore_body=ignore_body,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
@@ -528,6 +637,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         ignore_body: bool = True,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **OPTIONS** HTTP method.
@@ -548,6 +660,15 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a
                 `ctx_*` prefix will be appended to the route
                 context (`route.ctx`).
@@ -567,6 +688,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 ignore_body=ignore_body,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
@@ -581,6 +705,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         name: Optional[str] = None,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **PATCH** HTTP method.
@@ -599,6 +726,15 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a
                 `ctx_*` prefix will be appended to the route
                 context (`route.ctx`).
@@ -618,6 +754,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 name=name,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
@@ -632,6 +771,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
         ignore_body: bool = False,
         version_prefix: str = "/v",
         error_format: Optional[str] = None,
+        offload: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        queue: int = 0,
         **ctx_kwargs: Any,
     ) -> RouteHandler:
         """Decorate a function handler to create a route definition using the **DELETE** HTTP method.
@@ -650,6 +792,15 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
             version_prefix (str): URL path that should be before the version
                 value. Defaults to `"/v"`.
             error_format (Optional[str]): Custom error format string.
+            offload (Optional[str]): Run a handler that is not a
+                coroutine function on the offload threads, with `"thread"`.
+                Defaults to the `OFFLOAD_SYNC_HANDLERS` config.
+            max_concurrency (Optional[int]): The number of requests that
+                the route can handle at once in each worker. Defaults to
+                no limit.
+            queue (int): The number of requests that can wait for the
+                route when it is at `max_concurrency`. The others get a 503
+                response. Defaults to `0`.
             **ctx_kwargs (Any): Keyword arguments that begin with a `ctx_*`
                 prefix will be appended to the route context (`route.ctx`).
 
@@ -668,6 +819,9 @@ class RouteMixin(BaseMixin, metaclass=SanicMeta):
                 ignore_body=ignore_body,
                 version_prefix=version_prefix,
                 error_format=error_format,
+                offload=offload,
+                max_concurrency=max_concurrency,
+                queue=queue,
                 **ctx_kwargs,
             ),
         )
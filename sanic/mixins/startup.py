@@ -17,7 +17,6 @@ from contextlib import suppress
 from functools import partial
 from importlib import import_module
 from multiprocessing import (
-    Manager,
     Pipe,
     get_context,
     get_start_method,
@@ -35,7 +34,6 @@ from typing import (
     ClassVar,
     Dict,
     List,
-    Mapping,
     Optional,
     Set,
     Tuple,
@@ -57,6 +55,7 @@ from sanic.http.tls import get_ssl_context, process_to_context
 from sanic.http.tls.context import SanicSSLContext
 from sanic.log import Colors, deprecation, error_logger, logger
 from sanic.logging.setup import setup_logging
+from sanic.metrics import MetricsTable
 from sanic.models.handler_types import ListenerType
 from sanic.server import Signal as ServerSignal
 from sanic.server import try_use_uvloop
@@ -73,6 +72,7 @@ from sanic.worker.manager import WorkerManager
 from sanic.worker.multiplexer import WorkerMultiplexer
 from sanic.worker.reloader import Reloader
 from sanic.worker.serve import worker_serve
+from sanic.worker.shared_memory import SharedBlock, SharedStateTable
 
 
 if TYPE_CHECKING:
@@ -186,6 +186,7 @@ class StartupMixin(metaclass=SanicMeta):
         motd_display: Optional[Dict[str, str]] = None,
         auto_tls: bool = False,
         single_process: bool = False,
+        loop_monitor: Optional[bool] = None,
     ) -> None:
         """Run the HTTP Server and listen until keyboard interrupt or term signal. On termination, drain connections before closing.
 
@@ -231,6 +232,7 @@ class StartupMixin(metaclass=SanicMeta):
             motd_display (Optional[Dict[str, str]]): Customize Message of the Day display.
             auto_tls (bool): Enable automatic TLS certificate handling.
             single_process (bool): Enable single process mode.
+            loop_monitor (Optional[bool]): Watch the event loop for blocking calls.
 
         Returns:
             None
@@ -282,6 +284,7 @@ class StartupMixin(metaclass=SanicMeta):
             motd_display=motd_display,
             auto_tls=auto_tls,
             single_process=single_process,
+            loop_monitor=loop_monitor,
         )
 
         if single_process:
@@ -317,6 +320,7 @@ class StartupMixin(metaclass=SanicMeta):
         coffee: bool = False,
         auto_tls: bool = False,
         single_process: bool = False,
+        loop_monitor: Optional[bool] = None,
     ) -> None:
         """Prepares one or more Sanic applications to be served simultaneously.
 
@@ -350,6 +354,7 @@ class StartupMixin(metaclass=SanicMeta):
             coffee (bool, optional): Coffee mode. Defaults to `False`.
             auto_tls (bool, optional): Auto TLS. Defaults to `False`.
             single_process (bool, optional): Single process mode. Defaults to `False`.
+            loop_monitor (Optional[bool], optional): Watch the event loop for blocking calls. Defaults to `None`.
 
         Raises:
             RuntimeError: Raised when attempting to serve HTTP/3 as a secondary server.
@@ -433,6 +438,7 @@ class StartupMixin(metaclass=SanicMeta):
         for attribute, value in {
             "ACCESS_LOG": access_log,
             "AUTO_RELOAD": auto_reload,
+            "LOOP_MONITOR": loop_monitor,
             "MOTD": motd,
             "NOISY_EXCEPTIONS": noisy_exceptions,
         }.items():
@@ -1032,7 +1038,17 @@ class StartupMixin(metaclass=SanicMeta):
             ) from None
 
         socks = []
-        sync_manager = Manager()
+        # Room for every worker, and for the other managed processes
+        worker_state = SharedStateTable(
+            rows=max(64, primary.state.workers * 2)
+        )
+        metrics_table = None
+        if primary.config.METRICS:
+            metrics_table = MetricsTable(
+                rows=max(16, primary.state.workers * 2),
+                routes=primary.config.METRICS_MAX_ROUTES,
+                buckets=primary.config.METRICS_BUCKETS,
+            )
         setup_ext(primary)
         exit_code = 0
         try:
@@ -1056,7 +1072,6 @@ class StartupMixin(metaclass=SanicMeta):
             ]
             primary_server_info.settings["run_multiple"] = True
             monitor_sub, monitor_pub = Pipe(True)
-            worker_state: Mapping[str, Any] = sync_manager.dict()
             kwargs: Dict[str, Any] = {
                 **primary_server_info.settings,
                 "monitor_publisher": monitor_pub,
@@ -1081,10 +1096,13 @@ class StartupMixin(metaclass=SanicMeta):
                 },
                 "config": {
                     "ACCESS_LOG": app.config.ACCESS_LOG,
+                    "LOOP_MONITOR": app.config.LOOP_MONITOR,
                     "NOISY_EXCEPTIONS": app.config.NOISY_EXCEPTIONS,
                 },
                 "shared_ctx": app.shared_ctx.__dict__,
             }
+            if metrics_table is not None:
+                kwargs["passthru"]["_metrics_table"] = metrics_table
             for app in apps:
                 kwargs["server_info"][app.name] = []
                 for server_info in app.state.server_info:
@@ -1137,6 +1155,11 @@ class StartupMixin(metaclass=SanicMeta):
                     primary.config.INSPECTOR_API_KEY,
                     primary.config.INSPECTOR_TLS_KEY,
                     primary.config.INSPECTOR_TLS_CERT,
+                    **(
+                        {"metrics": metrics_table}
+                        if metrics_table is not None
+                        else {}
+                    ),
                 )
                 manager.manage("Inspector", inspector, {}, transient=False)
 
@@ -1186,7 +1209,13 @@ class StartupMixin(metaclass=SanicMeta):
                         "Some processes may still be running."
                     )
                     break
-            sync_manager.shutdown()
+            for app in apps:
+                for value in vars(app.shared_ctx).values():
+                    if isinstance(value, SharedBlock):
+                        value.unlink()
+            worker_state.unlink()
+            if metrics_table is not None:
+                metrics_table.unlink()
             unix = kwargs.get("unix")
             if unix:
                 remove_unix_socket(unix)
@@ -1,9 +1,10 @@
 from email.utils import formatdate
 from functools import partial, wraps
 from mimetypes import guess_type
-from os import PathLike, path
+from os import PathLike, path, stat_result
 from pathlib import Path, PurePath
-from typing import Optional, Sequence, Set, Union
+from stat import S_ISREG
+from typing import Optional, Sequence, Set, Tuple, Union
 from urllib.parse import unquote
 
 from sanic_routing.route import Route
@@ -14,11 +15,17 @@ from sanic.constants import DEFAULT_HTTP_CONTENT_TYPE
 from sanic.exceptions import FileNotFound, HeaderNotFound, RangeNotSatisfiable
 from sanic.handlers import ContentRangeHandler
 from sanic.handlers.directory import DirectoryHandler
+from sanic.handlers.static_cache import StaticFileCache
+from sanic.helpers import _default
 from sanic.log import error_logger
 from sanic.mixins.base import BaseMixin
 from sanic.models.futures import FutureStatic
 from sanic.request import Request
-from sanic.response import HTTPResponse, file, file_stream, validate_file
+from sanic.response import FileResponse, HTTPResponse, file, validate_file
+from sanic.response.compression import (
+    PRECOMPRESSED_SUFFIXES,
+    accepted_encodings,
+)
 
 
 class StaticMixin(BaseMixin, metaclass=SanicMeta):
@@ -45,6 +52,8 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
         index: Optional[Union[str, Sequence[str]]] = None,
         directory_view: bool = False,
         directory_handler: Optional[DirectoryHandler] = None,
+        precompressed: Optional[Sequence[str]] = None,
+        cache: Union[bool, StaticFileCache] = False,
     ):
         """Register a root to serve files from. The input can either be a file or a directory.
 
@@ -62,12 +71,12 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
             use_content_range (bool, optional): If true, process header for
                 range requests and sends  the file part that is requested.
                 Defaults to `False`.
-            stream_large_files (Union[bool, int], optional): If `True`, use
-                the `StreamingHTTPResponse.file_stream` handler rather than
-                the `HTTPResponse.file handler` to send the file. If this
-                is an integer, it represents the threshold size to switch
-                to `StreamingHTTPResponse.file_stream`. Defaults to `False`,
-                which means that the response will not be streamed.
+            stream_large_files (Union[bool, int], optional): If `True`, send
+                files of 1 MiB or more with a `FileResponse`, which streams
+                the file (using sendfile where possible) instead of reading
+                it into memory. If this is an integer, it represents the
+                threshold size to switch to `FileResponse`. Defaults to
+                `False`, which means that the response will not be streamed.
             name (str, optional): User-defined name used for url_for.
                 Defaults to `"static"`.
             host (Optional[str], optional): Host IP or FQDN for the
@@ -91,6 +100,18 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
                 instance of DirectoryHandler that can be used for explicitly
                 controlling and subclassing the behavior of the default
                 directory handler.
+            precompressed (Optional[Sequence[str]], optional): Content
+                codings of precompressed files to look for next to each
+                requested file, in order of preference. Supported codings
+                are `"br"` (`.br`), `"gzip"` (`.gz`) and `"zstd"`
+                (`.zst`). The best one that the client accepts and that
+                exists is served instead of the file. Defaults to `None`.
+            cache (Union[bool, StaticFileCache], optional): Keep small files
+                in memory, and answer conditional requests for them without
+                touching the filesystem. Cached files also get an `ETag`.
+                If `True`, a `StaticFileCache` with the default limits is
+                used. An instance may be shared between routes. Defaults
+                to `False`.
 
         Returns:
             List[sanic.router.Route]: Routes registered on the router.
@@ -110,6 +131,16 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
             ```python
             app.static('/static', 'path/to/large/files', stream_large_files=1000000)
             ```
+
+            Serving precompressed files, such as `app.js.br` for `app.js`:
+            ```python
+            app.static('/static', 'path/to/bundles', precompressed=("br", "gzip"))
+            ```
+
+            Keeping small files in memory:
+            ```python
+            app.static('/static', 'path/to/assets', cache=StaticFileCache(ttl=10))
+            ```
         """  # noqa: E501
 
         name = self._generate_name(name)
@@ -136,6 +167,17 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
                 "these arguments to your DirectoryHandler instance."
             )
 
+        precompressed = tuple(precompressed or ())
+        for encoding in precompressed:
+            if encoding not in PRECOMPRESSED_SUFFIXES:
+                raise ValueError(
+                    f"Unknown precompressed encoding '{encoding}'. Choose "
+                    f"from: {', '.join(PRECOMPRESSED_SUFFIXES)}"
+                )
+
+        if cache is True:
+            cache = StaticFileCache()
+
         if not directory_handler:
             directory_handler = DirectoryHandler(
                 uri=uri,
@@ -157,6 +199,8 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
             content_type,
             resource_type,
             directory_handler,
+            precompressed,
+            cache if isinstance(cache, StaticFileCache) else None,
         )
         self._future_statics.add(static)
 
@@ -230,6 +274,8 @@ class StaticHandleMixin(metaclass=SanicMeta):
                 stream_large_files=static.stream_large_files,
                 content_type=static.content_type,
                 directory_handler=static.directory_handler,
+                precompressed=static.precompressed,
+                cache=static.cache,
             )
         )
 
@@ -254,6 +300,8 @@ class StaticHandleMixin(metaclass=SanicMeta):
         stream_large_files: Union[bool, int],
         directory_handler: DirectoryHandler,
         content_type: Optional[str] = None,
+        precompressed: Tuple[str, ...] = (),
+        cache: Optional[StaticFileCache] = None,
         __file_uri__: Optional[str] = None,
     ):
         not_found = FileNotFound(
@@ -269,17 +317,51 @@ class StaticHandleMixin(metaclass=SanicMeta):
 
         try:
             headers = {}
+            stats = None
+            # The content type is that of the file, whichever
+            # representation of it is sent
+            source_path = file_path
+            if precompressed:
+                headers["Vary"] = "Accept-Encoding"
+                encoding, file_path, stats = await self._get_precompressed(
+                    request, file_path, precompressed
+                )
+                if encoding:
+                    headers["Content-Encoding"] = encoding
+
+            entry = None
+            validate = True
+            if cache is not None:
+                entry = cache.get(file_path)
+                if entry is None:
+                    stats = stats or await stat_async(file_path)
+                    entry = await cache.load(file_path, stats)
+                if entry is not None:
+                    stats = entry.stats
+                    headers["ETag"] = entry.etag
+                    if_none_match = request.headers.get("if-none-match")
+                    if if_none_match is not None:
+                        if entry.matches(if_none_match):
+                            return HTTPResponse(status=304, headers=headers)
+                        # If-Modified-Since is ignored with If-None-Match
+                        validate = False
+
             # Check if the client has been sent this file before
             # and it has not been modified since
-            stats = None
             if use_modified_since:
-                stats = await stat_async(file_path)
+                if not stats:
+                    stats = await stat_async(file_path)
                 modified_since = stats.st_mtime
-                response = await validate_file(request.headers, modified_since)
-                if response:
-                    return response
-                headers["Last-Modified"] = formatdate(
-                    modified_since, usegmt=True
+                if validate:
+                    response = await validate_file(
+                        request.headers, modified_since
+                    )
+                    if response:
+                        return response
+                headers["Last-Modified"] = (
+                    entry.last_modified
+                    if entry
+                    else formatdate(modified_since, usegmt=True)
                 )
             _range = None
             if use_content_range:
@@ -290,30 +372,60 @@ class StaticHandleMixin(metaclass=SanicMeta):
                 headers["Content-Length"] = str(stats.st_size)
                 if request.method != "HEAD":
                     try:
-                        _range = ContentRangeHandler(request, stats)
+                        _range = ContentRangeHandler(
+                            request, stats, etag=headers.get("ETag")
+                        )
                     except HeaderNotFound:
                         pass
                     else:
                         del headers["Content-Length"]
                         headers.update(_range.headers)
 
-            if "content-type" not in headers:
-                content_type = (
+            if not content_type and entry and entry.content_type:
+                headers["Content-Type"] = entry.content_type
+            elif "content-type" not in headers:
+                mime_type = (
                     content_type
-                    or guess_type(file_path)[0]
+                    or guess_type(source_path)[0]
                     or DEFAULT_HTTP_CONTENT_TYPE
                 )
 
-                if "charset=" not in content_type and (
-                    content_type.startswith("text/")
-                    or content_type == "application/javascript"
+                if "charset=" not in mime_type and (
+                    mime_type.startswith("text/")
+                    or mime_type == "application/javascript"
                 ):
-                    content_type += "; charset=utf-8"
+                    mime_type += "; charset=utf-8"
+
+                headers["Content-Type"] = mime_type
+                # The cache is shared by routes, that may set their own type
+                if entry and not content_type:
+                    entry.content_type = mime_type
 
-                headers["Content-Type"] = content_type
+            # With several ranges, the content type is given for each part
+            part_type = headers["Content-Type"]
+            if _range and _range.multipart:
+                headers["Content-Type"] = _range.content_type
 
             if request.method == "HEAD":
                 return HTTPResponse(headers=headers)
+            elif entry:
+                if _range and _range.multipart:
+                    body = b"".join(
+                        header + entry.body[offset : offset + size]
+                        for header, offset, size in _range.parts(part_type)
+                    )
+                    return HTTPResponse(
+                        body + _range.multipart_end,
+                        status=206,
+                        headers=headers,
+                    )
+                elif _range:
+                    return HTTPResponse(
+                        entry.body[_range.start : _range.end + 1],
+                        status=206,
+                        headers=headers,
+                    )
+                return HTTPResponse(entry.body, headers=headers)
             else:
                 if stream_large_files:
                     if isinstance(stream_large_files, bool):
@@ -324,10 +436,20 @@ class StaticHandleMixin(metaclass=SanicMeta):
                     if not stats:
                         stats = await stat_async(file_path)
                     if stats.st_size >= threshold:
-                        return await file_stream(
-                            file_path, headers=headers, _range=_range
+                        return FileResponse(
+                            file_path,
+                            headers=headers,
+                            content_type=part_type,
+                            size=stats.st_size,
+                            _range=_range,
                         )
-                return await file(file_path, headers=headers, _range=_range)
+                return await file(
+                    file_path,
+                    headers=headers,
+                    mime_type=part_type,
+                    last_modified=stats.st_mtime if stats else _default,
+                    _range=_range,
+                )
         except (IsADirectoryError, PermissionError):
             return await directory_handler.handle(request, request.path)
         except RangeNotSatisfiable:
@@ -342,6 +464,24 @@ class StaticHandleMixin(metaclass=SanicMeta):
             )
             raise
 
+    async def _get_precompressed(
+        self,
+        request: Request,
+        file_path: Union[Path, str],
+        precompressed: Tuple[str, ...],
+    ) -> Tuple[Optional[str], Union[Path, str], Optional[stat_result]]:
+        for encoding in accepted_encodings(
+            request.headers.get("accept-encoding"), precompressed
+        ):
+            variant = f"{file_path}{PRECOMPRESSED_SUFFIXES[encoding]}"
+            try:
+                stats = await stat_async(variant)
+            except OSError:
+                continue
+            if S_ISREG(stats.st_mode):
+                return encoding, variant, stats
+        return None, file_path, None
+
     async def _get_file_path(self, file_or_directory, __file_uri__, not_found):
         file_path_raw = Path(unquote(file_or_directory))
         root_path = file_path = file_path_raw.resolve()
@@ -1,13 +1,15 @@
 from pathlib import Path
-from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 from sanic.handlers.directory import DirectoryHandler
+from sanic.handlers.static_cache import StaticFileCache
 from sanic.models.handler_types import (
     ErrorMiddlewareType,
     ListenerType,
     MiddlewareType,
     SignalHandler,
 )
+from sanic.response.cache import CachePolicy
 from sanic.types import HashableDict
 
 
@@ -28,6 +30,10 @@ class FutureRoute(NamedTuple):
     version_prefix: str
     error_format: Optional[str]
     route_context: HashableDict
+    cache: Optional[CachePolicy] = None
+    offload: Optional[str] = None
+    max_concurrency: Optional[int] = None
+    queue: int = 0
 
 
 class FutureListener(NamedTuple):
@@ -59,6 +65,8 @@ class FutureStatic(NamedTuple):
     content_type: Optional[str]
     resource_type: Optional[str]
     directory_handler: DirectoryHandler
+    precompressed: Tuple[str, ...] = ()
+    cache: Optional[StaticFileCache] = None
 
 
 class FutureSignal(NamedTuple):
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import sys
+
+from asyncio import Future, get_running_loop, shield, wait
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, Set, TypeVar
+
+from sanic.exceptions import ServiceUnavailable
+from sanic.metrics import OFFLOAD_PENDING, OFFLOAD_REJECTED, OFFLOADED
+
+
+if TYPE_CHECKING:
+    from sanic import Sanic
+
+
+T = TypeVar("T")
+
+# The ways that a route handler can be offloaded from the event loop
+OFFLOAD_MODES = ("thread",)
+
+
+class Offloader:
+    """Runs blocking functions on a pool of threads, away from the loop.
+
+    A sync route handler, or any function that blocks, would stop the
+    event loop of the worker, and every other request with it, while it
+    runs. The offloader runs it on a thread instead, and the loop awaits
+    its result. The context variables of the caller, like the current
+    request, are copied to the thread.
+
+    The pool is only started when it is first used, and is shut down with
+    the server. At most `threads` functions run at once, and up to
+    `queue_size` more wait for a thread. Once those are all taken, new
+    calls are rejected with a 503 instead of waiting without bound. A
+    function keeps its place until it returns, even if the caller that
+    waits for it is cancelled, since its thread cannot be stopped.
+
+    .. note::
+        This is used internally by Sanic, and should not typically need to
+        be instantiated directly. Use `Sanic.offload` to offload a function.
+
+    Args:
+        app (Sanic): The application.
+        threads (int, optional): The number of threads, or `0` for the
+            default of `ThreadPoolExecutor`. Defaults to `0`.
+        queue_size (int, optional): The number of calls that may wait for a
+            thread, or `0` for no limit. Defaults to `0`.
+    """
+
+    __slots__ = (
+        "app",
+        "pending",
+        "queue_size",
+        "threads",
+        "_executor",
+        "_futures",
+    )
+
+    def __init__(self, app: Sanic, threads: int = 0, queue_size: int = 0):
+        if threads < 0 or queue_size < 0:
+            raise ValueError(
+                "The threads and queue size of an Offloader cannot be negative"
+            )
+        self.app = app
+        # The same default as ThreadPoolExecutor
+        self.threads = threads or min(32, (os.cpu_count() or 1) + 4)
+        self.queue_size = queue_size
+        self.pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Set[Future[Any]] = set()
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a function on a thread, and wait for its result.
+
+        Args:
+            func (Callable[..., T]): The function.
+            *args (Any): The positional arguments of the function.
+            **kwargs (Any): The keyword arguments of the function.
+
+        Raises:
+            ServiceUnavailable: If the threads and the queue are all taken.
+
+        Returns:
+            T: The result of the function.
+        """
+        metrics = self.app.metrics
+        if self.queue_size and self.pending >= self.threads + self.queue_size:
+            if metrics is not None:
+                metrics.add(OFFLOAD_REJECTED)
+            raise ServiceUnavailable("Too many requests are being offloaded")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.threads, thread_name_prefix="SanicOffload"
+            )
+        call = partial(copy_context().run, func, *args, **kwargs)
+        self.pending += 1
+        if metrics is not None:
+            metrics.add(OFFLOADED)
+            metrics.add(OFFLOAD_PENDING)
+        future = get_running_loop().run_in_executor(self._executor, call)
+        self._futures.add(future)
+        future.add_done_callback(self._done)
+        # The future is only done once the function has returned
+        return await shield(future)
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Wait for the functions that are running, and stop the threads.
+
+        Args:
+            timeout (Optional[float], optional): How long to wait for the
+                functions, in seconds, or `None` for no limit. The threads of
+                the functions that are still running then are left behind.
+                Defaults to `None`.
+        """
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        if self._futures:
+            await wait(self._futures, timeout=timeout)
+        if sys.version_info >= (3, 9):
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:  # no cov
+            executor.shutdown(wait=False)
+
+    def _done(self, future: Future[Any]) -> None:
+        self._futures.discard(future)
+        self.pending -= 1
+        metrics = self.app.metrics
+        if metrics is not None:
+            metrics.add(OFFLOAD_PENDING, -1)
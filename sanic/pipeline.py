@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+from asyncio import shield
+from inspect import isawaitable, iscoroutinefunction
+from typing import TYPE_CHECKING, Any, FrozenSet, List, Optional, Tuple
+
+from sanic_routing.route import Route
+
+from sanic.exceptions import ServerError, ServiceUnavailable
+from sanic.log import error_logger, logger
+from sanic.response import BaseHTTPResponse, ResponseStream
+from sanic.response.cache import CACHEABLE_METHODS, ResponseCache
+from sanic.server.admission import ConcurrencyLimit
+from sanic.tracing import HANDLER, REQUEST_MIDDLEWARE
+
+
+if TYPE_CHECKING:
+    from sanic import Sanic
+    from sanic.request import Request
+
+
+ROUTE_EVENTS = (
+    "http.routing.after",
+    "http.handler.before",
+    "http.handler.after",
+    "http.lifecycle.response",
+)
+
+
+def route_events(app: Sanic) -> FrozenSet[str]:
+    """Find the route events that need to be dispatched for an application.
+
+    Events without any signal handlers are left out, unless TouchUp is
+    disabled. In that case signals may still be added while the application
+    is running, so every event is kept.
+
+    Args:
+        app (Sanic): The application.
+
+    Returns:
+        FrozenSet[str]: The names of the events to dispatch.
+    """
+    if app.config.TOUCHUP is not True:
+        return frozenset(ROUTE_EVENTS)
+    names = {signal.name for signal in app.signal_router.routes}
+    dynamic = any(
+        name.startswith("http.") and ("<" in name or "*" in name)
+        for name in names
+    )
+    events = set()
+    for event in ROUTE_EVENTS:
+        if dynamic or event in names:
+            events.add(event)
+        else:
+            logger.debug(
+                f"Disabling event: {event}",
+                extra={"verbosity": 2},
+            )
+    return frozenset(events)
+
+
+class RoutePipeline:
+    """The steps taken to handle a request once it has been routed.
+
+    A pipeline is built for every route when the application is finalized.
+    What can be known about the route ahead of time is worked out once:
+    whether the handler streams the request body or serves a websocket,
+    whether there is any request middleware, and which of the route events
+    have signal handlers. Each request then checks these flags instead of
+    probing the handler, and skips the steps that do not apply. The way
+    that the handler is called, awaited, offloaded, or called and awaited
+    only if it returns an awaitable, is chosen when the pipeline is built.
+
+    When the route, or its blueprint, has a `max_concurrency`, requests
+    take a slot of its `ConcurrencyLimit` before the request middleware,
+    and are rejected with a 503 when there is none left to wait for.
+
+    When the route has a `CachePolicy`, responses are served from a
+    `ResponseCache` while they are fresh. A cache hit skips the handler and
+    the response middleware.
+
+    A handler that is not a coroutine function is run on the offload
+    threads of the application when the route is offloaded, or when
+    `OFFLOAD_SYNC_HANDLERS` is enabled, so that it does not block the loop.
+
+    .. note::
+        This is used internally by `Sanic.handle_request`, and should not
+        typically need to be instantiated directly.
+
+    Args:
+        app (Sanic): The application that the route belongs to.
+        route (Route): The route.
+        events (FrozenSet[str]): The route events to dispatch. See
+            `route_events`.
+    """
+
+    __slots__ = (
+        "app",
+        "handler",
+        "is_coroutine",
+        "is_stream",
+        "is_websocket",
+        "offload",
+        "preload_body",
+        "request_middleware",
+        "dispatch_routing",
+        "dispatch_handler_before",
+        "dispatch_handler_after",
+        "dispatch_response",
+        "cache",
+        "limits",
+        "call_handler",
+    )
+
+    def __init__(
+        self, app: Sanic, route: Route, events: FrozenSet[str]
+    ) -> None:
+        handler = route.handler
+        self.app = app
+        self.handler = handler
+        self.is_coroutine = iscoroutinefunction(handler)
+        self.is_stream = hasattr(handler, "is_stream")
+        self.is_websocket = hasattr(handler, "is_websocket")
+        offload = getattr(route.extra, "offload", None)
+        self.offload = (
+            not self.is_coroutine
+            and not self.is_websocket
+            and (
+                offload is not None
+                # Class based views return the coroutine of their method
+                or (
+                    app.config.OFFLOAD_SYNC_HANDLERS
+                    and not hasattr(handler, "view_class")
+                )
+            )
+        )
+        self.preload_body = not route.extra.ignore_body
+        self.request_middleware = route.extra.request_middleware
+        self.dispatch_routing = "http.routing.after" in events
+        self.dispatch_handler_before = "http.handler.before" in events
+        self.dispatch_handler_after = "http.handler.after" in events
+        self.dispatch_response = "http.lifecycle.response" in events
+        self.cache = getattr(route.extra, "response_cache", None)
+        self.limits = tuple(
+            limit
+            for limit in (
+                getattr(route.extra, "blueprint_limit", None),
+                getattr(route.extra, "concurrency_limit", None),
+            )
+            if limit is not None
+        )
+        if self.is_coroutine:
+            self.call_handler = self._call_coroutine
+        elif self.offload:
+            self.call_handler = self._call_offloaded
+        else:
+            self.call_handler = self._call_sync
+
+    def __repr__(self) -> str:
+        steps = [
+            name
+            for name in (
+                "is_coroutine",
+                "is_stream",
+                "is_websocket",
+                "offload",
+                "preload_body",
+                "dispatch_routing",
+                "dispatch_handler_before",
+                "dispatch_handler_after",
+                "dispatch_response",
+            )
+            if getattr(self, name)
+        ]
+        if self.request_middleware:
+            steps.append(f"request_middleware={len(self.request_middleware)}")
+        if self.cache is not None:
+            steps.append(f"cache={self.cache.policy.ttl}s")
+        for limit in self.limits:
+            steps.append(f"max_concurrency={limit.limit}/{limit.queue_size}")
+        return f"<{self.__class__.__name__}: {', '.join(steps)}>"
+
+    async def prepare(self, request: Request, kwargs: dict) -> None:
+        """Run the steps between routing and the request middleware.
+
+        This dispatches the `http.routing.after` signal, and then either
+        lifts the request size limit for a streaming handler, or reads the
+        whole request body.
+
+        Args:
+            request (Request): The current request object.
+            kwargs (dict): The parameters matched by the router.
+        """
+        if self.dispatch_routing:
+            await self.app.dispatch(
+                "http.routing.after",
+                inline=True,
+                context={
+                    "request": request,
+                    "route": request.route,
+                    "kwargs": kwargs,
+                    "handler": self.handler,
+                },
+            )
+
+        stream = request.stream
+        if self.preload_body and stream and stream.request_body:
+            if self.is_stream:
+                # Streaming handler: lift the size limit
+                stream.request_max_size = float("inf")
+            else:
+                # Non-streaming handler: preload body
+                await request.receive_body()
+
+    async def __call__(self, request: Request) -> None:
+        """Run the request middleware and the handler, and send the response.
+
+        Args:
+            request (Request): The current request object.
+
+        Raises:
+            ServerError: If the handler does not produce a response.
+            ServiceUnavailable: If the route is at its concurrency limit,
+                and its queue is full.
+        """
+        if not self.limits:
+            await self._run(request)
+            return
+
+        acquired: List[ConcurrencyLimit] = []
+        try:
+            for limit in self.limits:
+                if not await limit.acquire():
+                    retry_after = self.app.config.ADMISSION_RETRY_AFTER
+                    raise ServiceUnavailable(
+                        "The route is at its concurrency limit",
+                        headers={"retry-after": retry_after},
+                    )
+                acquired.append(limit)
+            await self._run(request)
+        finally:
+            for limit in acquired:
+                limit.release()
+
+    async def _run(self, request: Request) -> None:
+        app = self.app
+        response: Any = None
+
+        if self.request_middleware:
+            trace = request.trace
+            if trace is not None:
+                trace.begin(REQUEST_MIDDLEWARE)
+            response = await app._run_request_middleware(
+                request, self.request_middleware
+            )
+            if trace is not None:
+                trace.end(REQUEST_MIDDLEWARE)
+
+        if (
+            not response
+            and self.cache is not None
+            and request.method in CACHEABLE_METHODS
+        ):
+            await self._call_cached(request)
+        else:
+            await self._call(request, response)
+
+    async def _call_cached(self, request: Request) -> None:
+        cache: ResponseCache = self.cache  # type: ignore
+        key = cache.key(request)
+        entry = cache.get(key)
+        if entry is None and request.method == "GET":
+            # Only one request at a time runs the handler for a key, the
+            # others wait for its response
+            flight = cache.start(key)
+            if flight is None:
+                try:
+                    await self._call(request, None, key)
+                finally:
+                    cache.finish(key)
+                return
+            entry = await shield(flight)
+        if entry is None:
+            await self._call(request, None)
+            return
+
+        # Cache hit: the response middleware already ran for this response
+        request._response_middleware_started = True
+        response = await request.respond(entry.response())
+        await self._dispatch_response(request, response)
+        await response.send(end_stream=True)
+
+    async def _call(
+        self,
+        request: Request,
+        response: Any,
+        cache_key: Optional[Tuple] = None,
+    ) -> None:
+        app = self.app
+
+        # No middleware results
+        if not response:
+            if self.dispatch_handler_before:
+                await app.dispatch(
+                    "http.handler.before",
+                    inline=True,
+                    context={"request": request},
+                )
+            trace = request.trace
+            if trace is not None:
+                trace.begin(HANDLER)
+            response = await self.call_handler(request)
+            if trace is not None:
+                trace.end(HANDLER)
+            if self.dispatch_handler_after:
+                await app.dispatch(
+                    "http.handler.after",
+                    inline=True,
+                    context={"request": request},
+                )
+
+        if request.responded:
+            if response is not None:
+                error_logger.error(
+                    "The response object returned by the route handler "
+                    "will not be sent to client. The request has already "
+                    "been responded to."
+                )
+            if request.stream is not None:
+                response = request.stream.response
+        elif response is not None:
+            response = await request.respond(response)
+            if cache_key is not None:
+                self.cache.store(cache_key, response)  # type: ignore
+        elif not self.is_websocket:
+            response = request.stream.response  # type: ignore
+
+        # Marked for cleanup and DRY with handle_request/handle_exception
+        # when ResponseStream is no longer supporder
+        if isinstance(response, BaseHTTPResponse):
+            await self._dispatch_response(request, response)
+            await response.send(end_stream=True)
+        elif isinstance(response, ResponseStream):
+            resp = await response(request)
+            await self._dispatch_response(request, resp)
+            await response.eof()
+        elif not self.is_websocket:
+            raise ServerError(
+                f"Invalid response type {response!r} (need HTTPResponse)"
+            )
+
+    async def _call_coroutine(self, request: Request) -> Any:
+        return await self.handler(request, **request.match_info)
+
+    async def _call_offloaded(self, request: Request) -> Any:
+        response = await self.app.offloader.run(  # type: ignore
+            self.handler, request, **request.match_info
+        )
+        if isawaitable(response):
+            response = await response
+        return response
+
+    async def _call_sync(self, request: Request) -> Any:
+        response = self.handler(request, **request.match_info)
+        if isawaitable(response):
+            response = await response
+        return response
+
+    async def _dispatch_response(
+        self, request: Request, response: Optional[BaseHTTPResponse]
+    ) -> None:
+        if self.dispatch_response:
+            await self.app.dispatch(
+                "http.lifecycle.response",
+                inline=True,
+                context={"request": request, "response": response},
+            )
@@ -1,10 +1,11 @@
-from .form import File, parse_multipart_form
+from .form import File, MultipartParser, parse_multipart_form
 from .parameters import RequestParameters
 from .types import Request
 
 
 __all__ = (
     "File",
+    "MultipartParser",
     "parse_multipart_form",
     "Request",
     "RequestParameters",
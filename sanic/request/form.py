@@ -3,9 +3,11 @@ from __future__ import annotations
 import email.utils
 import unicodedata
 
-from typing import NamedTuple
+from tempfile import TemporaryFile
+from typing import IO, Dict, List, NamedTuple, Optional, Tuple, Union, cast
 from urllib.parse import unquote
 
+from sanic.exceptions import BadRequest
 from sanic.headers import parse_content_header
 from sanic.log import logger
 
@@ -20,50 +22,209 @@ class File(NamedTuple):
 
     Args:
         type (str, optional): The mimetype, defaults to "text/plain".
-        body (bytes): Bytes of the file.
+        body (Union[bytes, IO[bytes]]): Bytes of the file. Uploads spooled
+            to disk by a `MultipartParser` instead have an open temporary
+            file here, positioned at its start, that is closed once the
+            request has been handled.
         name (str): The filename.
     """
 
     type: str
-    body: bytes
+    body: Union[bytes, IO[bytes]]
     name: str
 
 
-def parse_multipart_form(body, boundary):
-    """Parse a request body and returns fields and files
+_PREAMBLE, _BOUNDARY, _HEADERS, _BODY, _DONE = range(5)
+
+
+class MultipartParser:
+    """Incremental parser for multipart/form-data bodies.
+
+    The body is fed in chunks as they arrive, for instance from
+    `request.stream`, and is never held in memory as a whole. Each call to
+    `feed()` returns the parts that were completed by that chunk, as
+    `(name, value)` tuples where the value is a `str` for form fields and
+    a `File` for uploads. All parts are also collected in `fields` and
+    `files`.
+
+    File parts larger than `spool_threshold` bytes are written to a
+    temporary file rather than kept in memory.
+
+    ```python
+    parser = MultipartParser(boundary, spool_threshold=1_048_576)
+    async for data in request.stream:
+        for name, value in parser.feed(data):
+            ...
+    parser.close()
+    ```
 
     Args:
-        body (bytes): Bytes request body.
         boundary (bytes): Bytes multipart boundary.
+        spool_threshold (Optional[int], optional): Size above which file
+            parts are written to disk. Defaults to `None`, which keeps
+            all parts in memory.
+    """
 
-    Returns:
-        Tuple[RequestParameters, RequestParameters]: A tuple containing fields and files as `RequestParameters`.
-    """  # noqa: E501
-    files = {}
-    fields = {}
-
-    form_parts = body.split(boundary)
-    for form_part in form_parts[1:-1]:
-        file_name = None
-        content_type = "text/plain"
-        content_charset = "utf-8"
-        field_name = None
-        line_index = 2
-        line_end_index = 0
-        while not line_end_index == -1:
-            line_end_index = form_part.find(b"\r\n", line_index)
-            form_line = form_part[line_index:line_end_index].decode("utf-8")
-            line_index = line_end_index + 2
+    HEADER_MAX_SIZE = 16_384
 
-            if not form_line:
-                break
+    __slots__ = (
+        "fields",
+        "files",
+        "spool_threshold",
+        "_buffer",
+        "_charset",
+        "_content_type",
+        "_boundary",
+        "_data",
+        "_delimiter",
+        "_field_name",
+        "_file",
+        "_file_name",
+        "_state",
+    )
+
+    def __init__(
+        self, boundary: bytes, spool_threshold: Optional[int] = None
+    ) -> None:
+        self.fields: Dict[str, List[str]] = {}
+        self.files: Dict[str, List[File]] = {}
+        self.spool_threshold = spool_threshold
+        self._buffer = bytearray()
+        self._boundary = boundary
+        self._delimiter = b"\r\n--" + boundary
+        self._state = _PREAMBLE
+        self._data = bytearray()
+        self._file: Optional[IO[bytes]] = None
+        self._field_name: Optional[str] = None
+        self._file_name: Optional[str] = None
+        self._content_type = "text/plain"
+        self._charset = "utf-8"
+
+    def feed(self, data: bytes) -> List[Tuple[str, Union[str, File]]]:
+        """Parse the next chunk of the body.
 
-            colon_index = form_line.index(":")
-            idx = colon_index + 2
-            form_header_field = form_line[0:colon_index].lower()
-            form_header_value, form_parameters = parse_content_header(
-                form_line[idx:]
+        Args:
+            data (bytes): The next chunk of the body.
+
+        Raises:
+            BadRequest: If the headers of a part are malformed or too large.
+
+        Returns:
+            List[Tuple[str, Union[str, File]]]: The parts completed by this chunk.
+        """  # noqa: E501
+        buf = self._buffer
+        buf += data
+        parts: List[Tuple[str, Union[str, File]]] = []
+        pos = 0
+        with memoryview(buf) as view:
+            while True:
+                state = self._state
+                if state is _BODY:
+                    end = buf.find(self._delimiter, pos)
+                    if end < 0:
+                        # Keep what could be the start of a delimiter
+                        end = len(buf) - len(self._delimiter) + 1
+                        if end > pos:
+                            self._write(view[pos:end])
+                            pos = end
+                        break
+                    part = self._end_part(view[pos:end])
+                    if part:
+                        parts.append(part)
+                    pos = end + len(self._delimiter)
+                    self._state = _BOUNDARY
+                elif state is _HEADERS:
+                    if len(buf) - pos < 2:
+                        break
+                    if buf.startswith(b"\r\n", pos):
+                        end = pos
+                    else:
+                        end = buf.find(b"\r\n\r\n", pos)
+                        if end < 0:
+                            if len(buf) - pos > self.HEADER_MAX_SIZE:
+                                raise BadRequest("Form part header too large")
+                            break
+                        end += 2
+                    # The line ending the headers may also start the
+                    # delimiter, if the part is empty
+                    tail = bytes(view[end : end + len(self._delimiter)])
+                    if len(tail) < len(
+                        self._delimiter
+                    ) and self._delimiter.startswith(tail):
+                        break
+                    self._start_part(bytes(view[pos:end]))
+                    if tail == self._delimiter:
+                        part = self._end_part(view[end:end])
+                        if part:
+                            parts.append(part)
+                        pos = end + len(self._delimiter)
+                        self._state = _BOUNDARY
+                    else:
+                        pos = end + 2
+                        self._state = _BODY
+                elif state is _BOUNDARY:
+                    if len(buf) - pos < 2:
+                        break
+                    if buf.startswith(b"--", pos):
+                        pos = len(buf)
+                        self._state = _DONE
+                        break
+                    end = buf.find(b"\r\n", pos)
+                    if end < 0:
+                        break
+                    pos = end + 2
+                    self._state = _HEADERS
+                elif state is _PREAMBLE:
+                    end = buf.find(b"\r\n", pos)
+                    if end < 0:
+                        if len(buf) - pos > self.HEADER_MAX_SIZE:
+                            raise BadRequest("Invalid multipart/form-data")
+                        break
+                    # Some clients leave out the dashes before the boundary
+                    if buf.startswith(b"--" + self._boundary, pos):
+                        pos += 2
+                    elif not buf.startswith(self._boundary, pos):
+                        pos = end + 2
+                        continue
+                    else:
+                        self._delimiter = b"\r\n" + self._boundary
+                    pos += len(self._boundary)
+                    self._state = _BOUNDARY
+                else:
+                    pos = len(buf)
+                    break
+        del buf[:pos]
+        return parts
+
+    def close(self) -> None:
+        """Finish parsing, discarding any incomplete trailing part."""
+        if self._file:
+            self._file.close()
+        self._file = None
+        self._data = bytearray()
+        self._buffer = bytearray()
+        self._state = _DONE
+
+    def _start_part(self, head: bytes) -> None:
+        self._field_name = None
+        self._file_name = None
+        self._content_type = "text/plain"
+        self._charset = "utf-8"
+
+        for form_line in head.decode("utf-8").split("\r\n"):
+            if not form_line:
+                continue
+            form_header_field, sep, form_header_value = form_line.partition(
+                ":"
+            )
+            if not sep:
+                raise BadRequest("Invalid form part header")
+            form_header_value, options = parse_content_header(
+                form_header_value.strip()
             )
+            # The options parsed from a header are all strings
+            form_parameters = cast(Dict[str, str], options)
+            form_header_field = form_header_field.lower()
 
             if form_header_field == "content-disposition":
                 field_name = form_parameters.get("name")
@@ -74,7 +235,7 @@ def parse_multipart_form(body, boundary):
                     encoding, _, value = email.utils.decode_rfc2231(
                         form_parameters["filename*"]
                     )
-                    file_name = unquote(value, encoding=encoding)
+                    file_name = unquote(value, encoding=encoding or "utf-8")
 
                 # Normalize to NFC (Apple MacOS/iOS send NFD)
                 # Notes:
@@ -85,30 +246,80 @@ def parse_multipart_form(body, boundary):
                 if file_name is not None:
                     file_name = unicodedata.normalize("NFC", file_name)
 
+                self._field_name = field_name
+                self._file_name = file_name
+
             elif form_header_field == "content-type":
-                content_type = form_header_value
-                content_charset = form_parameters.get("charset", "utf-8")
-
-        if field_name:
-            post_data = form_part[line_index:-4]
-            if file_name is None:
-                value = post_data.decode(content_charset)
-                if field_name in fields:
-                    fields[field_name].append(value)
-                else:
-                    fields[field_name] = [value]
-            else:
-                form_file = File(
-                    type=content_type, name=file_name, body=post_data
-                )
-                if field_name in files:
-                    files[field_name].append(form_file)
-                else:
-                    files[field_name] = [form_file]
-        else:
+                self._content_type = form_header_value
+                self._charset = form_parameters.get("charset", "utf-8")
+
+        if not self._field_name:
             logger.debug(
                 "Form-data field does not have a 'name' parameter "
                 "in the Content-Disposition header"
             )
 
-    return RequestParameters(fields), RequestParameters(files)
+    def _write(self, data: memoryview) -> None:
+        if not self._field_name:
+            return
+        if self._file:
+            self._file.write(data)
+            return
+        self._data += data
+        if (
+            self._file_name is not None
+            and self.spool_threshold is not None
+            and len(self._data) > self.spool_threshold
+        ):
+            self._file = TemporaryFile()
+            self._file.write(self._data)
+            self._data = bytearray()
+
+    def _end_part(
+        self, data: memoryview
+    ) -> Optional[Tuple[str, Union[str, File]]]:
+        field_name = self._field_name
+        if not field_name:
+            return None
+        if (
+            self._data
+            or self._file
+            or self._file_name is not None
+            and self.spool_threshold is not None
+            and len(data) > self.spool_threshold
+        ):
+            self._write(data)
+            data, self._data = memoryview(self._data), bytearray()
+
+        value: Union[str, File]
+        if self._file_name is None:
+            value = str(data, self._charset)
+            self.fields.setdefault(field_name, []).append(value)
+        else:
+            body: Union[bytes, IO[bytes]]
+            if self._file:
+                body, self._file = self._file, None
+                body.seek(0)
+            else:
+                body = bytes(data)
+            value = File(
+                type=self._content_type, name=self._file_name, body=body
+            )
+            self.files.setdefault(field_name, []).append(value)
+        return field_name, value
+
+
+def parse_multipart_form(body, boundary):
+    """Parse a request body and returns fields and files
+
+    Args:
+        body (bytes): Bytes request body.
+        boundary (bytes): Bytes multipart boundary.
+
+    Returns:
+        Tuple[RequestParameters, RequestParameters]: A tuple containing fields and files as `RequestParameters`.
+    """  # noqa: E501
+    parser = MultipartParser(boundary)
+    parser.feed(body)
+    parser.close()
+    return RequestParameters(parser.fields), RequestParameters(parser.files)
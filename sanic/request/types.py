@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from asyncio import BaseProtocol
 from contextvars import ContextVar
+from functools import partial
 from inspect import isawaitable
 from types import SimpleNamespace
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     DefaultDict,
@@ -29,11 +31,14 @@ from sanic.models.http_types import Credentials
 if TYPE_CHECKING:
     from sanic.app import Sanic
     from sanic.config import Config
+    from sanic.http.http1 import Http
     from sanic.server import ConnInfo
+    from sanic.tracing import RequestTrace
 
 import uuid
 
 from collections import defaultdict
+from tempfile import TemporaryFile
 from urllib.parse import parse_qs, parse_qsl, urlunparse
 
 from httptools import parse_url
@@ -56,14 +61,16 @@ from sanic.headers import (
     parse_credentials,
     parse_forwarded,
     parse_host,
+    parse_http1_headers,
     parse_xforwarded,
 )
 from sanic.http import Stage
 from sanic.log import error_logger
 from sanic.models.protocol_types import TransportProtocol
 from sanic.response import BaseHTTPResponse, HTTPResponse
+from sanic.tracing import RESPONSE_MIDDLEWARE
 
-from .form import parse_multipart_form
+from .form import MultipartParser, parse_multipart_form
 from .parameters import RequestParameters
 
 
@@ -91,7 +98,8 @@ class Request(Generic[sanic_type, ctx_type]):
 
     Args:
         url_bytes (bytes): Raw URL bytes.
-        headers (Header): Request headers.
+        headers (Optional[Header]): Request headers. When `None`, the
+            headers are parsed from `head` the first time they are accessed.
         version (str): HTTP version.
         method (str): HTTP method.
         transport (TransportProtocol): Transport protocol.
@@ -118,13 +126,15 @@ class Request(Generic[sanic_type, ctx_type]):
         "_scheme",
         "_socket",
         "_stream_id",
+        "_headers",
+        "_host_header",
         "_match_info",
         "_name",
         "app",
         "body",
+        "body_file",
         "conn_info",
         "head",
-        "headers",
         "method",
         "parsed_accept",
         "parsed_args",
@@ -140,6 +150,7 @@ class Request(Generic[sanic_type, ctx_type]):
         "responded",
         "route",
         "stream",
+        "trace",
         "transport",
         "version",
     )
@@ -147,7 +158,7 @@ class Request(Generic[sanic_type, ctx_type]):
     def __init__(
         self,
         url_bytes: bytes,
-        headers: Header,
+        headers: Optional[Header],
         version: str,
         method: str,
         transport: TransportProtocol,
@@ -166,7 +177,12 @@ class Request(Generic[sanic_type, ctx_type]):
         self._stream_id = stream_id
         self.app = app
 
-        self.headers = Header(headers)
+        self._headers: Optional[Header] = (
+            headers
+            if headers is None or isinstance(headers, Header)
+            else Header(headers)
+        )
+        self._host_header: Optional[str] = None
         self.version = version
         self.method = method
         self.transport = transport
@@ -174,6 +190,7 @@ class Request(Generic[sanic_type, ctx_type]):
 
         # Init but do not inhale
         self.body = b""
+        self.body_file: Optional[IO[bytes]] = None
         self.conn_info: Optional[ConnInfo] = None
         self._ctx: Optional[ctx_type] = None
         self.parsed_accept: Optional[AcceptList] = None
@@ -195,6 +212,7 @@ class Request(Generic[sanic_type, ctx_type]):
         self.responded: bool = False
         self.route: Optional[Route] = None
         self.stream: Optional[Stream] = None
+        self.trace: Optional[RequestTrace] = None
         self._match_info: Dict[str, Any] = {}
         self._protocol: Optional[BaseProtocol] = None
 
@@ -399,9 +417,14 @@ class Request(Generic[sanic_type, ctx_type]):
             ) or self.app.response_middleware
             if middleware and not self._response_middleware_started:
                 self._response_middleware_started = True
+                trace = self.trace
+                if trace is not None:
+                    trace.begin(RESPONSE_MIDDLEWARE)
                 response = await self.app._run_response_middleware(
                     self, response, middleware
                 )
+                if trace is not None:
+                    trace.end(RESPONSE_MIDDLEWARE)
         except CancelledErrors:
             raise
         except Exception:
@@ -419,9 +442,83 @@ class Request(Generic[sanic_type, ctx_type]):
 
         Custom request classes can override this for custom handling of both
         streaming and non-streaming routes.
+
+        A body with a known length is received into a buffer of that size,
+        instead of being joined from chunks, and that `bytearray` is kept as
+        `request.body` without copying it to `bytes`. If the
+        `REQUEST_BODY_SPOOL_THRESHOLD` config value is set, bodies larger
+        than it are written to a temporary file instead, which is then
+        available as `request.body_file` while `request.body` stays empty.
         """
-        if not self.body:
-            self.body = b"".join([data async for data in self.stream])
+        if self.body or self.body_file is not None:
+            return
+
+        # Http or ASGIApp, which both stream the body
+        stream = cast("Http", self.stream)
+        threshold = self.app.config.REQUEST_BODY_SPOOL_THRESHOLD
+        size = (
+            stream.request_bytes_left
+            if stream.request_body is True and hasattr(stream, "readinto")
+            else None
+        )
+
+        if (
+            size is not None
+            # A body over the size limit is rejected by the stream once it
+            # is read, so the buffer must not be allocated before that
+            and size <= stream.request_max_size
+            and (threshold is None or size <= threshold)
+        ):
+            # Known length, receive directly into a preallocated buffer
+            body = bytearray(size)
+            with memoryview(body) as view:
+                pos = 0
+                while stream.request_body:
+                    pos += await stream.readinto(view[pos:])
+            self.body = body
+        elif threshold is None:
+            self.body = b"".join([data async for data in stream])
+        else:
+            await self._receive_body_spooled(threshold, size)
+
+    async def _receive_body_spooled(
+        self, threshold: int, size: Optional[int]
+    ) -> None:
+        stream = cast("Http", self.stream)
+        chunks: List[bytes] = []
+        file = None
+        try:
+            if size is not None:
+                file = TemporaryFile()
+                buffer = bytearray(
+                    min(size, self.app.config.REQUEST_BUFFER_SIZE)
+                )
+                with memoryview(buffer) as view:
+                    while stream.request_body:
+                        file.write(view[: await stream.readinto(view)])
+            else:
+                received = 0
+                async for data in stream:
+                    received += len(data)
+                    if file is not None:
+                        file.write(data)
+                    elif received > threshold:
+                        file = TemporaryFile()
+                        file.writelines(chunks)
+                        file.write(data)
+                        chunks.clear()
+                    else:
+                        chunks.append(data)
+        except BaseException:
+            if file is not None:
+                file.close()
+            raise
+
+        if file is None:
+            self.body = b"".join(chunks)
+        else:
+            file.seek(0)
+            self.body_file = file
 
     @property
     def name(self) -> Optional[str]:
@@ -473,6 +570,38 @@ class Request(Generic[sanic_type, ctx_type]):
             self._protocol = self.transport.get_protocol()
         return self._protocol  # type: ignore
 
+    @property
+    def headers(self) -> Header:
+        """The request headers
+
+        For HTTP/1.1 requests the headers are only parsed from the raw
+        request head when first accessed.
+
+        Returns:
+            Header: The request headers
+        """
+        if self._headers is None:
+            self._headers = parse_http1_headers(self.head)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Header) -> None:
+        self._headers = value
+
+    @property
+    def host_header(self) -> Optional[str]:
+        """The Host header of the request, as it is used for routing
+
+        Unlike `headers.getone("host")`, this does not parse the headers of
+        an HTTP/1.1 request that have not been parsed yet.
+
+        Returns:
+            Optional[str]: The Host header, or `None` if there is none
+        """
+        if self._headers is None:
+            return self._host_header
+        return self._headers.getone("host", None)
+
     @property
     def raw_headers(self) -> bytes:
         """The unparsed HTTP headers
@@ -566,13 +695,14 @@ class Request(Generic[sanic_type, ctx_type]):
         Returns:
             Any: The request body parsed as JSON
         """
+        body = self.body if self.body_file is None else self._read_body_file()
         try:
             if not loads:
                 loads = self.__class__._loads
 
-            self.parsed_json = loads(self.body)
+            self.parsed_json = loads(body)
         except Exception:
-            if not self.body:
+            if not body:
                 return None
             raise BadRequest("Failed when parsing body as json")
 
@@ -650,25 +780,110 @@ class Request(Generic[sanic_type, ctx_type]):
         content_type, parameters = parse_content_header(content_type)
         try:
             if content_type == "application/x-www-form-urlencoded":
+                body = (
+                    self.body
+                    if self.body_file is None
+                    else self._read_body_file()
+                )
                 self.parsed_form = RequestParameters(
                     parse_qs(
-                        self.body.decode("utf-8"),
+                        body.decode("utf-8"),
                         keep_blank_values=keep_blank_values,
                     )
                 )
             elif content_type == "multipart/form-data":
-                # TODO: Stream this instead of reading to/from memory
                 boundary = parameters["boundary"].encode(  # type: ignore
                     "utf-8"
                 )  # type: ignore
-                self.parsed_form, self.parsed_files = parse_multipart_form(
-                    self.body, boundary
-                )
+                if self.body_file is None:
+                    self.parsed_form, self.parsed_files = parse_multipart_form(
+                        self.body, boundary
+                    )
+                else:
+                    parser = MultipartParser(
+                        boundary,
+                        spool_threshold=(
+                            self.app.config.REQUEST_FILE_SPOOL_THRESHOLD
+                        ),
+                    )
+                    self.body_file.seek(0)
+                    for data in iter(
+                        partial(
+                            self.body_file.read,
+                            self.app.config.REQUEST_BUFFER_SIZE,
+                        ),
+                        b"",
+                    ):
+                        parser.feed(data)
+                    parser.close()
+                    self.body_file.seek(0)
+                    self.parsed_form = RequestParameters(parser.fields)
+                    self.parsed_files = RequestParameters(parser.files)
         except Exception:
             error_logger.exception("Failed when parsing form")
 
         return self.parsed_form
 
+    async def receive_form(self) -> Optional[RequestParameters]:
+        """Receive the body and parse it as form data, if not already done.
+
+        Streaming handlers may call this instead of `receive_body()`. A
+        multipart/form-data body is parsed while it is being received, so
+        it is never held in memory as a whole, and uploaded files larger
+        than the `REQUEST_FILE_SPOOL_THRESHOLD` config value are written to
+        temporary files. `request.body` is left empty in that case.
+
+        Other bodies are received in full and then parsed like
+        `request.form`.
+
+        Returns:
+            Optional[RequestParameters]: The parsed form data.
+        """
+        if self.parsed_form is not None:
+            return self.parsed_form
+
+        content_type, parameters = parse_content_header(
+            self.headers.getone("content-type", DEFAULT_HTTP_CONTENT_TYPE)
+        )
+        if (
+            content_type != "multipart/form-data"
+            or self.body
+            or self.body_file is not None
+        ):
+            await self.receive_body()
+            return self.form
+
+        boundary = parameters.get("boundary")
+        if not boundary:
+            raise BadRequest("Missing boundary in multipart/form-data")
+        parser = MultipartParser(
+            str(boundary).encode("utf-8"),
+            spool_threshold=self.app.config.REQUEST_FILE_SPOOL_THRESHOLD,
+        )
+        try:
+            async for data in cast("Http", self.stream):
+                parser.feed(data)
+        finally:
+            parser.close()
+        self.parsed_form = RequestParameters(parser.fields)
+        self.parsed_files = RequestParameters(parser.files)
+        return self.parsed_form
+
+    def _read_body_file(self) -> bytes:
+        self.body_file.seek(0)  # type: ignore
+        body = self.body_file.read()  # type: ignore
+        self.body_file.seek(0)  # type: ignore
+        return body
+
+    def _close_files(self) -> None:
+        """Close the temporary files that the body was spooled to."""
+        if self.body_file is not None:
+            self.body_file.close()
+        for uploads in (self.parsed_files or {}).values():
+            for upload in uploads:
+                if not isinstance(upload.body, bytes):
+                    upload.body.close()
+
     @property
     def form(self) -> Optional[RequestParameters]:
         """The request body parsed as form data
@@ -1,9 +1,11 @@
+from .cache import CachePolicy
 from .convenience import (
     empty,
     file,
     file_stream,
     html,
     json,
+    ranged,
     raw,
     redirect,
     text,
@@ -11,6 +13,7 @@ from .convenience import (
 )
 from .types import (
     BaseHTTPResponse,
+    FileResponse,
     HTTPResponse,
     JSONResponse,
     ResponseStream,
@@ -20,6 +23,8 @@ from .types import (
 
 __all__ = (
     "BaseHTTPResponse",
+    "CachePolicy",
+    "FileResponse",
     "HTTPResponse",
     "JSONResponse",
     "ResponseStream",
@@ -32,5 +37,6 @@ __all__ = (
     "file",
     "redirect",
     "file_stream",
+    "ranged",
     "json_dumps",
 )
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from asyncio import Future, get_running_loop
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from sanic.compat import Header
+from sanic.response.types import HTTPResponse
+
+
+if TYPE_CHECKING:
+    from sanic.request import Request
+    from sanic.response.types import BaseHTTPResponse
+
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+UNCACHEABLE_DIRECTIVES = ("no-store", "private", "no-cache")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How the responses of a route are cached by each worker.
+
+    A response is only cached when the request is a `GET`, and the response
+    is a plain `HTTPResponse` with a `200` status, that sets no cookies and
+    is not marked `no-store`, `no-cache` or `private`. Cached responses are
+    also served to `HEAD` requests.
+
+    ```python
+    @app.get("/feed", cache=CachePolicy(ttl=1.0, vary=("accept-language",)))
+    async def feed(request):
+        ...
+    ```
+
+    Args:
+        ttl (float): How long a response is served from the cache, in
+            seconds.
+        vary (Tuple[str, ...], optional): The request headers that the
+            response depends on. Requests with different values for these
+            headers are cached separately. Defaults to `()`.
+        max_entries (int, optional): The number of responses kept for the
+            route. When there are more, the least recently used one is
+            dropped. Defaults to `1024`.
+    """
+
+    ttl: float
+    vary: Tuple[str, ...] = ()
+    max_entries: int = 1024
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("CachePolicy.ttl must be greater than 0")
+        if self.max_entries < 1:
+            raise ValueError("CachePolicy.max_entries must be at least 1")
+        if isinstance(self.vary, str):
+            object.__setattr__(self, "vary", (self.vary,))
+        object.__setattr__(
+            self, "vary", tuple(header.lower() for header in self.vary)
+        )
+
+
+class CachedResponse:
+    """A response held in a `ResponseCache`."""
+
+    __slots__ = ("status", "headers", "body", "content_type", "expires")
+
+    def __init__(
+        self,
+        status: int,
+        headers: Tuple[Tuple[str, str], ...],
+        body: bytes,
+        content_type: Optional[str],
+        expires: float,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.content_type = content_type
+        self.expires = expires
+
+    def response(self) -> HTTPResponse:
+        """Build a new response from the cached one.
+
+        Returns:
+            HTTPResponse: The response, ready to be sent.
+        """
+        return HTTPResponse(
+            self.body,
+            status=self.status,
+            headers=Header(self.headers),
+            content_type=self.content_type,
+        )
+
+
+class ResponseCache:
+    """The cached responses of one route, in one worker.
+
+    Besides storing responses, the cache keeps track of the requests that
+    are being handled, so that concurrent requests for the same response
+    wait for the first one instead of all running the handler.
+
+    .. note::
+        This is used internally by `RoutePipeline`, and should not
+        typically need to be instantiated directly.
+
+    Args:
+        policy (CachePolicy): The cache policy of the route.
+    """
+
+    __slots__ = ("policy", "entries", "flights")
+
+    def __init__(self, policy: CachePolicy) -> None:
+        self.policy = policy
+        self.entries: OrderedDict[Tuple, CachedResponse] = OrderedDict()
+        self.flights: Dict[Tuple, Future] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def key(self, request: Request) -> Tuple:
+        """The key that a request is cached under.
+
+        Args:
+            request (Request): The current request object.
+
+        Returns:
+            Tuple: The host, path and query string of the request, and the
+                values of the headers that the response varies on.
+        """
+        headers = request.headers
+        return (
+            request.host,
+            request.path,
+            request.query_string,
+            *(headers.get(name) for name in self.policy.vary),
+        )
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        """Get a response that has not expired.
+
+        Args:
+            key (Tuple): The key of the request.
+
+        Returns:
+            Optional[CachedResponse]: The cached response, if there is one.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def store(
+        self, key: Tuple, response: BaseHTTPResponse
+    ) -> Optional[CachedResponse]:
+        """Store a response, if it may be cached.
+
+        Args:
+            key (Tuple): The key of the request.
+            response (BaseHTTPResponse): The response, after the response
+                middleware has run, and before it is sent.
+
+        Returns:
+            Optional[CachedResponse]: The cached response, or `None` if the
+                response may not be cached.
+        """
+        if not self.cacheable(response):
+            return None
+        entry = CachedResponse(
+            response.status,
+            tuple(response.headers.items()),
+            response.body or b"",
+            response.content_type,
+            monotonic() + self.policy.ttl,
+        )
+        entries = self.entries
+        entries[key] = entry
+        entries.move_to_end(key)
+        while len(entries) > self.policy.max_entries:
+            entries.popitem(last=False)
+        return entry
+
+    def start(self, key: Tuple) -> Optional[Future]:
+        """Start handling a request, unless it is already being handled.
+
+        Args:
+            key (Tuple): The key of the request.
+
+        Returns:
+            Optional[Future]: If another request with the same key is being
+                handled, a future that resolves to its cached response, or
+                to `None` if it was not cached. Otherwise, `None`, and the
+                caller must call `finish` when it is done.
+        """
+        flight = self.flights.get(key)
+        if flight is not None:
+            return flight
+        self.flights[key] = get_running_loop().create_future()
+        return None
+
+    def finish(self, key: Tuple) -> None:
+        """Finish handling a request, and wake up the requests waiting on it.
+
+        Args:
+            key (Tuple): The key of the request.
+        """
+        flight = self.flights.pop(key, None)
+        if flight is not None and not flight.done():
+            flight.set_result(self.get(key))
+
+    @staticmethod
+    def cacheable(response: BaseHTTPResponse) -> bool:
+        """Check whether a response may be cached.
+
+        Args:
+            response (BaseHTTPResponse): The response.
+
+        Returns:
+            bool: `True` if the response may be cached.
+        """
+        if not isinstance(response, HTTPResponse):
+            return False
+        if response.status != 200 or "set-cookie" in response.headers:
+            return False
+        cache_control = response.headers.get("cache-control", "").lower()
+        return not any(
+            directive in cache_control for directive in UNCACHEABLE_DIRECTIVES
+        )
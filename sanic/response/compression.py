@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import zlib
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Type
+
+from sanic.headers import parse_accept_encoding
+from sanic.helpers import has_message_body
+
+
+if TYPE_CHECKING:
+    from sanic.response.types import BaseHTTPResponse
+
+try:
+    try:
+        import brotli
+    except ImportError:  # no cov
+        import brotlicffi as brotli  # type: ignore
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+class Compressor:
+    """Compresses the body of a response, either at once or in parts.
+
+    Every part that is compressed is flushed, so that the client can decode
+    everything that has been sent so far. This keeps streaming responses
+    flowing, at some cost to the compression ratio.
+    """
+
+    __slots__ = ()
+
+    encoding = ""
+
+    def compress(self, data: bytes) -> bytes:  # no cov
+        """Compress a part of the body.
+
+        Args:
+            data (bytes): The part of the body.
+
+        Returns:
+            bytes: The compressed data, flushed.
+        """
+        raise NotImplementedError
+
+    def finish(self, data: bytes = b"") -> bytes:  # no cov
+        """Compress the last part of the body, and end the compressed stream.
+
+        Args:
+            data (bytes, optional): The last part of the body. Defaults
+                to `b""`.
+
+        Returns:
+            bytes: The rest of the compressed data.
+        """
+        raise NotImplementedError
+
+
+class GzipCompressor(Compressor):
+    """Compressor for the `gzip` content coding."""
+
+    __slots__ = ("_compressobj",)
+
+    encoding = "gzip"
+    WBITS = 31
+
+    def __init__(self, level: int = 6) -> None:
+        self._compressobj = zlib.compressobj(level, zlib.DEFLATED, self.WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        compressobj = self._compressobj
+        return compressobj.compress(data) + compressobj.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes = b"") -> bytes:
+        compressobj = self._compressobj
+        return compressobj.compress(data) + compressobj.flush()
+
+
+class DeflateCompressor(GzipCompressor):
+    """Compressor for the `deflate` content coding (zlib format)."""
+
+    __slots__ = ()
+
+    encoding = "deflate"
+    WBITS = 15
+
+
+class BrotliCompressor(Compressor):
+    """Compressor for the `br` content coding.
+
+    Requires the `brotli` or `brotlicffi` package.
+    """
+
+    __slots__ = ("_compressor",)
+
+    encoding = "br"
+
+    def __init__(self, level: int = 4) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = self._compressor
+        return compressor.process(data) + compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        compressor = self._compressor
+        return compressor.process(data) + compressor.finish()
+
+
+class ZstdCompressor(Compressor):
+    """Compressor for the `zstd` content coding.
+
+    Requires the `zstandard` package.
+    """
+
+    __slots__ = ("_compressobj",)
+
+    encoding = "zstd"
+
+    def __init__(self, level: int = 3) -> None:
+        self._compressobj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        compressobj = self._compressobj
+        return compressobj.compress(data) + compressobj.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self, data: bytes = b"") -> bytes:
+        compressobj = self._compressobj
+        return compressobj.compress(data) + compressobj.flush()
+
+
+COMPRESSORS: Dict[str, Type[Compressor]] = {
+    "gzip": GzipCompressor,
+    "deflate": DeflateCompressor,
+}
+if BROTLI_AVAILABLE:
+    COMPRESSORS["br"] = BrotliCompressor
+if ZSTD_AVAILABLE:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+# File name suffixes of precompressed files, by content coding
+PRECOMPRESSED_SUFFIXES: Dict[str, str] = {
+    "br": ".br",
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+
+def accepted_encodings(
+    accept_encoding: Optional[str], encodings: Sequence[str]
+) -> List[str]:
+    """Rank the content codings that a client accepts.
+
+    Codings are ordered by their quality in the Accept-Encoding header.
+    Ties are decided by the order of `encodings`. Codings with a quality
+    of zero are left out.
+
+    Args:
+        accept_encoding (Optional[str]): The Accept-Encoding header value.
+        encodings (Sequence[str]): The codings that may be used, in order
+            of preference.
+
+    Returns:
+        List[str]: The accepted codings, best first.
+    """
+    codings = parse_accept_encoding(accept_encoding)
+    if not codings:
+        return []
+    wildcard = codings.get("*", 0.0)
+    ranked = [
+        (codings.get(encoding, wildcard), encoding) for encoding in encodings
+    ]
+    # sorted is stable, so equal qualities keep the order of preference
+    return [
+        encoding
+        for quality, encoding in sorted(ranked, key=lambda x: -x[0])
+        if quality > 0
+    ]
+
+
+def negotiate_encoding(
+    accept_encoding: Optional[str], encodings: Sequence[str]
+) -> Optional[str]:
+    """Choose a content coding for a response.
+
+    See `accepted_encodings`. Codings that are not available are skipped.
+
+    Args:
+        accept_encoding (Optional[str]): The Accept-Encoding header value.
+        encodings (Sequence[str]): The codings that may be used, in order
+            of preference.
+
+    Returns:
+        Optional[str]: The coding to use, or `None` to send the response
+            as it is.
+    """
+    for encoding in accepted_encodings(accept_encoding, encodings):
+        if encoding in COMPRESSORS:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: Optional[str], types: Sequence[str]) -> bool:
+    """Check a content type against an allowlist of types.
+
+    An entry that ends with `/` matches every subtype, such as `text/`. One
+    that starts with `+` matches a structured syntax suffix, such as `+json`.
+    Any other entry must match the type exactly.
+
+    Args:
+        content_type (Optional[str]): The Content-Type header value.
+        types (Sequence[str]): The allowlist.
+
+    Returns:
+        bool: Whether responses of the type may be compressed.
+    """
+    if not content_type:
+        return False
+    mime = content_type.partition(";")[0].strip().lower()
+    for allowed in types:
+        if allowed.endswith("/"):
+            if mime.startswith(allowed):
+                return True
+        elif allowed.startswith("+"):
+            if mime.endswith(allowed):
+                return True
+        elif mime == allowed:
+            return True
+    return False
+
+
+def start_compression(
+    response: BaseHTTPResponse, data: bytes, end_stream: bool
+) -> Optional[Compressor]:
+    """Decide whether to compress a response, when it is first sent.
+
+    If the response qualifies, a Vary header is added for Accept-Encoding,
+    whether or not the client accepts any coding. If a coding is chosen,
+    the Content-Encoding header is set, Content-Length is removed because
+    it no longer applies, and a strong ETag is made weak.
+
+    Args:
+        response (BaseHTTPResponse): The response, connected to a stream.
+        data (bytes): The data of the first send.
+        end_stream (bool): Whether the first send is also the last.
+
+    Returns:
+        Optional[Compressor]: The compressor for the body, if any.
+    """
+    request = getattr(response.stream, "request", None)
+    if request is None:
+        return None
+    config = request.app.config
+    if not config.COMPRESSION:
+        return None
+
+    headers = response.headers
+    body = response.body
+    if end_stream:
+        size = len(data) + (len(body) if body else 0)
+    elif body:
+        # Some protocols send the body as a whole even without end_stream
+        return None
+    else:
+        size = int(headers.get("content-length", config.COMPRESSION_MIN_SIZE))
+    if (
+        size < max(config.COMPRESSION_MIN_SIZE, 1)
+        or response.status == 206
+        or not has_message_body(response.status)
+        or "content-encoding" in headers
+        or "no-transform" in headers.get("cache-control", "")
+        or not is_compressible(
+            headers.get("content-type") or response.content_type,
+            config.COMPRESSION_TYPES,
+        )
+    ):
+        return None
+
+    vary = headers.get("vary")
+    if not vary:
+        headers["vary"] = "Accept-Encoding"
+    elif vary != "*" and "accept-encoding" not in vary.lower():
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+    encoding = negotiate_encoding(
+        request.headers.get("accept-encoding"), config.COMPRESSION_ENCODINGS
+    )
+    if encoding is None:
+        return None
+
+    headers["content-encoding"] = encoding
+    headers.pop("content-length", None)
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
+    return COMPRESSORS[encoding]()
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from email.utils import formatdate, parsedate_to_datetime
+from inspect import isawaitable
 from mimetypes import guess_type
 from os import path
 from pathlib import PurePath
 from time import time
-from typing import Any, AnyStr, Callable, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, AnyStr, Callable, Dict, Optional, Union
 from urllib.parse import quote_plus
 
 from sanic.compat import Header, open_async, stat_async
 from sanic.constants import DEFAULT_HTTP_CONTENT_TYPE
+from sanic.exceptions import HeaderNotFound
 from sanic.helpers import Default, _default
 from sanic.log import logger
 from sanic.models.protocol_types import HTMLProtocol, Range
@@ -18,6 +20,10 @@ from sanic.models.protocol_types import HTMLProtocol, Range
 from .types import HTTPResponse, JSONResponse, ResponseStream
 
 
+if TYPE_CHECKING:
+    from sanic.request import Request
+
+
 def empty(
     status: int = 204, headers: Optional[Dict[str, str]] = None
 ) -> HTTPResponse:
@@ -229,7 +235,7 @@ async def file(
         last_modified (Optional[Union[datetime, float, int, Default]], optional): The last modified date and time of the file.
         max_age (Optional[Union[float, int]], optional): Max age for cache control.
         no_store (Optional[bool], optional): Any cache should not store this response. Defaults to None.
-        _range (Optional[Range], optional):
+        _range (Optional[Range], optional): The range of bytes to send. A `ContentRangeHandler` with several ranges is sent as `multipart/byteranges`.
 
     Returns:
         HTTPResponse: The response object with the file data.
@@ -279,8 +285,21 @@ async def file(
 
     filename = filename or path.split(location)[-1]
 
+    mime_type = mime_type or guess_type(filename)[0] or "text/plain"
+    content_type = mime_type
+
     async with await open_async(location, mode="rb") as f:
-        if _range:
+        if getattr(_range, "multipart", False):
+            parts = []
+            for header, offset, size in _range.parts(mime_type):  # type: ignore
+                await f.seek(offset)
+                parts.append(header)
+                parts.append(await f.read(size))
+            parts.append(_range.multipart_end)  # type: ignore
+            out_stream = b"".join(parts)
+            content_type = _range.content_type  # type: ignore
+            status = 206
+        elif _range:
             await f.seek(_range.start)
             out_stream = await f.read(_range.size)
             headers["Content-Range"] = (
@@ -290,12 +309,11 @@ async def file(
         else:
             out_stream = await f.read()
 
-    mime_type = mime_type or guess_type(filename)[0] or "text/plain"
     return HTTPResponse(
         body=out_stream,
         status=status,
         headers=headers,
-        content_type=mime_type,
+        content_type=content_type,
     )
 
 
@@ -354,7 +372,7 @@ async def file_stream(
         mime_type (Optional[str], optional): Specific mime_type.
         headers (Optional[Dict[str, str]], optional): Custom HTTP headers.
         filename (Optional[str], optional): Override filename.
-        _range (Optional[Range], optional): The range of bytes to send.
+        _range (Optional[Range], optional): The range of bytes to send. A `ContentRangeHandler` with several ranges is sent as `multipart/byteranges`.
     """  # noqa: E501
     headers = headers or {}
     if filename:
@@ -363,7 +381,12 @@ async def file_stream(
         )
     filename = filename or path.split(location)[-1]
     mime_type = mime_type or guess_type(filename)[0] or "text/plain"
-    if _range:
+    content_type = mime_type
+    multipart = getattr(_range, "multipart", False)
+    if multipart:
+        content_type = _range.content_type  # type: ignore
+        status = 206
+    elif _range:
         start = _range.start
         end = _range.end
         total = _range.total
@@ -373,7 +396,20 @@ async def file_stream(
 
     async def _streaming_fn(response):
         async with await open_async(location, mode="rb") as f:
-            if _range:
+            if multipart:
+                for header, offset, size in _range.parts(  # type: ignore
+                    mime_type
+                ):
+                    await response.write(header)
+                    await f.seek(offset)
+                    while size > 0:
+                        content = await f.read(min(size, chunk_size))
+                        if len(content) < 1:
+                            break
+                        size -= len(content)
+                        await response.write(content)
+                await response.write(_range.multipart_end)  # type: ignore
+            elif _range:
                 await f.seek(_range.start)
                 to_send = _range.size
                 while to_send > 0:
@@ -393,5 +429,142 @@ async def file_stream(
         streaming_fn=_streaming_fn,
         status=status,
         headers=headers,
-        content_type=mime_type,
+        content_type=content_type,
+    )
+
+
+def ranged(
+    request: Request,
+    body: Union[AnyStr, Any],
+    status: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    content_type: str = DEFAULT_HTTP_CONTENT_TYPE,
+    size: Optional[int] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[Union[datetime, float, int]] = None,
+    chunk_size: int = 65536,
+) -> Union[HTTPResponse, ResponseStream]:
+    """Return a response that honours the Range header of the request.
+
+    The body is either content in memory, or a seekable source such as an
+    open file or an aiofiles handle, whose `seek` and `read` methods may be
+    coroutines. A source is streamed from, and never read as a whole.
+
+    When the request asks for a range, a `206` response is sent with only
+    that part of the body, or a `multipart/byteranges` body for several
+    ranges. See `ContentRangeHandler`. Without a range, or when the
+    If-Range header does not match `etag` or `last_modified`, the whole
+    body is sent.
+
+    Args:
+        request (Request): The current request object.
+        body (Union[AnyStr, Any]): The content, or a seekable source.
+        status (int, optional): HTTP response code when the whole body is sent. A range is only applied to a `200`. Defaults to `200`.
+        headers (Optional[Dict[str, str]], optional): Custom HTTP headers. Defaults to `None`.
+        content_type (str, optional): The content type of the body. Defaults to `"application/octet-stream"`.
+        size (Optional[int], optional): The size of a seekable source. Required for a source. Defaults to `None`.
+        etag (Optional[str], optional): The ETag of the content, sent and used to validate If-Range. Defaults to `None`.
+        last_modified (Optional[Union[datetime, float, int]], optional): When the content was last modified, sent and used to validate If-Range. Defaults to `None`.
+        chunk_size (int, optional): The size of each chunk read from a source. Defaults to `65536`.
+
+    Raises:
+        RangeNotSatisfiable: If the requested range is invalid.
+
+    Returns:
+        Union[HTTPResponse, ResponseStream]: The response to return.
+
+    Examples:
+        ```python
+        @app.get("/report")
+        async def report(request):
+            data = await build_report()
+            return ranged(request, data, content_type="text/csv")
+        ```
+    """  # noqa: E501
+    # The handlers import sanic.response, so this cannot be imported first
+    from sanic.handlers.content_range import (
+        ContentRangeHandler,
+        ContentStats,
+    )
+
+    headers = headers or {}
+    headers["Accept-Ranges"] = "bytes"
+    if etag:
+        headers.setdefault("ETag", etag)
+    if isinstance(last_modified, datetime):
+        last_modified = last_modified.timestamp()
+    if last_modified is not None:
+        headers.setdefault(
+            "Last-Modified", formatdate(last_modified, usegmt=True)
+        )
+
+    source = hasattr(body, "seek")
+    if not source:
+        data: bytes = body.encode() if isinstance(body, str) else body
+        size = len(data)
+    elif size is None:
+        raise ValueError("The size of a seekable source must be given")
+
+    _range = None
+    if status == 200 and request.method != "HEAD":
+        try:
+            _range = ContentRangeHandler(
+                request,
+                ContentStats(size, last_modified),  # type: ignore
+                etag=headers.get("ETag"),
+            )
+        except HeaderNotFound:
+            pass
+
+    if _range and _range.multipart:
+        parts = _range.parts(content_type)
+        content_type, part_type = _range.content_type, content_type
+        status = 206
+    elif _range:
+        headers.update(_range.headers)
+        parts = [(b"", _range.start, _range.size)]
+        status = 206
+    else:
+        parts = [(b"", 0, size)]  # type: ignore
+
+    if not source:
+        if _range:
+            data = b"".join(
+                header + data[offset : offset + length]
+                for header, offset, length in parts
+            )
+            if _range.multipart:
+                data += _range.multipart_end
+        return HTTPResponse(
+            data, status=status, headers=headers, content_type=content_type
+        )
+
+    if _range and _range.multipart:
+        headers["Content-Length"] = str(_range.multipart_size(part_type))
+    else:
+        headers["Content-Length"] = str(parts[0][2])
+
+    async def _streaming_fn(response):
+        for header, offset, length in parts:
+            if header:
+                await response.write(header)
+            position = body.seek(offset)
+            if isawaitable(position):
+                await position
+            while length > 0:
+                content = body.read(min(length, chunk_size))
+                if isawaitable(content):
+                    content = await content
+                if not content:
+                    break
+                length -= len(content)
+                await response.write(content)
+        if _range and _range.multipart:
+            await response.write(_range.multipart_end)
+
+    return ResponseStream(
+        streaming_fn=_streaming_fn,
+        status=status,
+        headers=headers,
+        content_type=content_type,
     )
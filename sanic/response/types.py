@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime
 from functools import partial
+from mimetypes import guess_type
+from pathlib import PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,13 +12,15 @@ from typing import (
     Coroutine,
     Dict,
     Iterator,
+    List,
     Optional,
     Tuple,
     TypeVar,
     Union,
+    cast,
 )
 
-from sanic.compat import Header
+from sanic.compat import Header, open_async, stat_async
 from sanic.cookies import CookieJar
 from sanic.cookies.response import Cookie, SameSite
 from sanic.exceptions import SanicException, ServerError
@@ -27,6 +31,8 @@ from sanic.helpers import (
     remove_entity_headers,
 )
 from sanic.http import Http
+from sanic.models.protocol_types import Range
+from sanic.response.compression import start_compression
 
 
 if TYPE_CHECKING:
@@ -59,6 +65,7 @@ class BaseHTTPResponse:
         "stream",
         "status",
         "headers",
+        "_compressor",
         "_cookies",
     )
 
@@ -71,6 +78,7 @@ class BaseHTTPResponse:
         self.stream: Optional[Union[Http, ASGIApp, HTTPReceiver]] = None
         self.status: int = None
         self.headers = Header({})
+        self._compressor: Any = _default
         self._cookies: Optional[CookieJar] = None
 
     def __repr__(self):
@@ -139,11 +147,24 @@ class BaseHTTPResponse:
                 "Response stream was ended, no more response data is "
                 "allowed to be sent."
             )
-        data = data.encode() if hasattr(data, "encode") else data or b""  # type: ignore
-        await self.stream.send(
-            data,  # type: ignore
-            end_stream=end_stream or False,
-        )
+        chunk: bytes = data.encode() if isinstance(data, str) else data or b""
+        compressor = self._compressor
+        if compressor is _default:
+            # Decided when the headers are about to be sent
+            compressor = self._compressor = start_compression(
+                self, chunk, bool(end_stream)
+            )
+            if compressor and self.body:
+                self.body = compressor.finish(self.body + chunk)
+                chunk, compressor = b"", None
+                self._compressor = None
+        if compressor and (chunk or end_stream):
+            if end_stream:
+                chunk = compressor.finish(chunk)
+                self._compressor = None
+            else:
+                chunk = compressor.compress(chunk)
+        await self.stream.send(chunk, end_stream=end_stream or False)
 
     def add_cookie(
         self,
@@ -499,6 +520,134 @@ class JSONResponse(HTTPResponse):
         return value
 
 
+class FileResponse(BaseHTTPResponse):
+    """HTTP response with the body sent from a file on disk.
+
+    Nothing is read before the response is sent. On plain HTTP/1.1
+    connections the file is written to the socket with the event loop's
+    sendfile, without passing the data through Python. Where that is not
+    available (TLS, HTTP/3, ASGI, or uvloop) the file is read and sent in
+    chunks instead.
+
+    Args:
+        location (Union[str, PurePath]): Location of the file on the system.
+        status (int, optional): HTTP response code. Ignored if a range is given, which is always sent as a `206`. Defaults to `200`.
+        headers (Optional[Union[Header, Dict[str, str]]], optional): Headers to be returned. Defaults to `None`.
+        content_type (Optional[str], optional): Content type to be returned (as a header). Guessed from the file name if not given. Defaults to `None`.
+        size (Optional[int], optional): Size of the file, if already known. Defaults to `None`.
+        chunk_size (int, optional): Size of the chunks read when the file cannot be sent with sendfile. Defaults to `65536`.
+        _range (Optional[Range], optional): The range of bytes to send. A `ContentRangeHandler` with several ranges is sent as `multipart/byteranges`. Defaults to `None`.
+    """  # noqa: E501
+
+    __slots__ = ("location", "size", "chunk_size", "_range", "_parts")
+
+    def __init__(
+        self,
+        location: Union[str, PurePath],
+        status: int = 200,
+        headers: Optional[Union[Header, Dict[str, str]]] = None,
+        content_type: Optional[str] = None,
+        size: Optional[int] = None,
+        chunk_size: int = 65536,
+        _range: Optional[Range] = None,
+    ):
+        super().__init__()
+
+        self.location = location
+        self.size = size
+        self.chunk_size = chunk_size
+        self._range = _range
+        self.content_type = (
+            content_type or guess_type(str(location))[0] or "text/plain"
+        )
+        self.status = status
+        self.headers = Header(headers or {})
+        self._parts: Optional[List[Tuple[bytes, int, int]]] = None
+        if getattr(_range, "multipart", False):
+            self.status = 206
+            self._parts = _range.parts(self.content_type)  # type: ignore
+            self.content_type = _range.content_type  # type: ignore
+        elif _range:
+            self.status = 206
+            self.headers["Content-Range"] = (
+                f"bytes {_range.start}-{_range.end}/{_range.total}"
+            )
+
+    async def send(
+        self,
+        data: Optional[AnyStr] = None,
+        end_stream: Optional[bool] = None,
+    ) -> None:
+        """Send the response headers followed by the file.
+
+        The whole response is sent by one call. Passing any data is not
+        allowed, since the body comes from the file.
+
+        Args:
+            data (Optional[AnyStr], optional): Must be empty. Defaults to `None`.
+            end_stream (Optional[bool], optional): Ignored, the stream is always ended. Defaults to `None`.
+        """  # noqa: E501
+        if data:
+            raise ServerError("The body of a FileResponse comes from a file.")
+        if self.stream is None:
+            raise SanicException(
+                "No stream is connected to the response object instance."
+            )
+        if self.stream.send is None:
+            return
+
+        head_only = getattr(self.stream, "head_only", False)
+        if self._parts is not None:
+            end = self._range.multipart_end  # type: ignore
+            self.headers["content-length"] = len(end) + sum(
+                len(header) + size for header, _, size in self._parts
+            )
+            if head_only:
+                await super().send(b"", True)
+                return
+            for header, offset, size in self._parts:
+                await super().send(header, False)
+                await self._send_file(offset, size, False)
+            await super().send(end, True)
+            return
+
+        if self._range:
+            # The range of the request is known to apply to the file
+            offset = cast(int, self._range.start)
+            size = cast(int, self._range.size)
+        else:
+            file_size = self.size
+            if file_size is None:
+                file_size = (await stat_async(self.location)).st_size
+                self.size = file_size
+            offset, size = 0, file_size
+        self.headers["content-length"] = size
+
+        if not size or head_only:
+            await super().send(b"", True)
+            return
+        await self._send_file(offset, size, True)
+
+    async def _send_file(self, offset: int, size: int, end_stream: bool):
+        sendfile = getattr(self.stream, "sendfile", None)
+        if sendfile is not None:
+            await super().send(b"", False)
+        if sendfile is not None and not self._compressor:
+            sent = await sendfile(self.location, offset, size)
+            offset, size = offset + sent, size - sent
+            if not size:
+                return
+
+        async with await open_async(self.location, mode="rb") as f:
+            await f.seek(offset)
+            while size > 0:
+                chunk = await f.read(min(size, self.chunk_size))
+                if not chunk:
+                    raise ServerError("File is smaller than expected")
+                size -= len(chunk)
+                await super().send(chunk, end_stream and size <= 0)
+
+
 class ResponseStream:
     """A compat layer to bridge the gap after the deprecation of StreamingHTTPResponse.
 
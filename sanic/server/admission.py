@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, Future, get_running_loop, sleep, wait
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+from sanic.metrics import REQUESTS_QUEUED, REQUESTS_SHED, REQUESTS_WAITING
+
+
+if TYPE_CHECKING:
+    from sanic_routing.route import Route
+
+    from sanic import Sanic
+    from sanic.request import Request
+    from sanic.worker.multiplexer import WorkerMultiplexer
+
+
+AdmissionHook = Callable[["Request"], bool]
+
+
+class RequestShed(Exception):
+    """Raised when a request is not admitted, to send the shed response."""
+
+
+class ConcurrencyLimit:
+    """Limits how many tasks run at once, with a queue for the others.
+
+    Up to `limit` tasks run at the same time. The tasks that start while
+    they are all taken wait in a queue of up to `queue_size` tasks, for up
+    to `queue_timeout` seconds, and then run in the order that they
+    arrived: the slot of a task that is released is handed over to the
+    first task that waits. A task that finds the queue full, or that is
+    still waiting when its time is up, is shed.
+
+    Args:
+        limit (int): The number of tasks that can run at the same time.
+        queue_size (int, optional): The number of tasks that can wait.
+            Defaults to `0`.
+        queue_timeout (Optional[float], optional): How long a task can
+            wait, in seconds, or `None` for no limit. Defaults to `None`.
+        name (str, optional): The name of what is limited. Defaults to
+            `""`.
+    """
+
+    __slots__ = (
+        "in_flight",
+        "limit",
+        "name",
+        "queue_size",
+        "queue_timeout",
+        "queued",
+        "shed",
+        "_waiters",
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        queue_size: int = 0,
+        queue_timeout: Optional[float] = None,
+        name: str = "",
+    ) -> None:
+        if limit < 1 or queue_size < 0:
+            raise ValueError(
+                "A concurrency limit must be at least 1, and cannot have a "
+                "negative queue size"
+            )
+        self.limit = limit
+        self.name = name
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.queued = 0
+        self.shed = 0
+        self._waiters: Deque[Future[None]] = deque()
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self.in_flight}/{self.limit} "
+            f"in flight, {self.waiting}/{self.queue_size} waiting>"
+        )
+
+    @property
+    def waiting(self) -> int:
+        """The number of tasks that are waiting."""
+        return len(self._waiters)
+
+    def status(self) -> Dict[str, int]:
+        """The limits and the current use.
+
+        Returns:
+            Dict[str, int]: The limit, queue size, and number of tasks that
+                run, that wait, and that have been shed.
+        """
+        return {
+            "max_concurrency": self.limit,
+            "queue": self.queue_size,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "shed": self.shed,
+        }
+
+    async def acquire(self) -> bool:
+        """Wait for a slot.
+
+        A task that gets a slot must release it with `release` once it is
+        done.
+
+        Returns:
+            bool: Whether the task got a slot, or else was shed.
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        return await self._wait()
+
+    def release(self) -> None:
+        """Release the slot of a task that is done."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    async def _wait(self) -> bool:
+        if len(self._waiters) >= self.queue_size:
+            self.shed += 1
+            return False
+        waiter: Future[None] = get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await wait((waiter,), timeout=self.queue_timeout)
+        except CancelledError:
+            if waiter.done():
+                # The slot was handed over as the task was cancelled
+                self.release()
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+        if waiter.cancelled():
+            self.shed += 1
+            return False
+        # The slot of the task that was released has been handed over
+        return True
+
+
+class AdmissionControl(ConcurrencyLimit):
+    """Limits how many requests a worker handles at once.
+
+    Up to `max_requests` requests are handled at the same time, and up to
+    `queue_size` more wait for up to `queue_timeout` seconds, see
+    `ConcurrencyLimit`. A request that is shed gets a 503 response with a
+    `Retry-After` header, which is built once and sent without running any
+    middleware or handler.
+
+    A request that a hook returns `True` for, such as a health check,
+    bypasses the limit. The hooks are called with the request once its
+    head has been received, before it has been routed.
+
+    .. note::
+        This is used internally by Sanic when `ADMISSION_MAX_REQUESTS` is
+        set, and should not typically need to be instantiated directly.
+
+    Args:
+        app (Sanic): The application.
+        max_requests (int): The number of requests that can be handled at
+            the same time.
+        queue_size (int): The number of requests that can wait.
+        queue_timeout (float): How long a request can wait, in seconds.
+        retry_after (int): The value of the `Retry-After` header of the
+            shed responses, in seconds.
+        hooks (List[AdmissionHook]): The functions that let a request
+            bypass the limit.
+    """
+
+    __slots__ = (
+        "app",
+        "hooks",
+        "_responses",
+    )
+
+    def __init__(
+        self,
+        app: Sanic,
+        max_requests: int,
+        queue_size: int,
+        queue_timeout: float,
+        retry_after: int,
+        hooks: List[AdmissionHook],
+    ) -> None:
+        super().__init__(max_requests, queue_size, queue_timeout, "admission")
+        self.app = app
+        self.hooks = hooks
+        # The shed responses, that close the connection and that keep it
+        self._responses = tuple(
+            (
+                b"HTTP/1.1 503 Service Unavailable\r\n"
+                b"content-length: 0\r\n"
+                b"retry-after: %d\r\n"
+                b"connection: %s\r\n\r\n"
+            )
+            % (retry_after, connection)
+            for connection in (b"close", b"keep-alive")
+        )
+
+    def response(self, keep_alive: bool) -> bytes:
+        """The response to send to a request that is shed.
+
+        Args:
+            keep_alive (bool): Whether to keep the connection alive.
+
+        Returns:
+            bytes: The response.
+        """
+        return self._responses[keep_alive]
+
+    async def acquire(self, request: Request) -> bool:  # type: ignore
+        """Wait for the request to be admitted.
+
+        A request that is admitted must be released with `release` once
+        it has been handled.
+
+        Args:
+            request (Request): The request.
+
+        Returns:
+            bool: Whether the request was admitted, or else shed.
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        if any(hook(request) for hook in self.hooks):
+            self.in_flight += 1
+            return True
+        metrics = self.app.metrics
+        if metrics is None:
+            return await self._wait()
+        waits = len(self._waiters) < self.queue_size
+        if waits:
+            metrics.add(REQUESTS_QUEUED)
+            metrics.add(REQUESTS_WAITING)
+        try:
+            admitted = await self._wait()
+        finally:
+            if waits:
+                metrics.add(REQUESTS_WAITING, -1)
+        if not admitted:
+            metrics.add(REQUESTS_SHED)
+        return admitted
+
+
+def concurrency_limits(routes: Iterable[Route]) -> Dict[str, ConcurrencyLimit]:
+    """The concurrency limits of some routes and of their blueprints.
+
+    Args:
+        routes (Iterable[Route]): The routes.
+
+    Returns:
+        Dict[str, ConcurrencyLimit]: The limits, by the name of the route
+            or of the blueprint.
+    """
+    limits: Dict[str, ConcurrencyLimit] = {}
+    for route in routes:
+        limit = getattr(route.extra, "blueprint_limit", None)
+        if limit is not None:
+            limits[limit.name] = limit
+        limit = getattr(route.extra, "concurrency_limit", None)
+        if limit is not None:
+            limits[route.name] = limit
+    return limits
+
+
+async def report_limits(
+    multiplexer: WorkerMultiplexer,
+    limits: Dict[str, ConcurrencyLimit],
+    interval: float = 1.0,
+) -> None:
+    """Keep the status of some limits in the state of the worker.
+
+    The state is only updated when the status has changed, and is shown
+    by the Inspector.
+
+    Args:
+        multiplexer (WorkerMultiplexer): The multiplexer of the worker.
+        limits (Dict[str, ConcurrencyLimit]): The limits, by name.
+        interval (float, optional): The time between two checks, in
+            seconds. Defaults to `1.0`.
+    """
+    reported = None
+    while True:
+        status = {name: limit.status() for name, limit in limits.items()}
+        if status != reported:
+            multiplexer.state.update({"concurrency_limits": status})
+            reported = status
+        await sleep(interval)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import sys
+
+from asyncio import AbstractEventLoop, TimerHandle
+from datetime import datetime, timezone
+from threading import Event, Thread, get_ident
+from time import monotonic as current_time
+from traceback import format_stack
+from types import FrameType
+from typing import TYPE_CHECKING, Optional, cast
+
+from sanic.log import logger
+from sanic.request import Request
+
+
+if TYPE_CHECKING:
+    from sanic import Sanic
+
+
+class LoopMonitor:
+    """Watches an event loop for callbacks that block it.
+
+    A heartbeat is scheduled on the loop every `interval` seconds, and the
+    lag of each beat behind the time that it was due at is measured. When
+    the loop is stuck in a callback, such as a handler that makes a
+    blocking call, the beats stop. A watchdog thread notices this once the
+    beat is `threshold` seconds late, and captures the stack of the thread
+    that runs the loop, with the route of the request that it is handling.
+    The stack is logged at once, so that a loop that never recovers is
+    still reported.
+
+    When the loop is free again, the block is dispatched as the
+    `server.loop.blocked` signal, with its `duration`, `route` and
+    `stack`, and recorded in the state of the worker for the Inspector.
+
+    Args:
+        app (Sanic): The application.
+        interval (float): The time between two beats, in seconds.
+        threshold (float): How late a beat must be to count as a block,
+            in seconds.
+    """
+
+    __slots__ = (
+        "app",
+        "interval",
+        "threshold",
+        "blocks",
+        "lag",
+        "_captured",
+        "_due",
+        "_handle",
+        "_loop",
+        "_route",
+        "_stack",
+        "_stopped",
+        "_thread",
+        "_thread_id",
+    )
+
+    def __init__(self, app: Sanic, interval: float, threshold: float) -> None:
+        if interval <= 0 or threshold <= 0:
+            raise ValueError(
+                "The interval and threshold of a LoopMonitor must be positive"
+            )
+        self.app = app
+        self.interval = interval
+        self.threshold = threshold
+        self.blocks = 0
+        self.lag = 0.0
+        self._captured = 0.0
+        self._due = 0.0
+        self._handle: Optional[TimerHandle] = None
+        self._loop: Optional[AbstractEventLoop] = None
+        self._route: Optional[str] = None
+        self._stack = ""
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._thread_id = 0
+
+    def start(self, loop: AbstractEventLoop) -> None:
+        """Start watching the loop.
+
+        This must be called from the thread that runs the loop.
+
+        Args:
+            loop (AbstractEventLoop): The event loop.
+        """
+        self._loop = loop
+        self._thread_id = get_ident()
+        self._stopped.clear()
+        self._schedule()
+        self._thread = Thread(
+            target=self._watch, name="SanicLoopMonitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching the loop."""
+        self._stopped.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _schedule(self) -> None:
+        self._due = current_time() + self.interval
+        loop = cast(AbstractEventLoop, self._loop)
+        self._handle = loop.call_later(self.interval, self._beat)
+
+    def _beat(self) -> None:
+        self.lag = max(current_time() - self._due, 0.0)
+        if self.lag >= self.threshold:
+            self._report(self.lag)
+        self._schedule()
+
+    def _watch(self) -> None:
+        check = min(self.interval, self.threshold / 2)
+        while not self._stopped.wait(check):
+            due = self._due
+            if due == self._captured or current_time() - due < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            self._route = _route_name(frame)
+            self._stack = "".join(format_stack(frame))
+            self._captured = due
+            logger.warning(
+                "Event loop blocked for over %.3fs in route %s:\n%s",
+                self.threshold,
+                self._route or "-",
+                self._stack,
+            )
+
+    def _report(self, duration: float) -> None:
+        self.blocks += 1
+        if self._captured == self._due:
+            route, stack = self._route, self._stack
+        else:
+            route, stack = None, ""
+            logger.warning("Event loop blocked for %.3fs", duration)
+        cast(AbstractEventLoop, self._loop).create_task(
+            self.app.dispatch(
+                "server.loop.blocked",
+                context={"duration": duration, "route": route, "stack": stack},
+                fail_not_found=False,
+            )
+        )
+        if hasattr(self.app, "multiplexer"):
+            self.app.multiplexer.state.update(
+                {
+                    "loop_blocks": self.blocks,
+                    "loop_blocked": {
+                        "at": datetime.now(tz=timezone.utc),
+                        "duration": round(duration, 6),
+                        "route": route,
+                    },
+                }
+            )
+
+
+def _route_name(frame: Optional[FrameType]) -> Optional[str]:
+    while frame is not None:
+        # Only build the locals of the frames that can have a request
+        if "request" in frame.f_code.co_varnames:
+            request = frame.f_locals.get("request")
+            if isinstance(request, Request) and request.route is not None:
+                return request.route.name
+        frame = frame.f_back
+    return None
@@ -67,11 +67,17 @@ class SanicProtocol(asyncio.Protocol):
     async def send(self, data):
         """
         Generic data write implementation with backpressure control.
+
+        The data may be a single bytes-like object, or a list or tuple of
+        them that is written in one vectored write.
         """
         await self._can_write.wait()
         if self.transport.is_closing():
             raise RequestCancelled
-        self.transport.write(data)
+        if isinstance(data, (list, tuple)):
+            self.transport.writelines(data)
+        else:
+            self.transport.write(data)
         self._time = current_time()
 
     async def receive_more(self):
@@ -8,11 +8,14 @@ from sanic.touchup.meta import TouchUpMeta
 
 
 if TYPE_CHECKING:
+    from asyncio import Transport
+
     from sanic.app import Sanic
 
+import os
 import sys
 
-from asyncio import CancelledError
+from asyncio import CancelledError, SendfileNotAvailableError
 from time import monotonic as current_time
 
 from sanic.exceptions import (
@@ -20,7 +23,7 @@ from sanic.exceptions import (
     RequestTimeout,
     ServiceUnavailable,
 )
-from sanic.http import Http, Stage
+from sanic.http import HTTP1_PARSERS, Http, Stage
 from sanic.log import (
     Colors,
     access_logger,
@@ -28,9 +31,16 @@ from sanic.log import (
     logger,
     websockets_logger,
 )
+from sanic.metrics import (
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    CONNECTIONS,
+    CONNECTIONS_OPEN,
+)
 from sanic.models.server_types import ConnInfo
 from sanic.request import Request
 from sanic.server.protocols.base_protocol import SanicProtocol
+from sanic.server.timeouts import TimeoutWheel
 
 
 ConnectionProtocol = type("ConnectionProtocol", (), {})
@@ -53,7 +63,7 @@ class HttpProtocolMixin:
     __version__: HTTP
 
     def _setup_connection(self, *args, **kwargs):
-        self._http = self.HTTP_CLASS(self, *args, **kwargs)
+        self._http = self._http_class(self, *args, **kwargs)
         self._time = current_time()
         try:
             self.check_timeouts()
@@ -70,6 +80,8 @@ class HttpProtocolMixin:
         self.keep_alive_timeout = self.app.config.KEEP_ALIVE_TIMEOUT
         self.request_max_size = self.app.config.REQUEST_MAX_SIZE
         self.request_class = self.app.request_class or Request
+        self._metrics = self.app.metrics
+        self._http_class = self.HTTP_CLASS
 
     @property
     def http(self):
@@ -113,9 +125,11 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
         "url",
         "_handler_task",
         "_http",
+        "_http_class",
         "_exception",
         "recv_buffer",
-        "_callback_check_timeouts",
+        "_timeouts",
+        "_metrics",
     )
 
     def __init__(
@@ -142,7 +156,12 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
         if "requests_count" not in self.state:
             self.state["requests_count"] = 0
         self._exception = None
-        self._callback_check_timeouts = None
+        self._timeouts: Optional[TimeoutWheel] = None
+
+    def _setup(self):
+        super()._setup()
+        if self.HTTP_CLASS is Http:
+            self._http_class = HTTP1_PARSERS[self.app.config.HTTP1_PARSER]
 
     async def connection_task(self):  # no cov
         """
@@ -206,43 +225,47 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
 
     def check_timeouts(self):
         """
-        Runs itself periodically to enforce any expired timeouts.
+        Enforces any expired timeouts, or else schedules the next check with
+        the timeout wheel shared by the connections on the event loop.
         """
         try:
             if not self._task:
                 return
-            duration = current_time() - self._time
             stage = self._http.stage
-            if stage is Stage.IDLE and duration > self.keep_alive_timeout:
-                logger.debug("KeepAlive Timeout. Closing connection.")
-            elif stage is Stage.REQUEST and duration > self.request_timeout:
-                logger.debug("Request Timeout. Closing connection.")
-                self._http.exception = RequestTimeout("Request Timeout")
-            elif stage is Stage.HANDLER and self._http.upgrade_websocket:
+            if stage is Stage.HANDLER and self._http.upgrade_websocket:
                 websockets_logger.debug(
                     "Handling websocket. Timeouts disabled."
                 )
                 return
-            elif (
-                stage in (Stage.HANDLER, Stage.RESPONSE, Stage.FAILED)
-                and duration > self.response_timeout
-            ):
-                logger.debug("Response Timeout. Closing connection.")
-                self._http.exception = ServiceUnavailable("Response Timeout")
+            if stage is Stage.IDLE:
+                timeout = self.keep_alive_timeout
+            elif stage is Stage.REQUEST:
+                timeout = self.request_timeout
             else:
-                interval = (
-                    min(
-                        self.keep_alive_timeout,
-                        self.request_timeout,
-                        self.response_timeout,
-                    )
-                    / 2
-                )
-                _interval = max(0.1, interval)
-                self._callback_check_timeouts = self.loop.call_later(
-                    _interval, self.check_timeouts
+                timeout = self.response_timeout
+            deadline = self._time + timeout
+            if current_time() <= deadline:
+                shortest = min(
+                    self.keep_alive_timeout,
+                    self.request_timeout,
+                    self.response_timeout,
                 )
+                if self._timeouts is None:
+                    self._timeouts = TimeoutWheel.get(
+                        self.loop, max(0.1, shortest / 2)
+                    )
+                # The stage may change before the deadline, so check again
+                # no later than the shortest timeout could expire
+                self._timeouts.add(self, min(deadline, self._time + shortest))
                 return
+            if stage is Stage.IDLE:
+                logger.debug("KeepAlive Timeout. Closing connection.")
+            elif stage is Stage.REQUEST:
+                logger.debug("Request Timeout. Closing connection.")
+                self._http.exception = RequestTimeout("Request Timeout")
+            else:
+                logger.debug("Response Timeout. Closing connection.")
+                self._http.exception = ServiceUnavailable("Response Timeout")
             cancel_msg_args = ()
             if sys.version_info >= (3, 9):
                 cancel_msg_args = ("Cancel connection task with a timeout",)
@@ -257,8 +280,8 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
         if timeout is not None:
             super().close(timeout=timeout)
             return
-        if self._callback_check_timeouts:
-            self._callback_check_timeouts.cancel()
+        if self._timeouts is not None:
+            self._timeouts.discard(self)
             if self.transport:
                 self.transport.close()
                 self.abort()
@@ -266,18 +289,114 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
     async def send(self, data):  # no cov
         """
         Writes HTTP data with backpressure control.
+
+        The data may be a single bytes-like object, or a list or tuple of
+        them that is written in one vectored write without joining the
+        buffers first.
         """
         await self._can_write.wait()
         if self.transport.is_closing():
             raise RequestCancelled
-        await self.app.dispatch(
-            "http.lifecycle.send",
-            inline=True,
-            context={"data": data},
-        )
-        self.transport.write(data)
+        if isinstance(data, (list, tuple)):
+            # Only join the buffers for the signal if it has handlers
+            if self.app.signal_router.has_handlers("http.lifecycle.send"):
+                await self.app.dispatch(
+                    "http.lifecycle.send",
+                    inline=True,
+                    context={"data": b"".join(data)},
+                )
+            self.transport.writelines(data)
+            if self._metrics is not None:
+                self._metrics.add(BYTES_SENT, sum(map(len, data)))
+        else:
+            await self.app.dispatch(
+                "http.lifecycle.send",
+                inline=True,
+                context={"data": data},
+            )
+            self.transport.write(data)
+            if self._metrics is not None:
+                self._metrics.add(BYTES_SENT, len(data))
         self._time = current_time()
 
+    async def sendfile(self, file, offset: int, count: int) -> int:
+        """
+        Writes part of a file straight from the file to the socket.
+
+        The event loop's sendfile is used where it is supported. Other
+        loops, like uvloop, fall back to os.sendfile on the socket of the
+        transport, waiting on the loop whenever the socket is full. Raises
+        NotImplementedError or SendfileNotAvailableError if neither can
+        send the file, before anything is written.
+        """
+        await self._can_write.wait()
+        transport = self.transport
+        if transport is None or transport.is_closing():
+            raise RequestCancelled
+        try:
+            sent = await self.loop.sendfile(
+                transport, file, offset, count, fallback=False
+            )
+        except (NotImplementedError, SendfileNotAvailableError):
+            sent = await self._sendfile_socket(transport, file, offset, count)
+        if self._metrics is not None:
+            self._metrics.add(BYTES_SENT, sent)
+        self._time = current_time()
+        return sent
+
+    async def _sendfile_socket(
+        self, transport: Transport, file, offset: int, count: int
+    ) -> int:
+        sock = transport.get_extra_info("socket")
+        if sock is None or not hasattr(os, "sendfile"):
+            raise SendfileNotAvailableError("os.sendfile is not available")
+        if transport.get_write_buffer_size():
+            # Whatever the transport has buffered must be written first, and
+            # writing is resumed once the buffer is empty
+            low, high = transport.get_write_buffer_limits()
+            transport.set_write_buffer_limits(high=0)
+            try:
+                await self._can_write.wait()
+            finally:
+                transport.set_write_buffer_limits(high, low)
+            if transport.is_closing():
+                raise RequestCancelled
+        # The loop does not watch the socket of a transport for anything
+        # else, so the writes are made to a duplicate of it, which is
+        # non-blocking too
+        fd = os.dup(sock.fileno())
+        file_fd = file.fileno()
+        sent = 0
+        try:
+            while sent < count:
+                if transport.is_closing():
+                    raise RequestCancelled
+                try:
+                    size = os.sendfile(
+                        fd, file_fd, offset + sent, count - sent
+                    )
+                except BlockingIOError:
+                    await self._writable(fd)
+                    continue
+                except ConnectionError:
+                    raise RequestCancelled
+                if not size:
+                    break
+                sent += size
+                # Every write counts as progress for the response timeout
+                self._time = current_time()
+        finally:
+            os.close(fd)
+        return sent
+
+    async def _writable(self, fd: int) -> None:
+        waiter = self.loop.create_future()
+        self.loop.add_writer(fd, _wake, waiter)
+        try:
+            await waiter
+        finally:
+            self.loop.remove_writer(fd)
+
     def close_if_idle(self) -> bool:
         """
         Close the connection if a request is not being sent or received
@@ -305,15 +424,25 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
             self._task = self.loop.create_task(self.connection_task())
             self.recv_buffer = bytearray()
             self.conn_info = ConnInfo(self.transport, unix=self._unix)
+            if self._metrics is not None:
+                self._metrics.add(CONNECTIONS)
+                self._metrics.add(CONNECTIONS_OPEN)
         except Exception:
             error_logger.exception("protocol.connect_made")
 
+    def connection_lost(self, exc):
+        if self._metrics is not None and self.conn_info is not None:
+            self._metrics.add(CONNECTIONS_OPEN, -1)
+        super().connection_lost(exc)
+
     def data_received(self, data: bytes):
         try:
             self._time = current_time()
             if not data:
                 return self.close()
             self.recv_buffer += data
+            if self._metrics is not None:
+                self._metrics.add(BYTES_RECEIVED, len(data))
 
             if (
                 len(self.recv_buffer) >= self.app.config.REQUEST_BUFFER_SIZE
@@ -327,6 +456,11 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
             error_logger.exception("protocol.data_received")
 
 
+def _wake(waiter) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class Http3Protocol(HttpProtocolMixin, ConnectionProtocol):  # type: ignore
     HTTP_CLASS = Http3
     __version__ = HTTP.VERSION_3
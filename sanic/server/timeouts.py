@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from math import ceil
+from time import monotonic as current_time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from weakref import WeakKeyDictionary, ref
+
+from sanic.log import error_logger
+
+
+if TYPE_CHECKING:
+    from sanic.server.protocols.http_protocol import HttpProtocol
+
+
+class TimeoutWheel:
+    """Keeps track of the timeouts of the connections on an event loop.
+
+    Connections are placed in a ring of buckets, one bucket per tick, by the
+    time at which their timeout would be due. The wheel wakes up once per
+    tick, and only checks the connections in the bucket that is due. A
+    connection that has been active in the meantime is not expired by the
+    check, but put back in a later bucket. Therefore, recording activity on
+    a connection only means updating its timestamp.
+
+    Deadlines further away than one turn of the wheel are placed in the
+    last bucket, and are moved on again when that bucket is checked.
+
+    Args:
+        loop (AbstractEventLoop): The event loop.
+        tick (float): The time between two checks, in seconds.
+        size (int, optional): The number of buckets. Defaults to `512`.
+    """
+
+    __slots__ = (
+        "_loop",
+        "tick",
+        "buckets",
+        "index",
+        "position",
+        "_time",
+        "_handle",
+    )
+
+    _wheels: WeakKeyDictionary[
+        AbstractEventLoop, Dict[float, TimeoutWheel]
+    ] = WeakKeyDictionary()
+
+    def __init__(
+        self, loop: AbstractEventLoop, tick: float, size: int = 512
+    ) -> None:
+        # The wheels are kept for as long as their loop, so they must not
+        # keep it alive themselves
+        self._loop = ref(loop)
+        self.tick = tick
+        self.buckets: List[Set[HttpProtocol]] = [set() for _ in range(size)]
+        self.index: Dict[HttpProtocol, int] = {}
+        self.position = 0
+        self._time = 0.0
+        self._handle: Optional[TimerHandle] = None
+
+    @classmethod
+    def get(cls, loop: AbstractEventLoop, tick: float) -> TimeoutWheel:
+        """Get the wheel of an event loop, creating it if needed.
+
+        Args:
+            loop (AbstractEventLoop): The event loop.
+            tick (float): The time between two checks, in seconds.
+
+        Returns:
+            TimeoutWheel: The wheel shared by all connections on the loop
+                that use the same tick.
+        """
+        wheels = cls._wheels.setdefault(loop, {})
+        wheel = wheels.get(tick)
+        if wheel is None:
+            wheel = wheels[tick] = cls(loop, tick)
+        return wheel
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, protocol: HttpProtocol) -> bool:
+        return protocol in self.index
+
+    def add(self, protocol: HttpProtocol, deadline: float) -> None:
+        """Check the timeouts of a connection once its deadline is reached.
+
+        Args:
+            protocol (HttpProtocol): The connection.
+            deadline (float): The monotonic time when the connection will
+                time out, unless there is activity on it.
+        """
+        self._remove(protocol)
+        if self._handle is None:
+            loop = self._loop()
+            if loop is None:
+                return
+            self._time = current_time()
+            self._handle = loop.call_later(self.tick, self._turn)
+        size = len(self.buckets)
+        ticks = ceil((deadline - self._time) / self.tick)
+        slot = (self.position + min(max(ticks, 1), size - 1)) % size
+        self.buckets[slot].add(protocol)
+        self.index[protocol] = slot
+
+    def discard(self, protocol: HttpProtocol) -> None:
+        """Stop checking the timeouts of a connection.
+
+        Args:
+            protocol (HttpProtocol): The connection.
+        """
+        self._remove(protocol)
+        if not self.index and self._handle is not None:
+            # The timer would keep the loop alive
+            self._handle.cancel()
+            self._handle = None
+
+    def _remove(self, protocol: HttpProtocol) -> None:
+        slot = self.index.pop(protocol, None)
+        if slot is not None:
+            self.buckets[slot].discard(protocol)
+
+    def _turn(self) -> None:
+        # Catch up with every tick that has passed, in case the event loop
+        # was blocked for longer than one tick
+        size = len(self.buckets)
+        elapsed = max(1, int((current_time() - self._time) / self.tick))
+        self._time += elapsed * self.tick
+        due: Set[HttpProtocol] = set()
+        for _ in range(min(elapsed, size)):
+            self.position = (self.position + 1) % size
+            due.update(self.buckets[self.position])
+            self.buckets[self.position] = set()
+        for protocol in due:
+            del self.index[protocol]
+        for protocol in due:
+            try:
+                protocol.check_timeouts()
+            except Exception:  # no cov
+                error_logger.exception("TimeoutWheel")
+        loop = self._loop()
+        if self.index and loop is not None:
+            self._handle = loop.call_later(self.tick, self._turn)
+        else:
+            self._handle = None
@@ -6,23 +6,37 @@ from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from inspect import isawaitable
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 from sanic_routing import BaseRouter, Route, RouteGroup
 from sanic_routing.exceptions import NotFound
 from sanic_routing.utils import path_to_parts
 
+from sanic.constants import SignalOverflow
 from sanic.exceptions import InvalidSignal
 from sanic.log import error_logger, logger
+from sanic.metrics import (
+    SIGNALS_BLOCKED,
+    SIGNALS_DISPATCHED,
+    SIGNALS_DROPPED,
+    SIGNALS_FAILED,
+    SIGNALS_OVERFLOWED,
+    SIGNALS_QUEUED,
+)
 from sanic.models.handler_types import SignalHandler
 
 
+if TYPE_CHECKING:
+    from sanic.metrics import WorkerMetrics
+
+
 class Event(Enum):
     """Event names for the SignalRouter"""
 
     SERVER_EXCEPTION_REPORT = "server.exception.report"
     SERVER_INIT_AFTER = "server.init.after"
     SERVER_INIT_BEFORE = "server.init.before"
+    SERVER_LOOP_BLOCKED = "server.loop.blocked"
     SERVER_SHUTDOWN_AFTER = "server.shutdown.after"
     SERVER_SHUTDOWN_BEFORE = "server.shutdown.before"
     HTTP_LIFECYCLE_BEGIN = "http.lifecycle.begin"
@@ -50,6 +64,7 @@ RESERVED_NAMESPACES = {
         Event.SERVER_EXCEPTION_REPORT.value,
         Event.SERVER_INIT_AFTER.value,
         Event.SERVER_INIT_BEFORE.value,
+        Event.SERVER_LOOP_BLOCKED.value,
         Event.SERVER_SHUTDOWN_AFTER.value,
         Event.SERVER_SHUTDOWN_BEFORE.value,
     ),
@@ -124,6 +139,211 @@ class SignalGroup(RouteGroup):
     """A `RouteGroup` that is used to dispatch signals to handlers"""
 
 
+@dataclass
+class SignalDispatch:
+    """A precomputed record of how to dispatch a non-parameterized event
+
+    It is built when the `SignalRouter` is finalized, so that dispatching
+    the event does not need to route it again.
+    """
+
+    group: SignalGroup
+    params: Dict[str, Any]
+    signals: Tuple[Signal, ...]
+    reverse: Tuple[Signal, ...]
+
+    @property
+    def has_waiters(self) -> bool:
+        """Whether anything is waiting on a signal in the group"""
+        return any(signal.ctx.waiters for signal in self.group.routes)
+
+
+class SignalDispatcher:
+    """A bounded queue for signals that are not dispatched inline
+
+    Instead of creating a task for every background dispatch, the
+    dispatches are put on a queue and run by a small pool of consumer tasks.
+    A consumer keeps taking dispatches off the queue for as long as there
+    are any, so a burst of signals is run without a task for each of them.
+
+    When the queue is full, the overflow policy decides what happens to a
+    new dispatch:
+
+    - `BLOCK`: wait until there is room on the queue
+    - `DROP`: discard the dispatch
+    - `COUNT`: run the dispatch in its own task, as if there was no queue
+
+    A dispatch from one of the consumer tasks, such as from a signal
+    handler, never waits for room on the queue, since only the consumers
+    make room: it is run in its own task instead.
+
+    The counters are added to the metrics of the worker, if it has any.
+
+    Args:
+        router (SignalRouter): The router that runs the dispatches.
+        maxsize (int): The number of dispatches that can be queued.
+        workers (int): The number of consumer tasks.
+        overflow (SignalOverflow): The overflow policy.
+        metrics (Optional[WorkerMetrics], optional): The metrics of the
+            worker. Defaults to `None`.
+    """
+
+    __slots__ = (
+        "router",
+        "queue",
+        "workers",
+        "overflow",
+        "consumers",
+        "queued",
+        "dispatched",
+        "failed",
+        "blocked",
+        "dropped",
+        "overflowed",
+        "metrics",
+    )
+
+    def __init__(
+        self,
+        router: SignalRouter,
+        maxsize: int,
+        workers: int = 4,
+        overflow: Union[str, SignalOverflow] = SignalOverflow.BLOCK,
+        metrics: Optional[WorkerMetrics] = None,
+    ) -> None:
+        self.router = router
+        self.metrics = metrics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.workers = max(1, workers)
+        self.overflow = (
+            overflow
+            if isinstance(overflow, SignalOverflow)
+            else SignalOverflow[str(overflow).upper()]
+        )
+        self.consumers: List[asyncio.Task] = []
+        self.queued = 0
+        self.dispatched = 0
+        self.failed = 0
+        self.blocked = 0
+        self.dropped = 0
+        self.overflowed = 0
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """The counters of the dispatcher, for monitoring"""
+        return {
+            "size": self.queue.qsize(),
+            "queued": self.queued,
+            "dispatched": self.dispatched,
+            "failed": self.failed,
+            "blocked": self.blocked,
+            "dropped": self.dropped,
+            "overflowed": self.overflowed,
+        }
+
+    def start(self) -> None:
+        """Start the consumer tasks on the running event loop"""
+        loop = asyncio.get_running_loop()
+        self.consumers = [
+            loop.create_task(self._consume(), name=f"SignalConsumer{idx}")
+            for idx in range(self.workers)
+        ]
+
+    async def put(self, event: str, **kwargs: Any) -> asyncio.Future:
+        """Queue a dispatch
+
+        Args:
+            event (str): The event to dispatch
+            **kwargs: The arguments for `SignalRouter._dispatch`
+
+        Returns:
+            asyncio.Future: A future with the result of the dispatch
+        """
+        if not self.consumers:
+            self.start()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        item = (future, event, kwargs)
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if self.overflow is SignalOverflow.DROP:
+                self.dropped += 1
+                self._count(SIGNALS_DROPPED)
+                future.set_result(None)
+                return future
+            elif (
+                self.overflow is SignalOverflow.COUNT
+                # A consumer that waits for room could be waiting for itself
+                or asyncio.current_task() in self.consumers
+            ):
+                self.overflowed += 1
+                self._count(SIGNALS_OVERFLOWED)
+                task = loop.create_task(self.router._dispatch(event, **kwargs))
+                await asyncio.sleep(0)
+                return task
+            self.blocked += 1
+            self._count(SIGNALS_BLOCKED)
+            await self.queue.put(item)
+        self.queued += 1
+        self._count(SIGNALS_QUEUED)
+        return future
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """Run the queued dispatches, then stop the consumer tasks
+
+        Args:
+            timeout (Optional[float], optional): How long to wait for the
+                queue to be emptied. Defaults to `None`.
+        """
+        if self.consumers:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                error_logger.warning(
+                    "Signal queue was not emptied before shutdown: "
+                    f"{self.queue.qsize()} dispatches are discarded"
+                )
+        for consumer in self.consumers:
+            consumer.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        self.consumers = []
+
+    async def _consume(self) -> None:
+        queue = self.queue
+        dispatch = self.router._dispatch
+        while True:
+            future, event, kwargs = await queue.get()
+            try:
+                result = await dispatch(event, **kwargs)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                self.failed += 1
+                if not future.done():
+                    future.set_exception(e)
+                self._count(SIGNALS_FAILED)
+            else:
+                self.dispatched += 1
+                if not future.done():
+                    future.set_result(result)
+                self._count(SIGNALS_DISPATCHED)
+            finally:
+                queue.task_done()
+
+    def _count(self, counter: int) -> None:
+        metrics = self.metrics
+        if metrics is None:
+            return
+        try:
+            metrics.add(counter)
+        except Exception:
+            # The consumers must keep running without the metrics
+            self.metrics = None
+            error_logger.exception("Signal queue metrics failed")
+
+
 class SignalRouter(BaseRouter):
     """A `BaseRouter` that is used to dispatch signals to handlers"""
 
@@ -136,6 +356,8 @@ class SignalRouter(BaseRouter):
         )
         self.allow_fail_builtin = True
         self.ctx.loop = None
+        self.dispatcher: Optional[SignalDispatcher] = None
+        self._dispatch_table: Dict[str, Optional[SignalDispatch]] = {}
 
     @staticmethod
     def format_event(event: Union[str, Enum]) -> str:
@@ -181,12 +403,7 @@ class SignalRouter(BaseRouter):
                 extra=extra,
             )
         except NotFound:
-            message = "Could not find signal %s"
-            terms: List[Union[str, Optional[Dict[str, str]]]] = [event]
-            if extra:
-                message += " with %s"
-                terms.append(extra)
-            raise NotFound(message % tuple(terms))
+            raise self._not_found(event, extra)
 
         # Regex routes evaluate and can extract params directly. They are set
         # on param_basket["__params__"]
@@ -212,7 +429,20 @@ class SignalRouter(BaseRouter):
     ) -> Any:
         event = self.format_event(event)
         try:
-            group, handlers, params = self.get(event, condition=condition)
+            if event in self._dispatch_table:
+                dispatch = self._dispatch_table[event]
+                if dispatch is None:
+                    raise self._not_found(event, condition)
+                group = dispatch.group
+                params = dict(dispatch.params)
+                signals = dispatch.reverse if reverse else dispatch.signals
+                has_waiters = dispatch.has_waiters
+            else:
+                group, _, params = self.get(event, condition=condition)
+                signals = group.routes
+                if not reverse:
+                    signals = signals[::-1]
+                has_waiters = True
         except NotFound as e:
             is_reserved = event.split(".", 1)[0] in RESERVED_NAMESPACES
             if fail_not_found and (not is_reserved or self.allow_fail_builtin):
@@ -226,14 +456,13 @@ class SignalRouter(BaseRouter):
             params.update(context)
         params.pop("__trigger__", None)
 
-        signals = group.routes
-        if not reverse:
-            signals = signals[::-1]
         try:
-            for signal in signals:
-                for waiter in signal.ctx.waiters:
-                    if waiter.matches(event, condition):
-                        waiter.future.set_result(dict(params))
+            if has_waiters:
+                waiting = group.routes if reverse else group.routes[::-1]
+                for signal in waiting:
+                    for waiter in signal.ctx.waiters:
+                        if waiter.matches(event, condition):
+                            waiter.future.set_result(dict(params))
 
             for signal in signals:
                 requirements = signal.extra.requirements
@@ -283,13 +512,24 @@ class SignalRouter(BaseRouter):
             reverse (bool, optional): Whether to run the handlers in reverse order. Defaults to `False`.
 
         Returns:
-            Union[asyncio.Task, Any]: If `inline` is `True` then the return value of the signal handler will be returned. If `inline` is `False` then an `asyncio.Task` will be returned.
+            Union[asyncio.Task, Any]: If `inline` is `True` then the return value of the signal handler will be returned. If `inline` is `False` then an `asyncio.Task` will be returned, or an `asyncio.Future` when the dispatch is put on the signal queue (see `SIGNAL_QUEUE_SIZE`).
 
         Raises:
             RuntimeError: If the signal is dispatched outside of an event loop
         """  # noqa: E501
 
         event = self.format_event(event)
+        logger.debug(f"Dispatching signal: {event}", extra={"verbosity": 1})
+
+        if not inline and self.dispatcher:
+            return await self.dispatcher.put(
+                event,
+                context=context,
+                condition=condition,
+                fail_not_found=False,
+                reverse=reverse,
+            )
+
         dispatch = self._dispatch(
             event,
             context=context,
@@ -297,7 +537,6 @@ class SignalRouter(BaseRouter):
             fail_not_found=fail_not_found and inline,
             reverse=reverse,
         )
-        logger.debug(f"Dispatching signal: {event}", extra={"verbosity": 1})
 
         if inline:
             return await dispatch
@@ -306,6 +545,23 @@ class SignalRouter(BaseRouter):
         await asyncio.sleep(0)
         return task
 
+    def has_handlers(self, event: Union[str, Enum]) -> bool:
+        """Whether a dispatch of an event could reach any signal
+
+        Only the events of the dispatch table are known to reach no signal
+        once the router is finalized. The other events are routed when they
+        are dispatched, and could reach one.
+
+        Args:
+            event (Union[str, Enum]): The event
+
+        Returns:
+            bool: Whether the event could reach a signal
+        """
+        event = self.format_event(event)
+        table = self._dispatch_table
+        return event not in table or table[event] is not None
+
     def get_waiter(
         self,
         event: Union[str, Enum],
@@ -392,7 +648,61 @@ class SignalRouter(BaseRouter):
         for signal in self.routes:
             signal.ctx.waiters = deque()
 
-        return super().finalize(do_compile=do_compile, do_optimize=do_optimize)
+        router = super().finalize(
+            do_compile=do_compile, do_optimize=do_optimize
+        )
+        self._build_dispatch_table()
+        return router
+
+    def reset(self):
+        """Reset the router so that it can be changed and finalized again"""
+        self._dispatch_table = {}
+        super().reset()
+
+    def _build_dispatch_table(self) -> None:
+        """Precompute the dispatch of every non-parameterized event
+
+        This covers the reserved events and any event that a signal is
+        defined on without a trigger. Other events are routed when they
+        are dispatched.
+        """
+        events = {
+            signal.ctx.definition
+            for signal in self.routes
+            if not signal.ctx.trigger
+        }
+        for namespace in RESERVED_NAMESPACES.values():
+            events.update(namespace)
+
+        table: Dict[str, Optional[SignalDispatch]] = {}
+        for event in events:
+            try:
+                group, _, params = self.get(event)
+            except NotFound:
+                table[event] = None
+                continue
+            signals = tuple(
+                signal
+                for signal in group.routes
+                if signal.ctx.trigger or event == signal.ctx.definition
+            )
+            table[event] = SignalDispatch(
+                group=group,
+                params=params,
+                signals=signals[::-1],
+                reverse=signals,
+            )
+        self._dispatch_table = table
+
+    def _not_found(
+        self, event: str, condition: Optional[Dict[str, str]]
+    ) -> NotFound:
+        message = "Could not find signal %s"
+        terms: List[Union[str, Optional[Dict[str, str]]]] = [event]
+        if condition:
+            message += " with %s"
+            terms.append(condition)
+        return NotFound(message % tuple(terms))
 
     def _build_event_parts(self, event: str) -> Tuple[str, str, str]:
         parts = path_to_parts(event, self.delimiter)
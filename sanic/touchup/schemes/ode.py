@@ -1,4 +1,12 @@
-from ast import Attribute, Await, Expr, NodeTransformer
+from ast import (
+    Attribute,
+    Await,
+    Expr,
+    If,
+    NodeTransformer,
+    Pass,
+    copy_location,
+)
 from typing import Any, List
 
 from sanic.log import logger
@@ -77,6 +85,13 @@ class RemoveDispatch(NodeTransformer):
                     return None
         return node
 
+    def visit_If(self, node: If) -> Any:
+        self.generic_visit(node)
+        if not node.body:
+            # The body only dispatched events that are not registered
+            node.body = [copy_location(Pass(), node)]
+        return node
+
     def _not_registered(self, event_name):
         dynamic = []
         for event in self._registered_events:
@@ -14,7 +14,7 @@ class TouchUp:
 
             if app.test_mode:
                 placeholder = f"_{method_name}"
-                if hasattr(target, placeholder):
+                if placeholder in vars(target):
                     method = getattr(target, placeholder)
                 else:
                     setattr(target, placeholder, method)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, TimerHandle
+from inspect import isawaitable
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from sanic.log import error_logger, logger
+
+
+if TYPE_CHECKING:
+    from sanic import Sanic
+    from sanic.request import Request
+
+
+# The stages of a request, in the order that they usually happen
+HEAD = 0
+ROUTING = 1
+BODY = 2
+REQUEST_MIDDLEWARE = 3
+HANDLER = 4
+RESPONSE_MIDDLEWARE = 5
+SERIALIZATION = 6
+SEND = 7
+STAGES = (
+    "head",
+    "routing",
+    "body",
+    "request_middleware",
+    "handler",
+    "response_middleware",
+    "serialization",
+    "send",
+)
+
+TraceSink = Callable[[List["RequestTrace"]], Any]
+
+
+class RequestTrace:
+    """The time taken by each stage of a request.
+
+    A trace holds a slot for the start and the end of every stage, in
+    `perf_counter` seconds, which are filled in as the request is handled.
+    A stage that did not happen keeps zeros: for example, only HTTP/1
+    connections time the parsing of the request head and the
+    serialization of the response head. The time taken by each middleware
+    is also kept, by the name of its function.
+
+    Args:
+        received (Optional[float], optional): When the request started
+            to be received. Defaults to now.
+    """
+
+    __slots__ = (
+        "marks",
+        "middleware",
+        "method",
+        "path",
+        "route",
+        "status",
+    )
+
+    def __init__(self, received: Optional[float] = None) -> None:
+        self.marks = [0.0] * (len(STAGES) * 2)
+        self.marks[0] = perf_counter() if received is None else received
+        self.middleware: List[Tuple[str, float]] = []
+        self.method = ""
+        self.path = ""
+        self.route: Optional[str] = None
+        self.status = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self.method} {self.path} "
+            f"{self.duration:.6f}s>"
+        )
+
+    def begin(self, stage: int) -> None:
+        """Record the start of a stage.
+
+        Args:
+            stage (int): The stage, like `HANDLER`.
+        """
+        self.marks[stage * 2] = perf_counter()
+
+    def end(self, stage: int) -> None:
+        """Record the end of a stage.
+
+        Args:
+            stage (int): The stage, like `HANDLER`.
+        """
+        self.marks[stage * 2 + 1] = perf_counter()
+
+    def add_middleware(self, middleware: Any, started: float) -> None:
+        """Record the time taken by a middleware.
+
+        Args:
+            middleware (Any): The middleware.
+            started (float): When the middleware started.
+        """
+        func = getattr(middleware, "func", middleware)
+        name = getattr(func, "__qualname__", repr(func))
+        self.middleware.append((name, perf_counter() - started))
+
+    @property
+    def duration(self) -> float:
+        """The time from receiving the request to sending the response."""
+        return max(self.marks) - self.marks[0]
+
+    @property
+    def stages(self) -> Dict[str, float]:
+        """The time taken by each stage that happened, in seconds."""
+        marks = self.marks
+        return {
+            name: marks[index * 2 + 1] - marks[index * 2]
+            for index, name in enumerate(STAGES)
+            if marks[index * 2] and marks[index * 2 + 1]
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The trace, as a dictionary that can be serialized.
+
+        Returns:
+            Dict[str, Any]: The trace.
+        """
+        return {
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration": self.duration,
+            "stages": self.stages,
+            "middleware": self.middleware,
+        }
+
+
+class Tracer:
+    """Collects the traces of the requests that a worker handles.
+
+    Each finished trace is logged when it is slower than `slow`, added to
+    the metrics of the worker, and kept for the sinks. The sinks are
+    called with a list of traces once `batch_size` traces have been kept,
+    or `interval` seconds after the first trace of a batch, whichever is
+    sooner.
+
+    .. note::
+        This is used internally by Sanic when `TRACING` is enabled, and
+        should not typically need to be instantiated directly.
+
+    Args:
+        app (Sanic): The application.
+        sinks (List[TraceSink]): The functions to pass the traces to.
+        slow (float): How long a request takes to be logged as slow, in
+            seconds, or `0` not to log them.
+        batch_size (int): How many traces to pass to the sinks at once.
+        interval (float): The longest time that a trace is kept for
+            before being passed to the sinks, in seconds.
+    """
+
+    __slots__ = (
+        "app",
+        "batch",
+        "batch_size",
+        "interval",
+        "sinks",
+        "slow",
+        "_handle",
+    )
+
+    def __init__(
+        self,
+        app: Sanic,
+        sinks: List[TraceSink],
+        slow: float,
+        batch_size: int,
+        interval: float,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("The batch size of a Tracer must be at least 1")
+        self.app = app
+        self.sinks = sinks
+        self.slow = slow
+        self.batch_size = batch_size
+        self.interval = interval
+        self.batch: List[RequestTrace] = []
+        self._handle: Optional[TimerHandle] = None
+
+    def finish(self, request: Request, trace: RequestTrace) -> None:
+        """Record the trace of a request that has been handled.
+
+        Args:
+            request (Request): The request.
+            trace (RequestTrace): The trace of the request.
+        """
+        trace.method = request.method
+        trace.path = request.path
+        trace.route = request.route.name if request.route else None
+        response = getattr(request.stream, "response", None)
+        trace.status = getattr(response, "status", 0) or 0
+
+        slow = bool(self.slow) and trace.duration >= self.slow
+        if slow:
+            logger.warning(
+                "Slow request: %s %s took %.3fs (%s)",
+                trace.method,
+                trace.path,
+                trace.duration,
+                ", ".join(
+                    f"{name} {seconds:.3f}s"
+                    for name, seconds in trace.stages.items()
+                ),
+            )
+        if self.app.metrics is not None:
+            self.app.metrics.request_traced(trace, slow)
+        if self.sinks:
+            self.batch.append(trace)
+            if len(self.batch) >= self.batch_size:
+                self.flush()
+            elif self._handle is None:
+                loop: AbstractEventLoop = self.app.loop
+                self._handle = loop.call_later(self.interval, self.flush)
+
+    def flush(self) -> None:
+        """Pass the traces that have been kept to the sinks.
+
+        The sinks that are coroutine functions are run as tasks.
+        """
+        for awaitable in self._call_sinks():
+            self.app.add_task(awaitable)
+
+    async def close(self) -> None:
+        """Pass the traces that are left to the sinks, and wait for them."""
+        for awaitable in self._call_sinks():
+            await awaitable
+
+    def _call_sinks(self) -> List[Awaitable[None]]:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self.batch:
+            return []
+        batch, self.batch = self.batch, []
+        pending: List[Awaitable[None]] = []
+        for sink in self.sinks:
+            try:
+                result = sink(batch)
+            except Exception:
+                error_logger.exception("Exception in trace sink %r", sink)
+            else:
+                if isawaitable(result):
+                    pending.append(_wait(sink, result))
+        return pending
+
+
+async def _wait(sink: TraceSink, result: Awaitable[Any]) -> None:
+    try:
+        await result
+    except Exception:
+        error_logger.exception("Exception in trace sink %r", sink)
@@ -37,7 +37,11 @@ class SharedContext(SimpleNamespace):
             module = ""
         if not any(
             module.startswith(prefix)
-            for prefix in ("multiprocessing", "ctypes")
+            for prefix in (
+                "multiprocessing",
+                "ctypes",
+                "sanic.worker.shared_memory",
+            )
         ):
             error_logger.warning(
                 f"{Colors.YELLOW}Unsafe object {Colors.PURPLE}{name} "
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+from asyncio import sleep
 from datetime import datetime
 from inspect import isawaitable
 from multiprocessing.connection import Connection
-from os import environ
+from os import environ, kill
 from pathlib import Path
-from typing import Any, Dict, Mapping, Union
+from secrets import token_hex
+from tempfile import gettempdir
+from time import monotonic
+from typing import Any, Dict, Mapping, Optional, Union
 
-from sanic.exceptions import Unauthorized
+from sanic.exceptions import (
+    BadRequest,
+    NotFound,
+    SanicException,
+    ServiceUnavailable,
+    Unauthorized,
+)
 from sanic.helpers import Default
 from sanic.log import logger
+from sanic.metrics import MetricsTable
 from sanic.request import Request
-from sanic.response import json
+from sanic.response import json, text
+from sanic.worker.profiler import PROFILE_MAX_SECONDS, PROFILE_SIGNAL
 
 
 class Inspector:
@@ -34,6 +46,8 @@ class Inspector:
         api_key (str): The API key to use for authentication.
         tls_key (Union[Path, str, Default]): The path to the TLS key file.
         tls_cert (Union[Path, str, Default]): The path to the TLS cert file.
+        metrics (Optional[MetricsTable], optional): The metrics of the
+            workers, when `METRICS` is enabled. Defaults to `None`.
     """
 
     def __init__(
@@ -46,6 +60,7 @@ class Inspector:
         api_key: str,
         tls_key: Union[Path, str, Default],
         tls_cert: Union[Path, str, Default],
+        metrics: Optional[MetricsTable] = None,
     ):
         self._publisher = publisher
         self.app_info = app_info
@@ -55,6 +70,7 @@ class Inspector:
         self.api_key = api_key
         self.tls_key = tls_key
         self.tls_cert = tls_cert
+        self.metrics_table = metrics
 
     def __call__(self, run=True, **_) -> Inspector:
         from sanic import Sanic
@@ -75,6 +91,11 @@ class Inspector:
 
     def _setup(self):
         self.app.get("/")(self._info)
+        self.app.get("/metrics")(self._metrics)
+        # Leave time for the longest profile
+        self.app.config.RESPONSE_TIMEOUT = max(
+            self.app.config.RESPONSE_TIMEOUT, PROFILE_MAX_SECONDS + 30
+        )
         self.app.post("/<action:str>")(self._action)
         if self.api_key:
             self.app.on_request(self._authentication)
@@ -102,6 +123,14 @@ class Inspector:
     async def _info(self, request: Request):
         return await self._respond(request, self._state_to_json())
 
+    async def _metrics(self, request: Request):
+        if self.metrics_table is None:
+            raise NotFound("Metrics are not enabled")
+        return text(
+            self.metrics_table.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
     async def _respond(self, request: Request, output: Any):
         name = request.match_info.get("action", "info")
         return json({"meta": {"action": name}, "result": output})
@@ -150,6 +179,80 @@ class Inspector:
         self._publisher.send(message)
         return log_msg
 
+    async def profile(
+        self,
+        seconds: Union[str, float] = 10,
+        worker: Union[str, int] = 0,
+        interval: Union[str, float] = 0.005,
+    ) -> str:
+        """Profile a worker with a sampling profiler
+
+        The worker is sent a signal to start profiling in the background,
+        and writes the result to a temporary file that is read back here.
+
+        Args:
+            seconds (Union[str, float], optional): How long to profile for.
+                Defaults to `10`.
+            worker (Union[str, int], optional): The index of a server
+                worker, or the name of a worker. Defaults to `0`.
+            interval (Union[str, float], optional): The time between two
+                samples, in seconds. Defaults to `0.005`.
+
+        Returns:
+            str: The collapsed stacks of the worker, each starting with the
+                route of the request that was being handled.
+        """
+        if PROFILE_SIGNAL is None:
+            raise SanicException("Profiling is not supported on this platform")
+        seconds, interval = float(seconds), float(interval)
+        if not 0 < seconds <= PROFILE_MAX_SECONDS or interval <= 0:
+            raise BadRequest(
+                "Profiles must be at most "
+                f"{PROFILE_MAX_SECONDS} seconds long, with a positive interval"
+            )
+        name = self._find_worker(worker)
+        state = self.worker_state[name]
+        path = Path(gettempdir()) / (
+            f"sanic-profile-{state['pid']}-{token_hex(4)}.txt"
+        )
+        self.worker_state[name] = {  # type: ignore
+            **state,
+            "profile": {
+                "seconds": seconds,
+                "path": str(path),
+                "interval": interval,
+            },
+        }
+        kill(state["pid"], PROFILE_SIGNAL)
+        logger.info("Profiling %s for %ss", name, seconds)
+
+        deadline = monotonic() + seconds + 10
+        while not path.exists():
+            if monotonic() > deadline:
+                raise ServiceUnavailable(f"{name} did not send a profile")
+            await sleep(0.1)
+        try:
+            return path.read_text()
+        finally:
+            path.unlink()
+
+    def _find_worker(self, worker: Union[str, int]) -> str:
+        if isinstance(worker, int) or worker.isdigit():
+            servers = [
+                name
+                for name, info in self.worker_state.items()
+                if info.get("server")
+            ]
+            index = int(worker)
+            if index >= len(servers):
+                raise BadRequest(
+                    f"There are only {len(servers)} server workers"
+                )
+            return servers[index]
+        if worker not in self.worker_state:
+            raise BadRequest(f"There is no worker named {worker}")
+        return worker
+
     def shutdown(self) -> None:
         """Shutdown the workers"""
         message = "__TERMINATE__"
@@ -1,9 +1,11 @@
 from multiprocessing.connection import Connection
-from os import environ, getpid
+from os import environ, getpid, replace
+from threading import Thread
 from typing import Any, Callable, Dict, Optional
 
 from sanic.log import Colors, logger
 from sanic.worker.process import ProcessState
+from sanic.worker.profiler import SamplingProfiler
 from sanic.worker.state import WorkerState
 
 
@@ -146,6 +148,35 @@ class WorkerMultiplexer:
         message = "__TERMINATE_EARLY__" if early else "__TERMINATE__"
         self._monitor_publisher.send(message)
 
+    def profile(self, seconds: float, path: str, interval: float) -> None:
+        """Profile the worker in the background, and write the result.
+
+        The collapsed stacks are written to a temporary file first, and
+        then moved to `path`, so that the whole profile appears at once.
+
+        Args:
+            seconds (float): How long to profile for.
+            path (str): Where to write the collapsed stacks.
+            interval (float): The time between two samples, in seconds.
+        """
+
+        def run():
+            output = SamplingProfiler(interval).run(seconds)
+            pending = f"{path}.partial"
+            with open(pending, "w") as file:
+                file.write(output)
+            replace(pending, path)
+
+        logger.info("Profiling %s [%s] for %ss", self.name, self.pid, seconds)
+        Thread(target=run, name="SanicProfile", daemon=True).start()
+
+    def profile_requested(self) -> None:
+        """Start the profile that the Inspector left in the worker state."""
+        request = self._state._state[self.name].get("profile")
+        if request:
+            del self._state["profile"]
+            self.profile(**request)
+
     @property
     def pid(self) -> int:
         """The process ID of the worker."""
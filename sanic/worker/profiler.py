@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import signal
+import sys
+
+from collections import Counter
+from threading import Event, Thread, main_thread
+from types import FrameType
+from typing import List, Optional, cast
+
+from sanic.server.monitor import _route_name
+
+
+# The signal that asks a worker to start a profile, where there is one
+PROFILE_SIGNAL: Optional[signal.Signals] = getattr(signal, "SIGUSR1", None)
+# The longest profile that the Inspector takes, in seconds
+PROFILE_MAX_SECONDS = 300
+
+
+class SamplingProfiler:
+    """A sampling profiler for the thread that runs the event loop.
+
+    A background thread takes the stack of the profiled thread every
+    `interval` seconds, so the profiled code is not slowed down by tracing
+    calls. The stacks are counted in the collapsed format used by flame
+    graph tools, one line per distinct stack, with the frames from the
+    outermost to the innermost, separated by semicolons, and followed by
+    the number of samples. The first frame is the route of the request that
+    was being handled, or `-` when there was none.
+
+    Args:
+        interval (float, optional): The time between two samples, in
+            seconds. Defaults to `0.005`.
+        thread_id (Optional[int], optional): The thread to profile.
+            Defaults to the main thread.
+    """
+
+    __slots__ = (
+        "interval",
+        "samples",
+        "stacks",
+        "thread_id",
+        "_stopped",
+        "_thread",
+    )
+
+    def __init__(
+        self, interval: float = 0.005, thread_id: Optional[int] = None
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("The interval of a profiler must be positive")
+        self.interval = interval
+        self.thread_id = (
+            thread_id
+            if thread_id is not None
+            else cast(int, main_thread().ident)
+        )
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        """Start taking samples."""
+        self._stopped.clear()
+        self._thread = Thread(
+            target=self._sample, name="SanicProfiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop taking samples."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def run(self, seconds: float) -> str:
+        """Take samples for some time, and collapse them.
+
+        Args:
+            seconds (float): How long to take samples for.
+
+        Returns:
+            str: The collapsed stacks.
+        """
+        self.start()
+        self._stopped.wait(seconds)
+        self.stop()
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        """The samples taken so far, as collapsed stacks.
+
+        Returns:
+            str: The collapsed stacks, with the most common first.
+        """
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    frames: List[str] = []
+    route = _route_name(frame)
+    while frame is not None:
+        code = frame.f_code
+        frames.append(
+            f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    frames.append(route or "-")
+    return ";".join(reversed(frames))
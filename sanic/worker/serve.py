@@ -19,6 +19,7 @@ from sanic.server.runners import _serve_http_1, _serve_http_3
 from sanic.worker.loader import AppLoader, CertLoader
 from sanic.worker.multiplexer import WorkerMultiplexer
 from sanic.worker.process import Worker, WorkerProcess
+from sanic.worker.profiler import PROFILE_SIGNAL
 
 
 def worker_serve(
@@ -102,6 +103,10 @@ def worker_serve(
                 a.multiplexer = WorkerMultiplexer(
                     monitor_publisher, worker_state
                 )
+            if PROFILE_SIGNAL is not None:
+                loop.add_signal_handler(
+                    PROFILE_SIGNAL, app.multiplexer.profile_requested
+                )
 
         if app.debug:
             loop.set_debug(app.debug)
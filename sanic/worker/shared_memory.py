@@ -0,0 +1,687 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, MutableMapping
+from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from pickle import dumps, loads
+from struct import Struct
+from threading import RLock
+from time import time
+from typing import (
+    Any,
+    Dict,
+    ItemsView,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    ValuesView,
+    cast,
+)
+
+from sanic.worker.constants import ProcessState
+
+
+# seq, key length, key hash, value length, expires, last used
+SLOT_HEADER = Struct("<IIQIxxxxdd")
+SLOT_USED = Struct("<d")
+USED_OFFSET = SLOT_HEADER.size - SLOT_USED.size
+READ_RETRIES = 100
+
+# seq, flags, name length, pid, state, server, starts, requests, start_at,
+# restart_at, extra length
+ROW_HEADER = Struct("<IHHqBBxxIQqqI")
+ROW_NAME_SIZE = 64
+ROW_EMPTY = (0, 0, 0, 0, 0, 0, 0)
+# The column of each field, and its bit in the flags
+ROW_COLUMNS = {
+    key: (index, 1 << index)
+    for index, key in enumerate(
+        (
+            "pid",
+            "state",
+            "server",
+            "starts",
+            "requests",
+            "start_at",
+            "restart_at",
+        )
+    )
+}
+ROW_LIMITS = {"pid": 2**63, "starts": 2**32, "requests": 2**64}
+PROCESS_STATES = tuple(state.name for state in ProcessState)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _fits(key: str, value: Any) -> bool:
+    if key == "state":
+        return value in PROCESS_STATES
+    if key == "server":
+        return isinstance(value, bool)
+    if key in ("start_at", "restart_at"):
+        return isinstance(value, datetime) and value.tzinfo is timezone.utc
+    return type(value) is int and 0 <= value < ROW_LIMITS[key]
+
+
+def _to_column(key: str, value: Any) -> int:
+    if key == "state":
+        return PROCESS_STATES.index(value) + 1
+    if isinstance(value, datetime):
+        return (value - EPOCH) // timedelta(microseconds=1)
+    return int(value)
+
+
+def _from_column(key: str, value: int) -> Any:
+    if key == "state":
+        return PROCESS_STATES[value - 1]
+    if key == "server":
+        return bool(value)
+    if key in ("start_at", "restart_at"):
+        return EPOCH + timedelta(microseconds=value)
+    return value
+
+
+class SharedBlock:
+    """Base class for objects that keep their data in shared memory.
+
+    The block is created by the process that creates the object, normally
+    the main process. When the object is passed to a worker, it is pickled
+    with the name of the block, and the worker attaches to the same block.
+    Writers share a lock, that is passed along with the block.
+
+    When there is only one process, the block does not need to be shared,
+    and it can be kept in the memory of the process instead.
+
+    Args:
+        size (int): The size of the block, in bytes.
+        shared (bool, optional): Whether to keep the block in shared memory.
+            Defaults to `True`.
+    """
+
+    # The attributes that are passed to the workers, besides the block
+    _shared_attrs: Tuple[str, ...] = ()
+
+    _buf: memoryview
+
+    def __init__(self, size: int, shared: bool = True) -> None:
+        self._memory: Optional[SharedMemory] = None
+        if shared:
+            # A lock from the spawn context can be shared with workers that
+            # are started with any method
+            self._lock: Any = get_context("spawn").Lock()
+            self._memory = SharedMemory(create=True, size=size)
+            self._buf = cast(memoryview, self._memory.buf)
+        else:
+            self._lock = RLock()
+            self._buf = memoryview(bytearray(size))
+        self._owner = shared
+        self._closed = False
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block.
+
+        Returns:
+            str: The name, or an empty string if the block is not shared.
+        """
+        return self._memory.name if self._memory else ""
+
+    @property
+    def closed(self) -> bool:
+        """Whether the block has been closed.
+
+        Returns:
+            bool: `True` once `close` or `unlink` has been called.
+        """
+        return self._closed
+
+    def __getstate__(self) -> Dict[str, Any]:
+        if self._memory is None:
+            raise TypeError(
+                f"{self.__class__.__name__} is not in shared memory, and "
+                "cannot be passed to another process"
+            )
+        return {
+            **{attr: getattr(self, attr) for attr in self._shared_attrs},
+            "_lock": self._lock,
+            "name": self._memory.name,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._memory = SharedMemory(name=state.pop("name"))
+        self._buf = cast(memoryview, self._memory.buf)
+        self._owner = False
+        self._closed = False
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def close(self) -> None:
+        """Detach from the shared memory, without releasing it.
+
+        The block cannot be used once it is closed.
+        """
+        self._closed = True
+        if self._memory is not None:
+            try:
+                self._memory.close()
+            except BufferError:
+                # A thread is still reading from the block, which is then
+                # unmapped when the process exits
+                pass
+
+    def unlink(self) -> None:
+        """Release the shared memory.
+
+        This only has an effect in the process that created the object.
+        """
+        if self._owner and self._memory is not None:
+            self._owner = False
+            self.close()
+            self._memory.unlink()
+
+
+class SharedCache(SharedBlock):
+    """A key/value cache in shared memory, for use by all of the workers.
+
+    The cache is a fixed number of slots of a fixed size, so it never
+    grows. A key is hashed to a bucket of `ways` slots, and it is stored in
+    the first slot of the bucket that is free or has expired. When the
+    bucket is full, the least recently used entry is replaced.
+
+    Writes take a lock that is shared between the processes. Reads do not:
+    every slot carries a sequence number that a writer increments before
+    and after it changes the slot, so a reader retries when it sees a slot
+    that is being written, or that changed while it was being read.
+
+    The cache must be created in the main process, and added to the
+    `shared_ctx` before the workers are started. The shared memory is
+    released when the server stops.
+
+    ```python
+    @app.main_process_start
+    async def create_cache(app):
+        app.shared_ctx.cache = SharedCache(slots=4096, slot_size=2048)
+
+    @app.get("/")
+    async def handler(request):
+        cache = request.app.shared_ctx.cache
+        body = cache.get("index")
+        if body is None:
+            body = await render_index()
+            cache.set("index", body, ttl=5)
+        return raw(body)
+    ```
+
+    Args:
+        slots (int, optional): The number of entries that the cache can
+            hold. It is rounded up to a multiple of `ways`. Defaults
+            to `1024`.
+        slot_size (int, optional): The largest size of a key and its value
+            together, in bytes. Defaults to `1024`.
+        ways (int, optional): The number of slots that a key may be stored
+            in. Defaults to `8`.
+        ttl (Optional[float], optional): How long entries are kept, in
+            seconds, unless `set` is given a `ttl`. When `None`, entries are
+            kept until they are evicted. Defaults to `None`.
+    """
+
+    _shared_attrs = ("buckets", "ways", "slot_size", "ttl")
+
+    def __init__(
+        self,
+        slots: int = 1024,
+        slot_size: int = 1024,
+        ways: int = 8,
+        ttl: Optional[float] = None,
+    ) -> None:
+        if slots < 1 or slot_size < 1 or ways < 1:
+            raise ValueError(
+                "SharedCache slots, slot_size and ways must be at least 1"
+            )
+        ways = min(ways, slots)
+        self.buckets = -(-slots // ways)
+        self.ways = ways
+        self.slot_size = slot_size
+        self.ttl = ttl
+        super().__init__(self.size)
+
+    @property
+    def slots(self) -> int:
+        """The number of entries that the cache can hold.
+
+        Returns:
+            int: The number of slots.
+        """
+        return self.buckets * self.ways
+
+    @property
+    def size(self) -> int:
+        """The size of the shared memory, in bytes.
+
+        Returns:
+            int: The number of bytes.
+        """
+        return self.slots * self._stride
+
+    @property
+    def _stride(self) -> int:
+        return SLOT_HEADER.size + self.slot_size
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: name={self.name} "
+            f"slots={self.slots} slot_size={self.slot_size}>"
+        )
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        now = time()
+        buf = self._buf
+        return sum(
+            1
+            for offset in self._offsets(0, self.slots)
+            if self._live(SLOT_HEADER.unpack_from(buf, offset), now)
+        )
+
+    def get(
+        self, key: Union[str, bytes], default: Optional[bytes] = None
+    ) -> Optional[bytes]:
+        """Get the value of a key.
+
+        Args:
+            key (Union[str, bytes]): The key.
+            default (Optional[bytes], optional): What to return when the key
+                is not in the cache. Defaults to `None`.
+
+        Returns:
+            Optional[bytes]: The value, or `default`.
+        """
+        key = self._encode(key)
+        key_hash = self._hash(key)
+        buf = self._buf
+        for offset in self._bucket(key_hash):
+            for _ in range(READ_RETRIES):
+                header = SLOT_HEADER.unpack_from(buf, offset)
+                seq, key_len, slot_hash, value_len, expires, _ = header
+                if seq & 1:
+                    continue
+                if slot_hash != key_hash or key_len != len(key):
+                    break
+                start = offset + SLOT_HEADER.size
+                data = bytes(buf[start : start + key_len + value_len])
+                if SLOT_HEADER.unpack_from(buf, offset)[0] != seq:
+                    continue
+                if data[:key_len] != key:
+                    break
+                now = time()
+                if expires and expires <= now:
+                    return default
+                SLOT_USED.pack_into(buf, offset + USED_OFFSET, now)
+                return data[key_len:]
+        return default
+
+    def set(
+        self,
+        key: Union[str, bytes],
+        value: bytes,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Set the value of a key.
+
+        Args:
+            key (Union[str, bytes]): The key.
+            value (bytes): The value.
+            ttl (Optional[float], optional): How long the entry is kept, in
+                seconds. Defaults to the `ttl` of the cache.
+
+        Raises:
+            ValueError: If the key is empty, or if the key and the value do
+                not fit in a slot.
+        """
+        key = self._encode(key)
+        if not key:
+            raise ValueError("SharedCache keys cannot be empty")
+        if len(key) + len(value) > self.slot_size:
+            raise ValueError(
+                f"Entry of {len(key) + len(value)} bytes does not fit in "
+                f"a SharedCache slot of {self.slot_size} bytes"
+            )
+        if ttl is None:
+            ttl = self.ttl
+        key_hash = self._hash(key)
+        buf = self._buf
+        with self._lock:
+            now = time()
+            target: Optional[int] = None
+            free: Optional[int] = None
+            oldest, oldest_used = 0, float("inf")
+            for offset in self._bucket(key_hash):
+                header = SLOT_HEADER.unpack_from(buf, offset)
+                if not self._live(header, now):
+                    if free is None:
+                        free = offset
+                elif self._matches(buf, offset, header, key, key_hash):
+                    target = offset
+                    break
+                elif header[5] < oldest_used:
+                    oldest, oldest_used = offset, header[5]
+            if target is None:
+                target = oldest if free is None else free
+            expires = now + ttl if ttl else 0.0
+            self._write(target, key, value, key_hash, expires, now)
+
+    def delete(self, key: Union[str, bytes]) -> bool:
+        """Remove a key from the cache.
+
+        Args:
+            key (Union[str, bytes]): The key.
+
+        Returns:
+            bool: `True` if the key was in the cache.
+        """
+        key = self._encode(key)
+        key_hash = self._hash(key)
+        buf = self._buf
+        with self._lock:
+            now = time()
+            for offset in self._bucket(key_hash):
+                header = SLOT_HEADER.unpack_from(buf, offset)
+                if self._matches(buf, offset, header, key, key_hash):
+                    self._write(offset, b"", b"", 0, 0.0, 0.0)
+                    return self._live(header, now)
+        return False
+
+    def clear(self) -> None:
+        """Remove every key from the cache."""
+        with self._lock:
+            for offset in self._offsets(0, self.slots):
+                self._write(offset, b"", b"", 0, 0.0, 0.0)
+
+    def _write(
+        self,
+        offset: int,
+        key: bytes,
+        value: bytes,
+        key_hash: int,
+        expires: float,
+        used: float,
+    ) -> None:
+        buf = self._buf
+        seq = SLOT_HEADER.unpack_from(buf, offset)[0]
+        # An odd sequence number tells readers that the slot is changing
+        SLOT_HEADER.pack_into(
+            buf, offset, (seq + 1) & 0xFFFFFFFF, 0, 0, 0, 0.0, 0.0
+        )
+        start = offset + SLOT_HEADER.size
+        buf[start : start + len(key)] = key
+        buf[start + len(key) : start + len(key) + len(value)] = value
+        SLOT_HEADER.pack_into(
+            buf,
+            offset,
+            (seq + 2) & 0xFFFFFFFF,
+            len(key),
+            key_hash,
+            len(value),
+            expires,
+            used,
+        )
+
+    def _bucket(self, key_hash: int) -> Iterator[int]:
+        first = (key_hash % self.buckets) * self.ways
+        return self._offsets(first, first + self.ways)
+
+    def _offsets(self, first: int, last: int) -> Iterator[int]:
+        stride = self._stride
+        return iter(range(first * stride, last * stride, stride))
+
+    def _matches(
+        self,
+        buf: memoryview,
+        offset: int,
+        header: tuple,
+        key: bytes,
+        key_hash: int,
+    ) -> bool:
+        _, key_len, slot_hash, *_ = header
+        if slot_hash != key_hash or key_len != len(key):
+            return False
+        start = offset + SLOT_HEADER.size
+        return buf[start : start + key_len] == key
+
+    @staticmethod
+    def _live(header: tuple, now: float) -> bool:
+        _, key_len, _, _, expires, _ = header
+        return bool(key_len) and not (expires and expires <= now)
+
+    @staticmethod
+    def _encode(key: Union[str, bytes]) -> bytes:
+        return key.encode() if isinstance(key, str) else key
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        # The built-in hash() is salted differently in every process
+        return int.from_bytes(blake2b(key, digest_size=8).digest(), "little")
+
+
+class SharedStateTable(SharedBlock, MutableMapping):
+    """The state of the processes of a server, in shared memory.
+
+    This is a mapping of process names to their state, that every process
+    can read and update without going through another process. Each process
+    has a row of a fixed size. The fields that Sanic keeps for every process
+    have their own columns: `pid`, `state`, `server`, `starts`, `requests`,
+    `start_at` and `restart_at`. Any other fields are pickled together into
+    the rest of the row.
+
+    Like `SharedCache`, updates take a shared lock, and reads use the
+    sequence number of the row to detect and retry a read that overlapped
+    with an update. A row that keeps changing is read with the lock. Once
+    the table is closed, it is empty.
+
+    .. note::
+        This is used internally by Sanic to keep the worker state, and
+        should not typically need to be instantiated directly.
+
+    Args:
+        rows (int, optional): The number of processes that the table can
+            hold. Defaults to `64`.
+        extra_size (int, optional): The size of the pickled fields that do
+            not have their own column, in bytes. Defaults to `4096`.
+    """
+
+    _shared_attrs = ("rows", "extra_size")
+
+    def __init__(self, rows: int = 64, extra_size: int = 4096) -> None:
+        if rows < 1 or extra_size < 0:
+            raise ValueError("SharedStateTable must have at least 1 row")
+        self.rows = rows
+        self.extra_size = extra_size
+        super().__init__(rows * self._stride)
+
+    @property
+    def _stride(self) -> int:
+        return ROW_HEADER.size + ROW_NAME_SIZE + self.extra_size
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {dict(self)!r}>"
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        for offset in self._offsets():
+            found = self._read(offset, name)
+            if found is not None:
+                return found[1]
+        raise KeyError(name)
+
+    def __setitem__(self, name: str, value: Mapping[str, Any]) -> None:
+        encoded = name.encode()
+        if not encoded or len(encoded) > ROW_NAME_SIZE:
+            raise ValueError(
+                f"SharedStateTable names must be 1 to {ROW_NAME_SIZE} bytes"
+            )
+        values, flags, extra = self._encode(value)
+        with self._lock:
+            target = self._find(encoded)
+            if target is None:
+                target = self._find(b"")
+            if target is None:
+                raise RuntimeError(
+                    f"SharedStateTable is full, it has {self.rows} rows"
+                )
+            self._write(target, encoded, values, flags, extra)
+
+    def __delitem__(self, name: str) -> None:
+        with self._lock:
+            target = self._find(name.encode())
+            if target is None:
+                raise KeyError(name)
+            self._write(target, b"", ROW_EMPTY, 0, b"")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([name for name, _ in self._rows()])
+
+    def __len__(self) -> int:
+        return len(self._rows())
+
+    def __contains__(self, name: object) -> bool:
+        return (
+            isinstance(name, str)
+            and not self._closed
+            and self._find(name.encode()) is not None
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return dict(self._rows()) == dict(other)
+        return NotImplemented
+
+    def items(self) -> ItemsView[str, Dict[str, Any]]:  # type: ignore
+        return dict(self._rows()).items()
+
+    def values(self) -> ValuesView[Dict[str, Any]]:  # type: ignore
+        return dict(self._rows()).values()
+
+    def _rows(self) -> List[Tuple[str, Dict[str, Any]]]:
+        rows = []
+        for offset in self._offsets():
+            found = self._read(offset)
+            if found is not None:
+                rows.append(found)
+        return rows
+
+    def _offsets(self) -> range:
+        stride = self._stride
+        return range(0, self.rows * stride, stride)
+
+    def _find(self, name: bytes) -> Optional[int]:
+        buf = self._buf
+        for offset in self._offsets():
+            name_len = ROW_HEADER.unpack_from(buf, offset)[2]
+            start = offset + ROW_HEADER.size
+            if name_len == len(name) and buf[start : start + name_len] == name:
+                return offset
+        return None
+
+    def _read(
+        self, offset: int, name: Optional[str] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        if self._closed:
+            return None
+        try:
+            for _ in range(READ_RETRIES):
+                consistent, row = self._read_row(offset, name)
+                if consistent:
+                    return row
+            # A writer keeps changing the row, read it once it is done
+            with self._lock:
+                return self._read_row(offset, name)[1]
+        except ValueError:
+            # The table was closed by another thread while it was read
+            if self._closed:
+                return None
+            raise
+
+    def _read_row(
+        self, offset: int, name: Optional[str]
+    ) -> Tuple[bool, Optional[Tuple[str, Dict[str, Any]]]]:
+        buf = self._buf
+        start = offset + ROW_HEADER.size
+        header = ROW_HEADER.unpack_from(buf, offset)
+        seq, flags, name_len, *values, extra_len = header
+        if seq & 1:
+            return False, None
+        if not name_len:
+            return True, None
+        row_name = bytes(buf[start : start + name_len])
+        extra_start = start + ROW_NAME_SIZE
+        extra = bytes(buf[extra_start : extra_start + extra_len])
+        if ROW_HEADER.unpack_from(buf, offset)[0] != seq:
+            return False, None
+        if name is not None and row_name != name.encode():
+            return True, None
+        return True, (row_name.decode(), self._decode(values, flags, extra))
+
+    def _write(
+        self,
+        offset: int,
+        name: bytes,
+        values: Tuple[Any, ...],
+        flags: int,
+        extra: bytes,
+    ) -> None:
+        buf = self._buf
+        seq = ROW_HEADER.unpack_from(buf, offset)[0]
+        # An odd sequence number tells readers that the row is changing
+        ROW_HEADER.pack_into(
+            buf, offset, (seq + 1) & 0xFFFFFFFF, 0, 0, *ROW_EMPTY, 0
+        )
+        start = offset + ROW_HEADER.size
+        buf[start : start + len(name)] = name
+        extra_start = start + ROW_NAME_SIZE
+        buf[extra_start : extra_start + len(extra)] = extra
+        ROW_HEADER.pack_into(
+            buf,
+            offset,
+            (seq + 2) & 0xFFFFFFFF,
+            flags,
+            len(name),
+            *values,
+            len(extra),
+        )
+
+    def _encode(
+        self, value: Mapping[str, Any]
+    ) -> Tuple[Tuple[Any, ...], int, bytes]:
+        values = list(ROW_EMPTY)
+        flags = 0
+        extra = {}
+        for key, item in value.items():
+            column = ROW_COLUMNS.get(key)
+            if column is not None and _fits(key, item):
+                index, flag = column
+                values[index] = _to_column(key, item)
+                flags |= flag
+            else:
+                extra[key] = item
+        data = dumps(extra) if extra else b""
+        if len(data) > self.extra_size:
+            raise ValueError(
+                f"State of {len(data)} bytes does not fit in a "
+                f"SharedStateTable row of {self.extra_size} bytes"
+            )
+        return tuple(values), flags, data
+
+    @staticmethod
+    def _decode(values: List[Any], flags: int, extra: bytes) -> Dict[str, Any]:
+        state = {
+            key: _from_column(key, values[index])
+            for key, (index, flag) in ROW_COLUMNS.items()
+            if flags & flag
+        }
+        if extra:
+            state.update(loads(extra))
+        return state
@@ -0,0 +1,136 @@
+import asyncio
+
+from unittest.mock import Mock
+
+import pytest
+
+from sanic import Sanic
+from sanic.response import text
+from sanic.server.admission import AdmissionControl
+
+
+@pytest.fixture
+def admission():
+    return AdmissionControl(
+        Mock(metrics=None),
+        max_requests=1,
+        queue_size=1,
+        queue_timeout=1,
+        retry_after=5,
+        hooks=[],
+    )
+
+
+async def _get(port: int, path: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    response = await reader.read(1024)
+    writer.close()
+    return response
+
+
+@pytest.fixture
+def limited_app(app: Sanic):
+    app.config.ADMISSION_MAX_REQUESTS = 1
+
+    @app.get("/")
+    async def handler(request):
+        response = await _get(request.server_port, request.args.get("path"))
+        return text(response.decode())
+
+    @app.get("/other")
+    async def other(request):
+        return text("other")
+
+    return app
+
+
+def test_excess_request_is_shed(limited_app: Sanic):
+    _, response = limited_app.test_client.get("/", params={"path": "/other"})
+
+    assert response.status == 200
+    assert response.text.startswith("HTTP/1.1 503 Service Unavailable\r\n")
+    assert "retry-after: 1\r\n" in response.text
+    assert limited_app.admission.shed == 1
+    assert limited_app.admission.in_flight == 0
+
+
+def test_queued_request_times_out(limited_app: Sanic):
+    limited_app.config.ADMISSION_QUEUE_SIZE = 1
+    limited_app.config.ADMISSION_QUEUE_TIMEOUT = 0.1
+    limited_app.config.METRICS = True
+
+    @limited_app.after_server_start
+    async def keep_table(app):
+        app.ctx.table = app._metrics_table
+
+    _, response = limited_app.test_client.get("/", params={"path": "/other"})
+
+    assert " 503 " in response.text
+    assert limited_app.admission.queued == 1
+    counters = limited_app.ctx.table.collect()["counters"]
+    assert counters["sanic_requests_queued_total"] == 1
+    assert counters["sanic_requests_waiting"] == 0
+    assert counters["sanic_requests_shed_total"] == 1
+
+
+def test_bypass(limited_app: Sanic):
+    hook = limited_app.admission_bypass(
+        lambda request: request.path == "/other"
+    )
+
+    _, response = limited_app.test_client.get("/", params={"path": "/other"})
+
+    assert response.text.startswith("HTTP/1.1 200 OK\r\n")
+    assert response.text.endswith("other")
+    assert limited_app._admission_hooks == [hook]
+
+
+def test_no_limit_by_default(app: Sanic):
+    @app.get("/")
+    async def handler(request):
+        return text("done")
+
+    _, response = app.test_client.get("/")
+
+    assert response.text == "done"
+    assert app.admission is None
+
+
+async def test_queue_is_fair(admission: AdmissionControl):
+    request = Mock()
+    assert await admission.acquire(request)
+
+    waiting = asyncio.ensure_future(admission.acquire(request))
+    await asyncio.sleep(0)
+    assert not await admission.acquire(request)
+
+    admission.release()
+    assert await waiting
+    assert admission.in_flight == 1
+    admission.release()
+    assert admission.in_flight == 0
+    assert admission.shed == 1
+
+
+async def test_cancelled_waiter_leaves_queue(admission: AdmissionControl):
+    request = Mock()
+    await admission.acquire(request)
+    waiting = asyncio.ensure_future(admission.acquire(request))
+    await asyncio.sleep(0)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    admission.release()
+    assert admission.in_flight == 0
+    assert await admission.acquire(request)
+
+
+def test_shed_responses(admission: AdmissionControl):
+    assert admission.response(True) == (
+        b"HTTP/1.1 503 Service Unavailable\r\ncontent-length: 0\r\n"
+        b"retry-after: 5\r\nconnection: keep-alive\r\n\r\n"
+    )
+    assert b"connection: close" in admission.response(False)
@@ -185,6 +185,64 @@ def test_app_handle_request_handler_is_none(app: Sanic, monkeypatch):
     )
 
 
+def test_app_route_pipeline(app: Sanic):
+    events = []
+
+    @app.signal("http.handler.before")
+    def before(request):
+        events.append(request.route.name)
+
+    @app.on_request
+    def on_request(request):
+        events.append("middleware")
+
+    @app.get("/coroutine")
+    async def coroutine(request):
+        return text("coroutine")
+
+    def sync(request):
+        return text("sync")
+
+    app.add_route(sync, "/sync")
+
+    @app.post("/stream", stream=True)
+    async def stream(request):
+        return text("stream")
+
+    @app.websocket("/ws")
+    async def ws(request, ws): ...
+
+    _, response = app.test_client.get("/coroutine")
+    assert response.text == "coroutine"
+    _, response = app.test_client.get("/sync")
+    assert response.text == "sync"
+    assert events == [
+        "middleware",
+        "test_app_route_pipeline.coroutine",
+        "middleware",
+        "test_app_route_pipeline.sync",
+    ]
+
+    pipelines = {
+        route.name.rsplit(".", 1)[-1]: route.extra.pipeline
+        for route in app.router.routes
+    }
+    assert pipelines["coroutine"].is_coroutine
+    assert not pipelines["sync"].is_coroutine
+    assert (
+        pipelines["coroutine"].call_handler
+        == pipelines["coroutine"]._call_coroutine
+    )
+    assert pipelines["sync"].call_handler == pipelines["sync"]._call_sync
+    assert pipelines["stream"].is_stream
+    assert pipelines["ws"].is_websocket
+    for pipeline in pipelines.values():
+        assert pipeline.request_middleware
+        assert pipeline.dispatch_handler_before
+        assert not pipeline.dispatch_handler_after
+        assert not pipeline.dispatch_response
+
+
 @pytest.mark.parametrize("websocket_enabled", [True, False])
 @pytest.mark.parametrize("enable", [True, False])
 def test_app_enable_websocket(app: Sanic, websocket_enabled, enable):
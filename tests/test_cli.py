@@ -301,6 +301,21 @@ def test_noisy_exceptions(cmd: str, expected: bool, caplog, port):
     assert info["noisy_exceptions"] is expected
 
 
+@pytest.mark.parametrize(
+    "cmd,expected",
+    (
+        ("--loop-monitor", True),
+        ("--no-loop-monitor", False),
+    ),
+)
+def test_loop_monitor(cmd: str, expected: bool, caplog, port):
+    command = ["fake.server.app", cmd, f"-p={port}"]
+    lines = capture(command, caplog)
+    info = read_app_info(lines)
+
+    assert info["loop_monitor"] is expected
+
+
 def test_inspector_inspect(urlopen, caplog, capsys):
     urlopen.read.return_value = json.dumps(
         {
@@ -330,6 +345,11 @@ def test_inspector_inspect(urlopen, caplog, capsys):
         (["reload", "--zero-downtime"], {"zero_downtime": True}),
         (["shutdown"], {}),
         (["scale", "9"], {"replicas": 9}),
+        (["profile"], {"seconds": 10, "worker": "0"}),
+        (
+            ["profile", "--seconds", "30", "--worker", "1"],
+            {"seconds": 30, "worker": "1"},
+        ),
         (["foo", "--bar=something"], {"bar": "something"}),
         (["foo", "--bar"], {"bar": True}),
         (["foo", "--no-bar"], {"bar": False}),
@@ -0,0 +1,222 @@
+import gzip
+import zlib
+
+import pytest
+
+from sanic import Sanic
+from sanic.headers import parse_accept_encoding
+from sanic.response import file, json, raw, text
+from sanic.response.compression import (
+    COMPRESSORS,
+    DeflateCompressor,
+    GzipCompressor,
+    is_compressible,
+    negotiate_encoding,
+)
+
+
+BODY = "Sanic " * 200
+
+
+@pytest.fixture
+def compressed_app(app: Sanic):
+    app.config.COMPRESSION = True
+    app.config.COMPRESSION_ENCODINGS = ("gzip", "deflate")
+
+    @app.get("/text")
+    async def handler_text(request):
+        return text(BODY)
+
+    @app.get("/small")
+    async def handler_small(request):
+        return text("small")
+
+    @app.get("/image")
+    async def handler_image(request):
+        return raw(BODY.encode(), content_type="image/png")
+
+    @app.get("/json")
+    async def handler_json(request):
+        return json({"body": BODY}, headers={"vary": "Origin"})
+
+    @app.get("/stream")
+    async def handler_stream(request):
+        response = await request.respond(content_type="text/plain")
+        for _ in range(3):
+            await response.send(BODY)
+        await response.eof()
+        request.app.ctx.compressor = response._compressor
+
+    return app
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        (None, {}),
+        ("", {}),
+        ("gzip", {"gzip": 1.0}),
+        ("gzip, deflate;q=0.5", {"gzip": 1.0, "deflate": 0.5}),
+        ("GZIP;q=0, *;q=0.1", {"gzip": 0.0, "*": 0.1}),
+        ("br;q=foo, gzip", {"gzip": 1.0}),
+    ),
+)
+def test_parse_accept_encoding(value, expected):
+    assert parse_accept_encoding(value) == expected
+
+
+@pytest.mark.parametrize(
+    "accept,expected",
+    (
+        (None, None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("deflate, gzip;q=0.5", "deflate"),
+        ("gzip;q=0, deflate", "deflate"),
+        ("*", "gzip"),
+        ("*, gzip;q=0", "deflate"),
+        ("unknown", None),
+    ),
+)
+def test_negotiate_encoding(accept, expected):
+    assert negotiate_encoding(accept, ("gzip", "deflate")) == expected
+
+
+@pytest.mark.parametrize(
+    "content_type,expected",
+    (
+        ("text/html; charset=utf-8", True),
+        ("application/json", True),
+        ("application/problem+json", True),
+        ("image/png", False),
+        ("application/octet-stream", False),
+        (None, False),
+    ),
+)
+def test_is_compressible(content_type, expected):
+    types = ("text/", "application/json", "+json")
+    assert is_compressible(content_type, types) is expected
+
+
+@pytest.mark.parametrize(
+    "compressor,decompress",
+    (
+        (GzipCompressor, gzip.decompress),
+        (DeflateCompressor, zlib.decompress),
+    ),
+)
+def test_compressor_in_parts(compressor, decompress):
+    instance = compressor()
+    parts = [instance.compress(b"foo" * 100), instance.compress(b"bar" * 100)]
+    parts.append(instance.finish(b"baz"))
+    assert decompress(b"".join(parts)) == b"foo" * 100 + b"bar" * 100 + b"baz"
+
+
+def test_compressors_available():
+    assert {"gzip", "deflate"} <= set(COMPRESSORS)
+
+
+def test_compression_disabled_by_default(app: Sanic):
+    @app.get("/")
+    async def handler(request):
+        return text(BODY)
+
+    _, response = app.test_client.get("/", headers={"accept-encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+@pytest.mark.parametrize(
+    "accept,encoding",
+    (
+        ("gzip", "gzip"),
+        ("deflate", "deflate"),
+        ("gzip;q=0.5, deflate", "deflate"),
+    ),
+)
+def test_compressed_response(compressed_app: Sanic, accept, encoding):
+    _, response = compressed_app.test_client.get(
+        "/text", headers={"accept-encoding": accept}
+    )
+    assert response.status == 200
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == BODY
+    assert int(response.headers["content-length"]) < len(BODY)
+
+
+def test_compressed_response_identity(compressed_app: Sanic):
+    _, response = compressed_app.test_client.get(
+        "/text", headers={"accept-encoding": "identity"}
+    )
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-length"] == str(len(BODY))
+
+
+@pytest.mark.parametrize("path", ("/small", "/image"))
+def test_compression_skipped(compressed_app: Sanic, path):
+    _, response = compressed_app.test_client.get(
+        path, headers={"accept-encoding": "gzip"}
+    )
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_compressed_response_vary_merged(compressed_app: Sanic):
+    _, response = compressed_app.test_client.get(
+        "/json", headers={"accept-encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Origin, Accept-Encoding"
+    assert response.json == {"body": BODY}
+
+
+def test_compressed_streaming_response(compressed_app: Sanic):
+    _, response = compressed_app.test_client.get(
+        "/stream", headers={"accept-encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["transfer-encoding"] == "chunked"
+    assert response.text == BODY * 3
+    assert compressed_app.ctx.compressor is None
+
+
+def test_compressed_file_response(compressed_app: Sanic, tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text(BODY)
+
+    @compressed_app.get("/file")
+    async def handler(request):
+        return await file(path, headers={"etag": '"abc"'})
+
+    _, response = compressed_app.test_client.get(
+        "/file", headers={"accept-encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.text == BODY
+
+
+@pytest.mark.asyncio
+async def test_compressed_response_asgi(compressed_app: Sanic):
+    _, response = await compressed_app.asgi_client.get(
+        "/text", headers={"accept-encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BODY
+
+
+@pytest.mark.asyncio
+async def test_compressed_streaming_response_asgi(compressed_app: Sanic):
+    _, response = await compressed_app.asgi_client.get(
+        "/stream", headers={"accept-encoding": "gzip"}
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BODY * 3
+
+
+def test_compression_config_from_string(app: Sanic):
+    app.config.COMPRESSION_ENCODINGS = "gzip, Deflate"
+    assert app.config.COMPRESSION_ENCODINGS == ("gzip", "deflate")
@@ -0,0 +1,147 @@
+import asyncio
+
+from unittest.mock import Mock
+
+import pytest
+
+from sanic import Blueprint, Sanic
+from sanic.response import text
+from sanic.server.admission import (
+    ConcurrencyLimit,
+    concurrency_limits,
+    report_limits,
+)
+
+
+async def _get(port: int, path: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    response = await reader.read(1024)
+    writer.close()
+    return response
+
+
+async def _call(request, path):
+    if request.args.get("inner"):
+        return text("inner")
+    response = await _get(request.server_port, path)
+    return text(response.decode())
+
+
+def test_route_concurrency_limit(app: Sanic):
+    @app.get("/", max_concurrency=1)
+    async def handler(request):
+        return await _call(request, "/?inner=1")
+
+    @app.get("/other")
+    async def other(request):
+        return await _call(request, "/other?inner=1")
+
+    _, response = app.test_client.get("/")
+    _, other_response = app.test_client.get("/other")
+
+    assert response.text.startswith("HTTP/1.1 503 Service Unavailable\r\n")
+    assert "retry-after: 1\r\n" in response.text
+    assert other_response.text.startswith("HTTP/1.1 200 OK\r\n")
+
+    route = app.router.name_index[f"{app.name}.handler"]
+    assert route.extra.max_concurrency == 1
+    assert route.extra.queue == 0
+    assert route.extra.concurrency_limit.status() == {
+        "max_concurrency": 1,
+        "queue": 0,
+        "in_flight": 0,
+        "waiting": 0,
+        "shed": 1,
+    }
+    assert "max_concurrency=1/0" in repr(route.extra.pipeline)
+
+
+def test_blueprint_concurrency_limit(app: Sanic):
+    bp = Blueprint("reports", url_prefix="/reports", max_concurrency=1)
+
+    @bp.get("/a")
+    async def a(request):
+        return await _call(request, "/reports/b?inner=1")
+
+    @bp.get("/b")
+    async def b(request):
+        return await _call(request, "/reports/b?inner=1")
+
+    @app.get("/")
+    async def handler(request):
+        return await _call(request, "/reports/b?inner=1")
+
+    app.blueprint(bp)
+
+    _, response = app.test_client.get("/reports/a")
+    _, outside = app.test_client.get("/")
+
+    assert " 503 " in response.text
+    assert outside.text.startswith("HTTP/1.1 200 OK\r\n")
+    limits = concurrency_limits(app.router.routes)
+    assert list(limits) == ["reports"]
+    assert limits["reports"].shed == 1
+
+
+def test_blueprint_and_route_limits(app: Sanic):
+    bp = Blueprint("reports", max_concurrency=2, queue=1)
+
+    @bp.get("/", max_concurrency=1)
+    async def handler(request):
+        return text("done")
+
+    app.blueprint(bp)
+    app.test_client.get("/")
+
+    route = app.router.name_index[f"{app.name}.reports.handler"]
+    assert route.extra.pipeline.limits == (
+        route.extra.blueprint_limit,
+        route.extra.concurrency_limit,
+    )
+    assert set(concurrency_limits(app.router.routes)) == {
+        "reports",
+        route.name,
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"max_concurrency": 0}, {"max_concurrency": 1, "queue": -1})
+)
+def test_invalid_limits(app: Sanic, kwargs):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        app.route("/", **kwargs)
+
+
+async def test_waiting_for_a_slot():
+    limit = ConcurrencyLimit(1, queue_size=1)
+    assert await limit.acquire()
+
+    waiting = asyncio.ensure_future(limit.acquire())
+    await asyncio.sleep(0)
+    assert limit.waiting == 1
+    assert not await limit.acquire()
+
+    limit.release()
+    assert await waiting
+    assert repr(limit) == "<ConcurrencyLimit: 1/1 in flight, 0/1 waiting>"
+    limit.release()
+    assert limit.in_flight == 0
+
+
+async def test_report_limits():
+    multiplexer = Mock()
+    limit = ConcurrencyLimit(2, name="reports")
+    task = asyncio.ensure_future(
+        report_limits(multiplexer, {"reports": limit}, interval=0.01)
+    )
+    await asyncio.sleep(0.05)
+    await limit.acquire()
+    await asyncio.sleep(0.05)
+    task.cancel()
+
+    updates = [
+        call.args[0]["concurrency_limits"]["reports"]["in_flight"]
+        for call in multiplexer.state.update.call_args_list
+    ]
+    assert updates == [0, 1]
@@ -17,9 +17,10 @@ parent_dir = Path(__file__).parent
 localhost_dir = parent_dir / "certs/localhost"
 
 
-@pytest.fixture
-def test_app(app: Sanic):
+@pytest.fixture(params=["python", "httptools"])
+def test_app(app: Sanic, request):
     app.config.KEEP_ALIVE_TIMEOUT = 1
+    app.config.HTTP1_PARSER = request.param
 
     @app.get("/")
     async def base_handler(request):
@@ -110,3 +111,62 @@ def test_url_encoding(client):
 
     assert b"400 Bad Request" in headers
     assert b"URL may only contain US-ASCII characters." in body
+
+
+def test_pipelined_with_chunked_body(client):
+    client.send(
+        b"POST /upload HTTP/1.1\r\n"
+        b"transfer-encoding: chunked\r\n\r\n"
+        b"3\r\nfoo\r\n0\r\n\r\n"
+        b"GET / HTTP/1.1\r\n\r\n"
+    )
+    response = b""
+    while response.count(b"200 OK") < 2 or not response.endswith(b"9999"):
+        response += client.recv()
+
+    assert response.count(b"200 OK") == 2
+    assert b'["foo"]' in response
+
+
+def test_invalid_http_version(client):
+    client.send(
+        """
+        GET / HTTP/2.0
+
+        """
+    )
+    response = client.recv()
+
+    assert b"400 Bad Request" in response
+
+
+def test_body_over_limit_is_rejected_before_it_is_received(
+    test_app: Sanic, port
+):
+    test_app.config.REQUEST_MAX_SIZE = 1000
+
+    @test_app.post("/body")
+    async def body_handler(request):
+        return text(str(len(request.body)))
+
+    runner = ReusableClient(test_app, port=port)
+    runner.run()
+    raw = RawClient(runner.host, runner.port)
+    try:
+        runner._run(raw.connect())
+        runner._run(
+            raw.send(
+                f"""
+                POST /body HTTP/1.1
+                content-length: {10**15}
+
+                """
+            )
+        )
+        response = runner._run(raw.recv())
+        runner._run(raw.close())
+    finally:
+        runner.stop()
+
+    assert b"413 Request Entity Too Large" in response
+    assert b"Request body exceeds the size limit" in response
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import time
+
+from unittest.mock import Mock
+
+import pytest
+
+from sanic import Sanic
+from sanic.response import text
+from sanic.server.monitor import LoopMonitor
+
+
+@pytest.fixture
+def monitored_app(app: Sanic):
+    app.config.LOOP_MONITOR = True
+    app.config.LOOP_MONITOR_INTERVAL = 0.01
+    app.config.LOOP_MONITOR_THRESHOLD = 0.1
+    return app
+
+
+def test_blocking_handler_is_reported(monitored_app: Sanic, caplog):
+    blocks = []
+    monitored_app.multiplexer = Mock()
+
+    @monitored_app.signal("server.loop.blocked")
+    async def on_blocked(duration, route, stack):
+        blocks.append((duration, route, stack))
+
+    @monitored_app.get("/block")
+    async def handler(request):
+        time.sleep(0.3)
+        await asyncio.sleep(0.1)
+        return text("done")
+
+    with caplog.at_level(logging.WARNING):
+        _, response = monitored_app.test_client.get("/block")
+
+    assert response.text == "done"
+    assert len(blocks) == 1
+    duration, route, stack = blocks[0]
+    assert duration >= 0.1
+    assert route == f"{monitored_app.name}.handler"
+    assert "time.sleep(0.3)" in stack
+    state = monitored_app.multiplexer.state.update.call_args.args[0]
+    assert state["loop_blocks"] == 1
+    assert state["loop_blocked"]["route"] == route
+    assert any(
+        "Event loop blocked" in message and route in message
+        for message in caplog.messages
+    )
+
+
+def test_async_handler_is_not_reported(monitored_app: Sanic):
+    blocks = []
+
+    @monitored_app.signal("server.loop.blocked")
+    async def on_blocked(**context):
+        blocks.append(context)
+
+    @monitored_app.get("/")
+    async def handler(request):
+        await asyncio.sleep(0.3)
+        return text("done")
+
+    monitored_app.test_client.get("/")
+
+    assert blocks == []
+    assert monitored_app._loop_monitor is None
+
+
+@pytest.mark.parametrize("interval,threshold", ((0, 1), (1, 0)))
+def test_invalid_monitor(app: Sanic, interval, threshold):
+    with pytest.raises(ValueError):
+        LoopMonitor(app, interval, threshold)
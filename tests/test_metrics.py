@@ -0,0 +1,149 @@
+from multiprocessing import get_context
+
+import pytest
+
+from sanic import Sanic
+from sanic.metrics import (
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    CONNECTIONS_OPEN,
+    IN_FLIGHT,
+    REQUESTS,
+    MetricsTable,
+)
+from sanic.response import text
+
+
+@pytest.fixture
+def table():
+    table = MetricsTable(rows=2, routes=2, buckets=(0.1, 1))
+    yield table
+    table.unlink()
+
+
+def _count_in_child(table: MetricsTable):
+    metrics = table.worker("Child")
+    metrics.add(REQUESTS, 5)
+    metrics.release()
+    table.close()
+
+
+def test_workers_are_added_up(table: MetricsTable):
+    one = table.worker("One")
+    two = table.worker("Two")
+    one.add(BYTES_SENT, 10)
+    two.add(BYTES_SENT, 5)
+    two.add(CONNECTIONS_OPEN)
+
+    counters = table.collect()["counters"]
+    assert counters["sanic_sent_bytes_total"] == 15
+    assert counters["sanic_connections_open"] == 1
+
+    with pytest.raises(RuntimeError, match="is full"):
+        table.worker("Three")
+    one.release()
+    two.release()
+
+
+def test_restarted_worker_keeps_counters(table: MetricsTable):
+    metrics = table.worker("Worker")
+    metrics.add(BYTES_RECEIVED, 10)
+    metrics.add(IN_FLIGHT)
+    metrics.release()
+
+    metrics = table.worker("Worker")
+    metrics.add(BYTES_RECEIVED, 10)
+    counters = table.collect()["counters"]
+    metrics.release()
+
+    assert counters["sanic_received_bytes_total"] == 20
+    assert counters["sanic_requests_in_flight"] == 0
+
+
+def test_updates_after_release_are_dropped(table: MetricsTable):
+    metrics = table.worker("Worker")
+    metrics.add(REQUESTS)
+    metrics.release()
+    metrics.add(REQUESTS)
+    metrics.add(IN_FLIGHT, -1)
+
+    counters = table.collect()["counters"]
+    assert counters["sanic_requests_total"] == 1
+    assert counters["sanic_requests_in_flight"] == 0
+
+
+def test_shared_between_processes(table: MetricsTable):
+    table.worker("Parent").add(REQUESTS)
+    process = get_context("spawn").Process(
+        target=_count_in_child, args=(table,)
+    )
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert table.collect()["counters"]["sanic_requests_total"] == 6
+
+
+def test_app_metrics(app: Sanic):
+    app.config.METRICS = True
+    app.config.METRICS_BUCKETS = "1, 0.1"
+
+    @app.get("/<name>")
+    async def handler(request, name):
+        return text(name)
+
+    app.test_client.get("/foo")
+    app.test_client.get("/foo/bar")
+    request, _ = app.test_client.get("/bar")
+
+    collected = app._metrics_table.collect()
+    counters = collected["counters"]
+    assert app.config.METRICS_BUCKETS == (0.1, 1.0)
+    assert counters["sanic_requests_total"] == 3
+    assert counters["sanic_requests_in_flight"] == 0
+    assert counters["sanic_connections_total"] == 3
+    assert counters["sanic_connections_open"] == 0
+    assert counters["sanic_received_bytes_total"] > 0
+    assert counters["sanic_sent_bytes_total"] > 0
+    assert collected["statuses"] == {200: 2, 404: 1}
+    count, _, fast, *_ = collected["routes"][request.route.name]
+    assert count == fast == 2
+
+    rendered = app._metrics_table.render()
+    assert 'sanic_responses_total{status="404"} 1\n' in rendered
+    assert (
+        "sanic_request_duration_seconds_bucket"
+        f'{{route="{request.route.name}",le="+Inf"}} 2\n'
+    ) in rendered
+
+
+def test_app_metrics_route_limit():
+    table = MetricsTable(rows=1, routes=1, shared=False)
+    app = Sanic("Limited")
+    app.config.METRICS = True
+    app._metrics_table = table
+
+    @app.get("/one")
+    async def one(request):
+        return text("one")
+
+    @app.get("/two")
+    async def two(request):
+        return text("two")
+
+    app.test_client.get("/one")
+    app.test_client.get("/two")
+
+    collected = table.collect()
+    assert collected["counters"]["sanic_requests_total"] == 2
+    assert list(collected["routes"]) == ["Limited.one"]
+
+
+def test_app_metrics_disabled(app: Sanic):
+    @app.get("/")
+    async def handler(request):
+        return text("")
+
+    app.test_client.get("/")
+    assert app.metrics is None
+    assert app._metrics_table is None
@@ -3,6 +3,8 @@ import logging
 from asyncio import CancelledError, sleep
 from itertools import count
 
+import pytest
+
 from sanic.exceptions import NotFound
 from sanic.request import Request
 from sanic.response import HTTPResponse, json, text
@@ -347,3 +349,29 @@ def test_middleware_run_on_timeout(app):
     app.test_client.get("/")
     assert request_middleware_run_count == 1
     assert response_middleware_run_count == 1
+
+
+@pytest.mark.parametrize("touchup", (True, False))
+def test_middleware_signals(app, touchup):
+    app.config.TOUCHUP = touchup
+    events = []
+
+    @app.on_request
+    def request_one(_):
+        events.append("one")
+
+    @app.on_request
+    def request_two(_):
+        events.append("two")
+
+    @app.signal("http.middleware.before", condition={"attach_to": "request"})
+    async def before(**_):
+        events.append("before")
+
+    @app.get("/")
+    async def handler(request):
+        return text("OK")
+
+    app.test_client.get("/")
+    assert events[events.index("one") - 1] == "before"
+    assert events[events.index("two") - 1] == "before"
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+
+from unittest.mock import Mock
+
+import pytest
+
+from sanic import Sanic
+from sanic.exceptions import SanicException, ServiceUnavailable
+from sanic.offload import Offloader
+from sanic.request import Request
+from sanic.response import json, text
+from sanic.views import HTTPMethodView
+
+
+def test_offloaded_handler_runs_on_a_thread(app: Sanic):
+    @app.get("/", offload="thread")
+    def handler(request):
+        return json(
+            {
+                "thread": threading.current_thread().name,
+                "current": Request.get_current() is request,
+            }
+        )
+
+    _, response = app.test_client.get("/")
+
+    assert response.json["thread"].startswith("SanicOffload")
+    assert response.json["current"] is True
+    assert app.router.routes_all[("",)].extra.offload == "thread"
+
+
+def test_sync_handlers_are_not_offloaded_by_default(app: Sanic):
+    @app.get("/")
+    def handler(request):
+        return text(threading.current_thread().name)
+
+    _, response = app.test_client.get("/")
+
+    assert response.text == threading.main_thread().name
+
+
+def test_offload_sync_handlers(app: Sanic):
+    app.config.OFFLOAD_SYNC_HANDLERS = True
+
+    @app.get("/sync")
+    def sync(request):
+        return text(threading.current_thread().name)
+
+    @app.get("/async")
+    async def handler(request):
+        return text(threading.current_thread().name)
+
+    class View(HTTPMethodView):
+        async def get(self, request):
+            return text(threading.current_thread().name)
+
+    app.add_route(View.as_view(), "/view")
+
+    _, sync_response = app.test_client.get("/sync")
+    _, async_response = app.test_client.get("/async")
+    _, view_response = app.test_client.get("/view")
+
+    assert sync_response.text.startswith("SanicOffload")
+    assert async_response.text == threading.main_thread().name
+    assert view_response.text == threading.main_thread().name
+
+
+def test_offloaded_handler_does_not_block(app: Sanic):
+    app.config.OFFLOAD_SYNC_HANDLERS = True
+
+    @app.get("/slow")
+    def slow(request):
+        time.sleep(0.2)
+        return text("slow")
+
+    @app.get("/")
+    async def handler(request):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(tick())
+        await app.offload(slow, request)
+        task.cancel()
+        return text(str(ticks))
+
+    _, response = app.test_client.get("/")
+
+    assert int(response.text) > 5
+
+
+def test_offload_metrics(app: Sanic):
+    app.config.METRICS = True
+
+    @app.get("/", offload="thread")
+    def handler(request):
+        return text("done")
+
+    @app.after_server_start
+    async def keep_table(app):
+        app.ctx.table = app._metrics_table
+
+    app.test_client.get("/")
+
+    counters = app.ctx.table.collect()["counters"]
+    assert counters["sanic_offloaded_total"] == 1
+    assert counters["sanic_offload_pending"] == 0
+    assert counters["sanic_offload_rejected_total"] == 0
+
+
+def test_invalid_offload_mode(app: Sanic):
+    with pytest.raises(ValueError, match="Invalid offload mode 'process'"):
+        app.route("/", offload="process")
+
+
+def test_offload_before_start(app: Sanic):
+    with pytest.raises(SanicException, match="before the application"):
+        asyncio.run(app.offload(print))
+
+
+async def test_full_queue_is_rejected():
+    release = threading.Event()
+    offloader = Offloader(Mock(metrics=None), threads=1, queue_size=1)
+
+    running = [
+        asyncio.ensure_future(offloader.run(release.wait)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceUnavailable):
+        await offloader.run(print)
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert offloader.pending == 0
+    await offloader.shutdown()
+
+
+async def test_cancelled_call_keeps_its_place():
+    release = threading.Event()
+    offloader = Offloader(Mock(metrics=None), threads=1, queue_size=1)
+
+    running = asyncio.ensure_future(offloader.run(release.wait))
+    await asyncio.sleep(0.01)
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    assert offloader.pending == 1
+
+    release.set()
+    await offloader.shutdown()
+    assert offloader.pending == 0
+
+
+async def test_shutdown_does_not_wait_past_its_timeout():
+    release = threading.Event()
+    offloader = Offloader(Mock(metrics=None), threads=1)
+    running = asyncio.ensure_future(offloader.run(release.wait))
+    await asyncio.sleep(0.01)
+
+    start = time.monotonic()
+    await offloader.shutdown(0.1)
+    assert time.monotonic() - start < 1
+    assert offloader.pending == 1
+
+    release.set()
+    assert await running is True
+    assert offloader.pending == 0
@@ -336,3 +336,39 @@ def test_custom_ctx():
     _, resp = app.test_client.get("/")
 
     assert resp.json == [True, True, "foo"]
+
+
+def test_headers_parsed_lazily_from_head():
+    head = b"\r\n".join(
+        (
+            b"GET / HTTP/1.1",
+            b"Host: example.com",
+            b"X-Foo:  bar",
+            b"X-Foo: baz",
+        )
+    )
+    request = Request(b"/", None, "1.1", "GET", None, None, head=head)
+
+    assert request._headers is None
+    assert request.headers.getone("host") == "example.com"
+    assert request.headers.getall("x-foo") == ["bar", "baz"]
+    assert list(request.headers.keys()) == ["host", "x-foo", "x-foo"]
+    assert request._headers is request.headers
+
+
+def test_headers_only_built_when_accessed(app):
+    seen = {}
+
+    @app.get("/")
+    async def handler(request):
+        seen["host_header"] = request.host_header
+        seen["before"] = request._headers
+        seen["host"] = request.headers.host
+        return response.empty()
+
+    _, resp = app.test_client.get("/", headers={"x-foo": "bar"})
+
+    assert resp.status == 204
+    assert seen["before"] is None
+    assert seen["host"].startswith("127.0.0.1")
+    assert seen["host_header"] == seen["host"]
@@ -621,3 +621,43 @@ def test_streaming_echo():
         assert res is None
 
     app.run(access_log=False, single_process=True)
+
+
+@pytest.mark.parametrize("threshold", [None, 1024])
+def test_streaming_receive_form(app, threshold):
+    app.config.REQUEST_FILE_SPOOL_THRESHOLD = threshold
+    upload = data.encode()
+
+    @app.post("/", stream=True)
+    async def handler(request):
+        await request.receive_form()
+        upload = request.files.get("upload")
+        body = upload.body
+        spooled = not isinstance(body, bytes)
+        if spooled:
+            body = body.read()
+        return json(
+            {
+                "body": len(request.body),
+                "field": request.form.get("field"),
+                "name": upload.name,
+                "size": len(body),
+                "spooled": spooled,
+            }
+        )
+
+    request, response = app.test_client.post(
+        "/",
+        data={"field": "value"},
+        files={"upload": ("upload.txt", upload, "text/plain")},
+    )
+    assert response.status == 200
+    assert response.json == {
+        "body": 0,
+        "field": "value",
+        "name": "upload.txt",
+        "size": len(upload),
+        "spooled": threshold is not None,
+    }
+    body = request.files.get("upload").body
+    assert isinstance(body, bytes) or body.closed
@@ -18,7 +18,7 @@ from sanic_testing.testing import (
 from sanic import Blueprint, Sanic
 from sanic.constants import DEFAULT_HTTP_CONTENT_TYPE
 from sanic.exceptions import ServerError
-from sanic.request import RequestParameters
+from sanic.request import MultipartParser, RequestParameters
 from sanic.response import html, json, text
 
 
@@ -936,6 +936,26 @@ def test_match_info(app):
     assert json_loads(response.text) == {"user_id": "sanic_user"}
 
 
+def test_match_info_changed_by_middleware(app):
+    @app.on_request
+    async def change_user(request):
+        if request.headers.get("x-user"):
+            request.match_info["user_id"] = request.headers["x-user"]
+
+    @app.route("/api/v1/user/<user_id>/")
+    async def handler(request, user_id):
+        return text(user_id)
+
+    _, response = app.test_client.get(
+        "/api/v1/user/sanic_user/", headers={"x-user": "other"}
+    )
+    assert response.text == "other"
+
+    # The router caches the match, which must not keep the change
+    _, response = app.test_client.get("/api/v1/user/sanic_user/")
+    assert response.text == "sanic_user"
+
+
 @pytest.mark.asyncio
 async def test_match_info_asgi(app):
     @app.route("/api/v1/user/<user_id>/")
@@ -1544,6 +1564,32 @@ async def test_request_multipart_file_duplicate_filed_name_asgi(app):
     ]
 
 
+def test_multipart_parser_incremental():
+    fields = (
+        '--sanic\r\nContent-Disposition: form-data; name="field"\r\n\r\n'
+        "value\r\n"
+        '--sanic\r\nContent-Disposition: form-data; name="file";'
+        ' filename="test.bin"\r\nContent-Type: application/octet-stream'
+        "\r\n\r\n"
+    ).encode()
+    content = bytes(range(256)) * 8
+    body = fields + content + b"\r\n--sanic--\r\n"
+
+    for size in (1, 7, 64, len(body)):
+        parser = MultipartParser(b"sanic", spool_threshold=1000)
+        parts = []
+        for start in range(0, len(body), size):
+            parts.extend(parser.feed(body[start : start + size]))
+        parser.close()
+
+        assert [name for name, _ in parts] == ["field", "file"]
+        assert parser.fields == {"field": ["value"]}
+        upload = parser.files["file"][0]
+        assert upload.name == "test.bin"
+        assert upload.type == "application/octet-stream"
+        assert upload.body.read() == content
+
+
 def test_request_multipart_with_multiple_files_and_type(app):
     @app.route("/", methods=["POST"])
     async def post(request):
@@ -2221,6 +2267,89 @@ def test_safe_method_with_body(app):
     assert response.body == b"OK"
 
 
+def test_body_received_into_preallocated_buffer(app):
+    @app.post("/")
+    async def handler(request):
+        return text("OK")
+
+    data = b"0123456789" * 100_000
+    request, response = app.test_client.post("/", data=data)
+
+    assert response.status == 200
+    assert type(request.body) is bytearray
+    assert request.body == data
+    assert request.body_file is None
+
+
+def spool_app(app):
+    app.config.REQUEST_BODY_SPOOL_THRESHOLD = 1000
+
+    @app.post("/")
+    async def handler(request):
+        return json(
+            {
+                "body": len(request.body),
+                "spooled": request.body_file is not None,
+                "json": request.json,
+            }
+        )
+
+    return app
+
+
+def test_body_spooled_to_file(app):
+    spool_app(app)
+    payload = {"items": list(range(1000))}
+
+    request, response = app.test_client.post("/", data=json_dumps(payload))
+    assert response.status == 200
+    assert response.json == {"body": 0, "spooled": True, "json": payload}
+    assert request.body_file.closed
+
+    _, response = app.test_client.post("/", data=json_dumps({"a": 1}))
+    assert response.json == {"body": 8, "spooled": False, "json": {"a": 1}}
+
+
+@pytest.mark.asyncio
+async def test_body_spooled_to_file_asgi(app):
+    spool_app(app)
+    payload = {"items": list(range(1000))}
+
+    request, response = await app.asgi_client.post(
+        "/", data=json_dumps(payload)
+    )
+    assert response.status == 200
+    assert response.json == {"body": 0, "spooled": True, "json": payload}
+    assert request.body_file.closed
+
+    _, response = await app.asgi_client.post("/", data=json_dumps({"a": 1}))
+    assert response.json == {"body": 8, "spooled": False, "json": {"a": 1}}
+
+
+def test_spooled_body_form(app):
+    app.config.REQUEST_BODY_SPOOL_THRESHOLD = 1000
+
+    @app.post("/")
+    async def handler(request):
+        upload = request.files.get("upload")
+        return json(
+            {
+                "spooled": request.body_file is not None,
+                "field": request.form.get("field"),
+                "size": len(upload.body),
+            }
+        )
+
+    _, response = app.test_client.post(
+        "/",
+        data={"field": "value"},
+        files={"upload": ("upload.txt", b"x" * 5000, "text/plain")},
+    )
+
+    assert response.status == 200
+    assert response.json == {"spooled": True, "field": "value", "size": 5000}
+
+
 @pytest.mark.asyncio
 async def test_conflicting_body_methods_overload_error(app: Sanic):
     @app.put("/")
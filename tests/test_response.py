@@ -4,8 +4,9 @@ import os
 import time
 
 from collections import namedtuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from email.utils import formatdate, parsedate_to_datetime
+from io import BytesIO
 from logging import ERROR, LogRecord
 from mimetypes import guess_type
 from pathlib import Path
@@ -22,13 +23,17 @@ from sanic import Request, Sanic
 from sanic.compat import Header
 from sanic.constants import DEFAULT_HTTP_CONTENT_TYPE
 from sanic.cookies import CookieJar
+from sanic.handlers import ContentRangeHandler
+from sanic.http import Http
 from sanic.response import (
+    FileResponse,
     HTTPResponse,
     ResponseStream,
     empty,
     file,
     file_stream,
     json,
+    ranged,
     raw,
     text,
 )
@@ -540,6 +545,224 @@ def test_file_stream_response_range(
     )
 
 
+@pytest.mark.parametrize("responder", ["file", "file_stream", "FileResponse"])
+def test_file_response_multipart_range(
+    app: Sanic, static_file_directory, responder
+):
+    file_path = os.path.join(static_file_directory, "python.png")
+    content = get_file_content(static_file_directory, "python.png")
+
+    @app.get("/")
+    async def file_route(request):
+        _range = ContentRangeHandler(request, os.stat(file_path))
+        if responder == "file":
+            return await file(file_path, _range=_range)
+        elif responder == "file_stream":
+            return await file_stream(file_path, chunk_size=64, _range=_range)
+        return FileResponse(file_path, chunk_size=64, _range=_range)
+
+    _, response = app.test_client.get(
+        "/", headers={"range": "bytes=0-99,1000-1999"}
+    )
+    assert response.status == 206
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1]
+    assert response.body == (
+        f"--{boundary}\r\n"
+        "Content-Type: image/png\r\n"
+        f"Content-Range: bytes 0-99/{len(content)}\r\n\r\n".encode()
+        + content[:100]
+        + f"\r\n--{boundary}\r\n"
+        "Content-Type: image/png\r\n"
+        f"Content-Range: bytes 1000-1999/{len(content)}\r\n\r\n".encode()
+        + content[1000:2000]
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+
+@pytest.fixture
+def restore_loop_policy():
+    policy = asyncio.get_event_loop_policy()
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+@pytest.mark.parametrize("use_uvloop", [True, False])
+@pytest.mark.parametrize("file_name", ["test.file", "python.png"])
+def test_file_response_sendfile(
+    app: Sanic,
+    file_name,
+    static_file_directory,
+    use_uvloop,
+    monkeypatch,
+    restore_loop_policy,
+):
+    app.config.USE_UVLOOP = use_uvloop
+    if not use_uvloop:
+        asyncio.set_event_loop_policy(None)
+    sendfile = Http.sendfile
+    sent = []
+
+    async def spy(self, location, offset, count):
+        sent.append(await sendfile(self, location, offset, count))
+        return sent[-1]
+
+    monkeypatch.setattr(Http, "sendfile", spy)
+
+    @app.route("/files/<filename>", methods=["GET", "HEAD"])
+    def file_route(request, filename):
+        return FileResponse(os.path.join(static_file_directory, filename))
+
+    content = get_file_content(static_file_directory, file_name)
+    _, response = app.test_client.get(f"/files/{file_name}")
+    assert response.status == 200
+    assert response.body == content
+    assert int(response.headers["content-length"]) == len(content)
+    assert response.headers["content-type"] == (
+        guess_type(file_name)[0] or "text/plain"
+    )
+    # uvloop does not implement loop.sendfile, so os.sendfile is used
+    assert sent == [len(content)]
+
+    _, response = app.test_client.head(f"/files/{file_name}")
+    assert response.status == 200
+    assert response.body == b""
+    assert int(response.headers["content-length"]) == len(content)
+
+
+@pytest.mark.parametrize("use_uvloop", [True, False])
+def test_file_response_sendfile_large(
+    app: Sanic, tmp_path, use_uvloop, monkeypatch, restore_loop_policy
+):
+    app.config.USE_UVLOOP = use_uvloop
+    if not use_uvloop:
+        asyncio.set_event_loop_policy(None)
+    # Slices larger than the socket buffers, so that writing has to wait
+    monkeypatch.setattr(Http, "SENDFILE_CHUNK_SIZE", 1_048_576)
+    content = os.urandom(3_000_000)
+    path = tmp_path / "large.bin"
+    path.write_bytes(content)
+
+    @app.get("/")
+    def file_route(request):
+        return FileResponse(path)
+
+    _, response = app.test_client.get("/")
+    assert response.status == 200
+    assert response.body == content
+
+
+@pytest.mark.parametrize("use_uvloop", [True, False])
+def test_file_response_range(
+    app: Sanic, static_file_directory, use_uvloop, restore_loop_policy
+):
+    app.config.USE_UVLOOP = use_uvloop
+    if not use_uvloop:
+        asyncio.set_event_loop_policy(None)
+    Range = namedtuple("Range", ["size", "start", "end", "total"])
+    content = get_file_content(static_file_directory, "python.png")
+    range = Range(size=1000, start=100, end=1099, total=len(content))
+
+    @app.get("/")
+    def file_route(request):
+        return FileResponse(
+            os.path.join(static_file_directory, "python.png"),
+            chunk_size=64,
+            _range=range,
+        )
+
+    _, response = app.test_client.get("/")
+    assert response.status == 206
+    assert response.headers["Content-Range"] == "bytes 100-1099/%d" % len(
+        content
+    )
+    assert response.body == content[100:1100]
+
+
+@pytest.mark.parametrize("source", [False, True])
+@pytest.mark.parametrize(
+    "range_header,status,body",
+    (
+        (None, 200, b"0123456789"),
+        ("bytes=2-4", 206, b"234"),
+        ("bytes=-3", 206, b"789"),
+        ("bytes=8-", 206, b"89"),
+        ("bytes=2-4,20-", 206, b"234"),
+        ("bytes=4-2", 200, b"0123456789"),
+    ),
+)
+def test_ranged_response(app: Sanic, source, range_header, status, body):
+    @app.get("/")
+    async def handler(request):
+        data = b"0123456789"
+        if source:
+            return ranged(request, BytesIO(data), size=len(data), etag='"a"')
+        return ranged(request, data, etag='"a"')
+
+    headers = {"range": range_header} if range_header else {}
+    _, response = app.test_client.get("/", headers=headers)
+    assert response.status == status
+    assert response.body == body
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == '"a"'
+    assert int(response.headers["content-length"]) == len(body)
+
+
+@pytest.mark.parametrize("source", [False, True])
+def test_ranged_response_multipart(app: Sanic, source):
+    data = bytes(range(256))
+
+    @app.get("/")
+    async def handler(request):
+        if source:
+            return ranged(
+                request, BytesIO(data), size=len(data), content_type="x/y"
+            )
+        return ranged(request, data, content_type="x/y")
+
+    _, response = app.test_client.get(
+        "/", headers={"range": "bytes=0-1,200-201"}
+    )
+    assert response.status == 206
+    boundary = response.headers["content-type"].split("boundary=")[1]
+    assert response.body == (
+        f"--{boundary}\r\nContent-Type: x/y\r\n"
+        "Content-Range: bytes 0-1/256\r\n\r\n".encode()
+        + data[0:2]
+        + f"\r\n--{boundary}\r\nContent-Type: x/y\r\n"
+        "Content-Range: bytes 200-201/256\r\n\r\n".encode()
+        + data[200:202]
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+    assert int(response.headers["content-length"]) == len(response.body)
+
+
+def test_ranged_response_if_range(app: Sanic):
+    last_modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    @app.get("/")
+    async def handler(request):
+        return ranged(
+            request, "0123456789", etag='"a"', last_modified=last_modified
+        )
+
+    for if_range, status in (
+        ('"a"', 206),
+        ('"b"', 200),
+        ("Mon, 01 Jan 2024 00:00:00 GMT", 206),
+        ("Tue, 02 Jan 2024 00:00:00 GMT", 200),
+    ):
+        _, response = app.test_client.get(
+            "/", headers={"range": "bytes=0-0", "if-range": if_range}
+        )
+        assert response.status == status
+
+    _, response = app.test_client.get("/", headers={"range": "bytes=20-"})
+    assert response.status == 416
+    assert response.headers["content-range"] == "bytes */10"
+
+
 def test_raw_response(app):
     @app.get("/test")
     def handler(request: Request):
@@ -991,3 +1214,38 @@ def test_stream_response_with_default_headers(app: Sanic):
     assert response.text == "foo"
     assert response.headers["Transfer-Encoding"] == "chunked"
     assert response.headers["Content-Type"] == "text/csv"
+
+
+@pytest.mark.parametrize("size", (100, 1_000_000))
+def test_large_body_written_with_header(app: Sanic, size: int):
+    body = os.urandom(size)
+    sent = []
+
+    @app.route("/")
+    async def test(request: Request):
+        return raw(body)
+
+    @app.signal("http.lifecycle.send")
+    async def collect(data):
+        sent.append(data)
+
+    _, response = app.test_client.get("/")
+    assert response.status == 200
+    assert response.body == body
+    assert all(isinstance(data, bytes) for data in sent)
+    assert b"".join(sent).endswith(body)
+
+
+def test_large_chunks_streamed(app: Sanic):
+    chunk = os.urandom(100_000)
+
+    @app.route("/")
+    async def test(request: Request):
+        response = await request.respond(content_type="text/plain")
+        await response.send(b"foo")
+        await response.send(chunk)
+        await response.send(chunk, end_stream=True)
+
+    _, response = app.test_client.get("/")
+    assert response.headers["Transfer-Encoding"] == "chunked"
+    assert response.body == b"foo" + chunk + chunk
@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from sanic import Sanic
+from sanic.response import CachePolicy, text
+from sanic.response.cache import ResponseCache
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def cached_app(app: Sanic, calls):
+    @app.get("/feed", cache=CachePolicy(ttl=60, vary=("accept-language",)))
+    async def handler_feed(request):
+        calls.append(request.path)
+        return text(
+            f"feed {len(calls)} {request.args.get('page', '1')}",
+            headers={"x-feed": "yes"},
+        )
+
+    @app.get("/short", cache=CachePolicy(ttl=0.1))
+    async def handler_short(request):
+        calls.append(request.path)
+        return text(f"short {len(calls)}")
+
+    @app.get("/slow", cache=CachePolicy(ttl=60))
+    async def handler_slow(request):
+        calls.append(request.path)
+        await asyncio.sleep(0.1)
+        return text(f"slow {len(calls)}")
+
+    @app.get("/missing", cache=CachePolicy(ttl=60))
+    async def handler_missing(request):
+        calls.append(request.path)
+        return text("missing", status=404)
+
+    @app.get("/cookie", cache=CachePolicy(ttl=60))
+    async def handler_cookie(request):
+        calls.append(request.path)
+        response = text("cookie")
+        response.add_cookie("session", "abc")
+        return response
+
+    @app.get("/private", cache=CachePolicy(ttl=60))
+    async def handler_private(request):
+        calls.append(request.path)
+        return text("private", headers={"cache-control": "private"})
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_response_is_cached(cached_app: Sanic, calls):
+    middleware_calls = []
+
+    @cached_app.on_response
+    async def add_header(request, response):
+        middleware_calls.append(request.path)
+        response.headers["x-middleware"] = "yes"
+
+    _, first = await cached_app.asgi_client.get("/feed")
+    _, second = await cached_app.asgi_client.get("/feed")
+
+    assert first.text == second.text == "feed 1 1"
+    assert second.headers["x-feed"] == "yes"
+    assert second.headers["x-middleware"] == "yes"
+    assert second.headers["content-type"] == "text/plain; charset=utf-8"
+    assert calls == ["/feed"]
+    assert middleware_calls == ["/feed"]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_key(cached_app: Sanic, calls):
+    _, response = await cached_app.asgi_client.get("/feed?page=2")
+    assert response.text == "feed 1 2"
+    _, response = await cached_app.asgi_client.get(
+        "/feed?page=2", headers={"accept-language": "fr"}
+    )
+    assert response.text == "feed 2 2"
+    _, response = await cached_app.asgi_client.get("/feed?page=3")
+    assert response.text == "feed 3 3"
+    _, response = await cached_app.asgi_client.get("/feed?page=2")
+    assert response.text == "feed 1 2"
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_response_cache_head(cached_app: Sanic, calls):
+    _, response = await cached_app.asgi_client.head("/feed")
+    assert response.status == 405
+
+    await cached_app.asgi_client.get("/feed")
+    await cached_app.asgi_client.get("/feed")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_expires(cached_app: Sanic, calls):
+    _, first = await cached_app.asgi_client.get("/short")
+    await asyncio.sleep(0.2)
+    _, second = await cached_app.asgi_client.get("/short")
+
+    assert first.text == "short 1"
+    assert second.text == "short 2"
+
+
+@pytest.mark.parametrize("path", ["/missing", "/cookie", "/private"])
+@pytest.mark.asyncio
+async def test_response_not_cached(cached_app: Sanic, calls, path):
+    await cached_app.asgi_client.get(path)
+    await cached_app.asgi_client.get(path)
+
+    assert calls == [path, path]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_single_flight(cached_app: Sanic, calls):
+    results = await asyncio.gather(
+        *(cached_app.asgi_client.get("/slow") for _ in range(5))
+    )
+
+    assert [response.text for _, response in results] == ["slow 1"] * 5
+    assert calls == ["/slow"]
+
+
+def test_response_cache_max_entries():
+    cache = ResponseCache(CachePolicy(ttl=60, max_entries=2))
+    for key in ("a", "b", "a", "c"):
+        cache.store((key,), text(key))
+
+    assert len(cache) == 2
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)).body == b"a"
+    assert cache.get(("c",)).body == b"c"
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"ttl": 0}, {"ttl": -1}, {"ttl": 1, "max_entries": 0}]
+)
+def test_cache_policy_invalid(kwargs):
+    with pytest.raises(ValueError):
+        CachePolicy(**kwargs)
+
+
+def test_cache_policy_vary():
+    assert CachePolicy(ttl=1, vary="Accept-Language").vary == (
+        "accept-language",
+    )
+    assert CachePolicy(ttl=1, vary=["Accept", "Origin"]).vary == (
+        "accept",
+        "origin",
+    )
@@ -2,6 +2,7 @@ import asyncio
 
 from enum import Enum
 from itertools import count
+from unittest.mock import Mock
 
 import pytest
 
@@ -9,7 +10,7 @@ from sanic_routing.exceptions import NotFound
 
 from sanic import Blueprint, Sanic, empty
 from sanic.exceptions import InvalidSignal, SanicException
-from sanic.signals import Event
+from sanic.signals import Event, SignalDispatcher
 
 
 def test_add_signal(app):
@@ -231,6 +232,65 @@ async def test_dispatch_signal_triggers_dynamic_route(app):
     assert counter == 9
 
 
+@pytest.mark.asyncio
+async def test_dispatch_signal_uses_dispatch_table(app, monkeypatch):
+    calls = []
+
+    @app.signal("foo.bar.baz")
+    def static_signal(**_):
+        calls.append("static")
+
+    @app.signal("foo.qux.<thing>")
+    def dynamic_signal(thing):
+        calls.append(thing)
+
+    app.signal_router.finalize()
+    table = app.signal_router._dispatch_table
+    assert table["foo.bar.baz"].signals
+    assert table[Event.HTTP_HANDLER_BEFORE.value] is None
+    assert "foo.qux.<thing>" not in table
+
+    get = app.signal_router.get
+    routed = []
+
+    def spy(event, *args, **kwargs):
+        routed.append(event)
+        return get(event, *args, **kwargs)
+
+    monkeypatch.setattr(app.signal_router, "get", spy)
+
+    await app.dispatch("foo.bar.baz", inline=True)
+    await app.dispatch("foo.qux.one", inline=True)
+    await app.dispatch(
+        Event.HTTP_HANDLER_BEFORE, inline=True, fail_not_found=False
+    )
+
+    assert calls == ["static", "one"]
+    assert routed == ["foo.qux.one"]
+
+    event_task = asyncio.create_task(app.event("foo.bar.baz"))
+    await asyncio.sleep(0)
+    await app.dispatch("foo.bar.baz", context={"x": 1})
+    await asyncio.sleep(0)
+    assert event_task.result() == {"x": 1}
+
+
+@pytest.mark.asyncio
+async def test_signal_has_handlers(app):
+    @app.signal(Event.HTTP_LIFECYCLE_SEND)
+    def send_signal(**_): ...
+
+    @app.signal("foo.qux.<thing>")
+    def dynamic_signal(thing): ...
+
+    assert app.signal_router.has_handlers(Event.HTTP_HANDLER_BEFORE)
+    app.signal_router.finalize()
+
+    assert app.signal_router.has_handlers(Event.HTTP_LIFECYCLE_SEND)
+    assert not app.signal_router.has_handlers(Event.HTTP_HANDLER_BEFORE)
+    assert app.signal_router.has_handlers("foo.qux.one")
+
+
 @pytest.mark.asyncio
 async def test_dispatch_signal_triggers_parameterized_dynamic_route_event(app):
     @app.signal("foo.bar.<baz:int>")
@@ -770,3 +830,199 @@ def test_report_exception_runs_task(app: Sanic):
     app.test_client.get("/")
 
     assert next(c) == 4
+
+
+@pytest.mark.asyncio
+async def test_dispatch_signal_on_queue(app: Sanic):
+    results = []
+
+    @app.signal("foo.bar.baz")
+    async def queued_signal(value):
+        results.append(value)
+        return value
+
+    app.config.SIGNAL_QUEUE_SIZE = 10
+    app.config.SIGNAL_QUEUE_WORKERS = 2
+    app.signalize()
+    dispatcher = app.signal_router.dispatcher
+    assert isinstance(dispatcher, SignalDispatcher)
+
+    futures = [
+        await app.dispatch("foo.bar.baz", context={"value": idx})
+        for idx in range(1, 6)
+    ]
+    assert [await future for future in futures] == [1, 2, 3, 4, 5]
+    assert sorted(results) == [1, 2, 3, 4, 5]
+
+    await dispatcher.close()
+    assert not dispatcher.consumers
+    assert dispatcher.counters == {
+        "size": 0,
+        "queued": 5,
+        "dispatched": 5,
+        "failed": 0,
+        "blocked": 0,
+        "dropped": 0,
+        "overflowed": 0,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overflow,dispatched,blocked,dropped,overflowed",
+    (
+        ("block", 4, 1, 0, 0),
+        ("drop", 2, 0, 2, 0),
+        ("count", 3, 0, 0, 1),
+    ),
+)
+async def test_dispatch_signal_on_queue_overflow(
+    app: Sanic, overflow, dispatched, blocked, dropped, overflowed
+):
+    results = []
+
+    @app.signal("foo.bar.baz")
+    async def queued_signal(value):
+        results.append(value)
+
+    app.signal_router.finalize()
+    dispatcher = SignalDispatcher(
+        app.signal_router, maxsize=2, workers=1, overflow=overflow
+    )
+    app.signal_router.dispatcher = dispatcher
+
+    for idx in range(4):
+        await app.dispatch("foo.bar.baz", context={"value": idx})
+    await dispatcher.close()
+    await asyncio.sleep(0)
+
+    assert len(results) == 4 - dropped
+    assert dispatcher.dispatched == dispatched
+    assert dispatcher.blocked == blocked
+    assert dispatcher.dropped == dropped
+    assert dispatcher.overflowed == overflowed
+
+
+@pytest.mark.asyncio
+async def test_dispatch_signal_on_full_queue_from_consumer(app: Sanic):
+    results = []
+
+    @app.signal("foo.bar.first")
+    async def first(**_):
+        for idx in range(3):
+            await app.dispatch("foo.bar.second", context={"value": idx})
+
+    @app.signal("foo.bar.second")
+    async def second(value):
+        results.append(value)
+
+    app.signal_router.finalize()
+    dispatcher = SignalDispatcher(app.signal_router, maxsize=1, workers=1)
+    app.signal_router.dispatcher = dispatcher
+
+    future = await app.dispatch("foo.bar.first")
+    await asyncio.wait_for(future, timeout=1)
+    await dispatcher.close()
+    await asyncio.sleep(0)
+
+    assert sorted(results) == [0, 1, 2]
+    assert dispatcher.blocked == 0
+    assert dispatcher.overflowed == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_signal_on_queue_with_failing_metrics(app: Sanic):
+    @app.signal("foo.bar.baz")
+    async def queued_signal(value):
+        return value
+
+    app.signal_router.finalize()
+    metrics = Mock()
+    metrics.add.side_effect = ValueError("released")
+    dispatcher = SignalDispatcher(app.signal_router, maxsize=10, workers=1)
+    app.signal_router.dispatcher = dispatcher
+
+    futures = [
+        await app.dispatch("foo.bar.baz", context={"value": idx})
+        for idx in range(1, 4)
+    ]
+    # The metrics fail once the dispatches have been queued
+    dispatcher.metrics = metrics
+
+    assert await asyncio.wait_for(asyncio.gather(*futures), timeout=1) == [
+        1,
+        2,
+        3,
+    ]
+    assert dispatcher.metrics is None
+    await dispatcher.close()
+
+
+def test_dispatch_signal_on_queue_with_server(app: Sanic):
+    app.config.SIGNAL_QUEUE_SIZE = 100
+    app.config.METRICS = True
+    events = []
+
+    @app.signal(Event.HTTP_LIFECYCLE_COMPLETE)
+    async def complete(**_):
+        events.append("complete")
+
+    @app.route("/")
+    async def handler(request):
+        await request.app.dispatch("foo.bar.baz")
+        return empty()
+
+    @app.signal("foo.bar.baz")
+    async def background_signal(**_):
+        events.append("background")
+
+    @app.after_server_stop
+    async def after_server_stop(*_):
+        events.append(app.signal_router.dispatcher.counters["dispatched"])
+
+    @app.after_server_start
+    async def keep_table(app):
+        app.ctx.table = app._metrics_table
+
+    _, response = app.test_client.get("/")
+
+    assert response.status == 204
+    assert "background" in events
+    assert events[-1] == 1
+    counters = app.ctx.table.collect()["counters"]
+    assert counters["sanic_signals_queued_total"] == 1
+    assert counters["sanic_signals_dispatched_total"] == 1
+    assert counters["sanic_signals_dropped_total"] == 0
+    assert app.signal_router.dispatcher is None
+
+
+def test_dispatch_signal_on_queue_while_stopping(app: Sanic):
+    app.config.SIGNAL_QUEUE_SIZE = 10
+    app.config.METRICS = True
+    events = []
+
+    @app.route("/")
+    async def handler(request):
+        return empty()
+
+    @app.signal("foo.bar.baz")
+    async def stopping_signal(**_):
+        await asyncio.sleep(0.05)
+        events.append("stopping")
+        return "stopped"
+
+    @app.after_server_start
+    async def keep_table(app):
+        app.ctx.table = app._metrics_table
+
+    @app.after_server_stop
+    async def after_server_stop(app):
+        app.ctx.future = await app.dispatch("foo.bar.baz")
+
+    _, response = app.test_client.get("/")
+
+    assert response.status == 204
+    assert events == ["stopping"]
+    assert app.ctx.future.result() == "stopped"
+    counters = app.ctx.table.collect()["counters"]
+    assert counters["sanic_signals_dispatched_total"] == 1
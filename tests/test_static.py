@@ -1,3 +1,5 @@
+import asyncio
+import gzip
 import logging
 import os
 import sys
@@ -10,6 +12,7 @@ import pytest
 
 from sanic import Sanic, text
 from sanic.exceptions import FileNotFound, ServerError
+from sanic.handlers import StaticFileCache
 
 
 @pytest.fixture(scope="module")
@@ -319,14 +322,13 @@ def test_static_content_range_error(app, file_name, static_file_directory):
         use_content_range=True,
     )
 
-    headers = {"Range": "bytes=1-0"}
+    size = len(get_file_content(static_file_directory, file_name))
+    headers = {"Range": f"bytes={size}-"}
     request, response = app.test_client.get("/testing.file", headers=headers)
     assert response.status == 416
     assert "Content-Length" in response.headers
     assert "Content-Range" in response.headers
-    assert response.headers["Content-Range"] == "bytes */%s" % (
-        len(get_file_content(static_file_directory, file_name)),
-    )
+    assert response.headers["Content-Range"] == "bytes */%s" % (size,)
 
 
 @pytest.mark.parametrize("file_name", ["test.file", "decode me.txt"])
@@ -361,8 +363,10 @@ def test_static_content_range_invalid_start(
     headers = {"Range": f"bytes={start}-0"}
     request, response = app.test_client.get("/testing.file", headers=headers)
 
-    assert response.status == 416
-    assert f"'{start}' is invalid for Content Range" in response.text
+    # An invalid range is ignored, and the whole file is sent
+    assert response.status == 200
+    assert "Content-Range" not in response.headers
+    assert response.body == get_file_content(static_file_directory, file_name)
 
 
 @pytest.mark.parametrize("file_name", ["test.file", "decode me.txt"])
@@ -379,13 +383,18 @@ def test_static_content_range_invalid_end(
     headers = {"Range": f"bytes=1-{end}"}
     request, response = app.test_client.get("/testing.file", headers=headers)
 
-    assert response.status == 416
-    assert f"'{end}' is invalid for Content Range" in response.text
+    # An invalid range is ignored, and the whole file is sent
+    assert response.status == 200
+    assert "Content-Range" not in response.headers
+    assert response.body == get_file_content(static_file_directory, file_name)
 
 
+@pytest.mark.parametrize(
+    "value", ["bytes=-", "bytes=", "bytes=1-0", "bytes=0-1,5-3"]
+)
 @pytest.mark.parametrize("file_name", ["test.file", "decode me.txt"])
 def test_static_content_range_invalid_parameters(
-    app, file_name, static_file_directory
+    app, file_name, static_file_directory, value
 ):
     app.static(
         "/testing.file",
@@ -393,11 +402,13 @@ def test_static_content_range_invalid_parameters(
         use_content_range=True,
     )
 
-    headers = {"Range": "bytes=-"}
+    headers = {"Range": value}
     request, response = app.test_client.get("/testing.file", headers=headers)
 
-    assert response.status == 416
-    assert "Invalid for Content Range parameters" in response.text
+    # An invalid range is ignored, and the whole file is sent
+    assert response.status == 200
+    assert "Content-Range" not in response.headers
+    assert response.body == get_file_content(static_file_directory, file_name)
 
 
 @pytest.mark.parametrize(
@@ -682,3 +693,304 @@ def test_double_backslash_prohibited_on_win32(
     assert response.status == 404
     _, response = app.test_client.get("/foo/static\\../static/test.file")
     assert response.status == 404
+
+
+@pytest.fixture
+def precompressed_directory(tmp_path: Path):
+    (tmp_path / "app.js").write_bytes(b"console.log('identity');" * 10)
+    (tmp_path / "app.js.gz").write_bytes(
+        gzip.compress(b"console.log('identity');" * 10)
+    )
+    (tmp_path / "app.js.br").write_bytes(b"brotli bytes")
+    (tmp_path / "plain.txt").write_bytes(b"plain")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "accept,encoding,file_name",
+    (
+        ("gzip, br", "br", "app.js.br"),
+        ("gzip", "gzip", "app.js.gz"),
+        ("br;q=0.5, gzip", "gzip", "app.js.gz"),
+        ("br;q=0, gzip;q=0", None, "app.js"),
+        ("identity", None, "app.js"),
+    ),
+)
+def test_static_precompressed(
+    app: Sanic, precompressed_directory: Path, accept, encoding, file_name
+):
+    app.static(
+        "/static", precompressed_directory, precompressed=("br", "gzip")
+    )
+
+    _, response = app.test_client.get(
+        "/static/app.js", headers={"accept-encoding": accept}
+    )
+    served = precompressed_directory / file_name
+    assert response.status == 200
+    assert response.headers.get("content-encoding") == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "javascript" in response.headers["content-type"]
+    assert response.headers["content-length"] == str(served.stat().st_size)
+    if encoding != "br":
+        assert response.text == "console.log('identity');" * 10
+
+
+def test_static_precompressed_missing_variant(
+    app: Sanic, precompressed_directory: Path
+):
+    app.static(
+        "/static", precompressed_directory, precompressed=("br", "gzip")
+    )
+
+    _, response = app.test_client.get(
+        "/static/plain.txt", headers={"accept-encoding": "br, gzip"}
+    )
+    assert response.status == 200
+    assert "content-encoding" not in response.headers
+    assert response.content == b"plain"
+
+
+def test_static_precompressed_range(app: Sanic, precompressed_directory: Path):
+    app.static(
+        "/static",
+        precompressed_directory,
+        precompressed=("br",),
+        use_content_range=True,
+    )
+
+    _, response = app.test_client.get(
+        "/static/app.js",
+        headers={"accept-encoding": "br", "range": "bytes=0-5"},
+    )
+    assert response.status == 206
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["content-range"] == "bytes 0-5/12"
+    assert response.content == b"brotli"
+
+
+def test_static_precompressed_unknown_encoding(
+    app: Sanic, static_file_directory
+):
+    with pytest.raises(ValueError, match="Unknown precompressed encoding"):
+        app.static("/static", static_file_directory, precompressed=("lzma",))
+
+
+def test_static_cache(app: Sanic, tmp_path: Path):
+    (tmp_path / "app.css").write_text("body {}")
+    cache = StaticFileCache(ttl=60)
+    app.static("/static", tmp_path, cache=cache)
+
+    _, response = app.test_client.get("/static/app.css")
+    assert response.status == 200
+    assert response.text == "body {}"
+    assert response.headers["content-type"] == "text/css; charset=utf-8"
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+    assert str(tmp_path / "app.css") in cache
+
+    # Served from memory, even after the file is gone
+    (tmp_path / "app.css").unlink()
+    _, response = app.test_client.get("/static/app.css")
+    assert response.status == 200
+    assert response.text == "body {}"
+    assert "cache-control" not in response.headers
+
+    _, response = app.test_client.get(
+        "/static/app.css", headers={"if-none-match": f"W/{etag}"}
+    )
+    assert response.status == 304
+    assert response.headers["etag"] == etag
+
+    _, response = app.test_client.get(
+        "/static/app.css", headers={"if-modified-since": last_modified}
+    )
+    assert response.status == 304
+
+    _, response = app.test_client.get(
+        "/static/app.css",
+        headers={
+            "if-none-match": '"other"',
+            "if-modified-since": last_modified,
+        },
+    )
+    assert response.status == 200
+
+
+def test_static_cache_content_type_per_route(app: Sanic, tmp_path: Path):
+    (tmp_path / "app.css").write_text("body {}")
+    cache = StaticFileCache(ttl=60)
+    app.static("/plain", tmp_path, cache=cache, content_type="text/plain")
+    app.static("/static", tmp_path, cache=cache, name="styles")
+
+    for path, content_type in (
+        ("/plain/app.css", "text/plain; charset=utf-8"),
+        ("/static/app.css", "text/css; charset=utf-8"),
+        ("/plain/app.css", "text/plain; charset=utf-8"),
+    ):
+        _, response = app.test_client.get(path)
+        assert response.headers["content-type"] == content_type
+    assert len(cache) == 1
+
+
+def test_static_cache_revalidation(app: Sanic, tmp_path: Path):
+    path = tmp_path / "app.js"
+    path.write_text("one")
+    cache = StaticFileCache(ttl=0)
+    app.static("/static", tmp_path, cache=cache)
+
+    _, response = app.test_client.get("/static/app.js")
+    assert response.text == "one"
+    etag = response.headers["etag"]
+
+    path.write_text("two!")
+    os.utime(path, ns=(0, 10**9))
+    _, response = app.test_client.get(
+        "/static/app.js", headers={"if-none-match": etag}
+    )
+    assert response.status == 200
+    assert response.text == "two!"
+    assert response.headers["etag"] != etag
+
+
+def test_static_cache_range(app: Sanic, tmp_path: Path):
+    (tmp_path / "data.txt").write_text("0123456789")
+    app.static("/static", tmp_path, cache=True, use_content_range=True)
+
+    _, response = app.test_client.get(
+        "/static/data.txt", headers={"range": "bytes=2-4"}
+    )
+    assert response.status == 206
+    assert response.text == "234"
+    assert response.headers["content-range"] == "bytes 2-4/10"
+
+
+def test_static_cache_limits(tmp_path: Path):
+    cache = StaticFileCache(max_size=10, max_file_size=6)
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_text(name * 5)
+    (tmp_path / "big").write_text("x" * 7)
+
+    async def load(name):
+        path = tmp_path / name
+        return await cache.load(path, path.stat())
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(load("big")) is None
+        for name in ("a", "b", "c"):
+            assert loop.run_until_complete(load(name))
+    finally:
+        loop.close()
+    assert tmp_path / "a" not in cache
+    assert tmp_path / "c" in cache
+    assert len(cache) == 2
+    assert cache.size == 10
+
+
+def parse_byteranges(response):
+    content_type = response.headers["content-type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=")[1].encode()
+    assert response.body.endswith(b"\r\n--" + boundary + b"--\r\n")
+    parts = []
+    for part in response.body.split(b"--" + boundary)[1:-1]:
+        head, _, body = part.partition(b"\r\n\r\n")
+        if body.endswith(b"\r\n"):
+            body = body[:-2]
+        headers = dict(
+            line.decode().split(": ", 1) for line in head.strip().splitlines()
+        )
+        parts.append((headers, body))
+    return parts
+
+
+@pytest.mark.parametrize(
+    "options",
+    (
+        {},
+        {"cache": True},
+        {"stream_large_files": 1},
+    ),
+)
+def test_static_content_range_multipart(app: Sanic, tmp_path: Path, options):
+    content = bytes(range(256)) * 4
+    (tmp_path / "data.bin").write_bytes(content)
+    app.static("/static", tmp_path, use_content_range=True, **options)
+
+    _, response = app.test_client.get(
+        "/static/data.bin", headers={"range": "bytes=0-9, 500-509, -10"}
+    )
+    assert response.status == 206
+    assert int(response.headers["content-length"]) == len(response.body)
+    assert "content-range" not in response.headers
+    parts = parse_byteranges(response)
+    assert [body for _, body in parts] == [
+        content[0:10],
+        content[500:510],
+        content[-10:],
+    ]
+    assert parts[1][0] == {
+        "Content-Type": "application/octet-stream",
+        "Content-Range": "bytes 500-509/1024",
+    }
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    (
+        ("bytes=0-9,5-19", "bytes 0-19/100"),
+        ("bytes=20-29,0-9", "bytes 0-29/100"),
+        ("bytes=0-9,200-300", "bytes 0-9/100"),
+        ("bytes=90-200", "bytes 90-99/100"),
+        ("bytes=-200", "bytes 0-99/100"),
+    ),
+)
+def test_static_content_range_coalesced(
+    app: Sanic, tmp_path: Path, value, expected
+):
+    (tmp_path / "data.txt").write_text("x" * 100)
+    app.static("/static", tmp_path, use_content_range=True)
+
+    _, response = app.test_client.get(
+        "/static/data.txt", headers={"range": value}
+    )
+    assert response.status == 206
+    assert response.headers["content-range"] == expected
+
+
+def test_static_content_range_too_many(app: Sanic, tmp_path: Path):
+    (tmp_path / "data.txt").write_text("x" * 1000)
+    app.static("/static", tmp_path, use_content_range=True)
+
+    ranges = ",".join(f"{i * 50}-{i * 50 + 1}" for i in range(17))
+    _, response = app.test_client.get(
+        "/static/data.txt", headers={"range": f"bytes={ranges}"}
+    )
+    assert response.status == 416
+    assert "Too many ranges requested" in response.text
+
+
+def test_static_content_range_if_range(app: Sanic, tmp_path: Path):
+    (tmp_path / "data.txt").write_text("0123456789")
+    app.static("/static", tmp_path, use_content_range=True, cache=True)
+
+    _, response = app.test_client.get("/static/data.txt")
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    for if_range in (etag, last_modified):
+        _, response = app.test_client.get(
+            "/static/data.txt",
+            headers={"range": "bytes=0-1", "if-range": if_range},
+        )
+        assert response.status == 206
+        assert response.text == "01"
+
+    for if_range in ('"other"', f"W/{etag}", "Sat, 01 Jan 2000 00:00:00 GMT"):
+        _, response = app.test_client.get(
+            "/static/data.txt",
+            headers={"range": "bytes=0-1", "if-range": if_range},
+        )
+        assert response.status == 200
+        assert response.text == "0123456789"
@@ -1,4 +1,6 @@
 import asyncio
+import gc
+import weakref
 
 from unittest.mock import Mock
 
@@ -8,6 +10,7 @@ from sanic import Sanic
 from sanic.exceptions import RequestTimeout, ServiceUnavailable
 from sanic.http import Stage
 from sanic.server import HttpProtocol
+from sanic.server.timeouts import TimeoutWheel
 
 
 @pytest.fixture
@@ -40,14 +43,65 @@ def test_setup(protocol: HttpProtocol):
 
 def test_check_timeouts_no_timeout(protocol: HttpProtocol):
     protocol.keep_alive_timeout = 1
-    protocol.loop.call_later = Mock()
     protocol.check_timeouts()
     protocol._task.cancel.assert_not_called()
     assert protocol._http.stage is Stage.IDLE
     assert protocol._http.exception is None
-    protocol.loop.call_later.assert_called_with(
-        protocol.keep_alive_timeout / 2, protocol.check_timeouts
+    assert protocol in protocol._timeouts
+    assert protocol._timeouts._handle is not None
+
+
+def test_timeout_wheel_shared(app: Sanic, mock_transport):
+    loop = asyncio.new_event_loop()
+    protocols = []
+    for _ in range(3):
+        protocol = HttpProtocol(loop=loop, app=app)
+        protocol.connection_made(mock_transport)
+        protocol._setup_connection()
+        protocol._http.init_for_request()
+        protocol._task = Mock(spec=asyncio.Task)
+        protocol._task.cancel = Mock()
+        protocol.check_timeouts()
+        protocols.append(protocol)
+
+    wheel = protocols[0]._timeouts
+    assert all(protocol._timeouts is wheel for protocol in protocols)
+    assert len(wheel) == 3
+
+    protocols[0].close()
+    assert protocols[0] not in wheel
+    assert len(wheel) == 2
+
+    protocols[1]._time = 0
+    for _ in wheel.buckets:
+        wheel._turn()
+    protocols[1]._task.cancel.assert_called_once()
+    protocols[2]._task.cancel.assert_not_called()
+    assert protocols[1] not in wheel
+    assert protocols[2] in wheel
+
+
+def test_timeout_wheel_does_not_keep_loop(app: Sanic):
+    loop = asyncio.new_event_loop()
+    protocol = HttpProtocol(loop=loop, app=app)
+    protocol.connection_made(Mock(get_extra_info=Mock(return_value=None)))
+    protocol._task.cancel()
+    loop.run_until_complete(
+        asyncio.gather(protocol._task, return_exceptions=True)
     )
+    protocol._setup_connection()
+    protocol._http.init_for_request()
+    protocol._task = Mock(spec=asyncio.Task)
+    protocol.check_timeouts()
+    protocol.close()
+    assert TimeoutWheel._wheels.get(loop)
+
+    loop.close()
+    asyncio.set_event_loop(None)
+    loop_ref = weakref.ref(loop)
+    del loop, protocol
+    gc.collect()
+    assert loop_ref() is None
 
 
 def test_check_timeouts_keep_alive_timeout(protocol: HttpProtocol):
@@ -9,7 +9,7 @@ from sanic.touchup import TouchUp
 
 
 def test_touchup_methods(app):
-    assert len(TouchUp._registry) == 9
+    assert len(TouchUp._registry) == 10
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+
+from unittest.mock import Mock
+
+import pytest
+
+from sanic import Sanic
+from sanic.metrics import MetricsTable
+from sanic.response import text
+from sanic.tracing import HANDLER, STAGES, RequestTrace, Tracer
+
+
+@pytest.fixture
+def traced_app(app: Sanic):
+    app.config.TRACING = True
+    app.config.TRACING_SLOW_REQUEST = 0
+    return app
+
+
+def _request(status=200):
+    request = Mock(method="GET", path="/")
+    request.route.name = "app.handler"
+    request.stream.response.status = status
+    return request
+
+
+def test_request_is_traced(traced_app: Sanic):
+    batches = []
+    traced_app.trace_sink(batches.append)
+
+    @traced_app.on_request
+    async def before(request):
+        request.ctx.trace = request.trace
+
+    @traced_app.on_response
+    async def after(request, response):
+        await asyncio.sleep(0.01)
+
+    @traced_app.get("/")
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return text("done")
+
+    request, response = traced_app.test_client.get("/")
+
+    assert response.text == "done"
+    assert request.trace is None or request.trace is request.ctx.trace
+    (trace,) = batches[0]
+    assert trace is request.ctx.trace
+    assert trace.route == f"{traced_app.name}.handler"
+    assert trace.status == 200
+    assert list(trace.stages) == list(STAGES)
+    assert trace.stages["handler"] >= 0.05
+    assert trace.stages["response_middleware"] >= 0.01
+    assert trace.duration >= sum(trace.stages.values())
+    names = [name for name, _ in trace.middleware]
+    # The test client adds a response middleware of its own
+    assert names[0] == "test_request_is_traced.<locals>.before"
+    assert "test_request_is_traced.<locals>.after" in names
+    assert trace.as_dict()["route"] == trace.route
+
+
+def test_tracing_is_disabled_by_default(app: Sanic):
+    @app.get("/")
+    async def handler(request):
+        return text(str(request.trace))
+
+    _, response = app.test_client.get("/")
+
+    assert app.tracer is None
+    assert response.text == "None"
+
+
+def test_slow_request_is_logged(traced_app: Sanic, caplog):
+    traced_app.config.TRACING_SLOW_REQUEST = 0.05
+
+    @traced_app.get("/slow")
+    async def slow(request):
+        await asyncio.sleep(0.1)
+        return text("done")
+
+    @traced_app.get("/fast")
+    async def fast(request):
+        return text("done")
+
+    with caplog.at_level(logging.WARNING):
+        traced_app.test_client.get("/fast")
+        traced_app.test_client.get("/slow")
+
+    messages = [m for m in caplog.messages if m.startswith("Slow request")]
+    assert len(messages) == 1
+    assert "GET /slow" in messages[0]
+    assert "handler 0.1" in messages[0]
+
+
+def test_stages_are_added_to_metrics(traced_app: Sanic):
+    traced_app.config.METRICS = True
+    traced_app.config.TRACING_SLOW_REQUEST = 0.05
+
+    @traced_app.get("/")
+    async def handler(request):
+        await asyncio.sleep(0.1)
+        return text("done")
+
+    @traced_app.after_server_start
+    async def keep_table(app):
+        app.ctx.table = app._metrics_table
+
+    traced_app.test_client.get("/")
+
+    rendered = traced_app.ctx.table.render()
+    assert "sanic_slow_requests_total 1" in rendered
+    prefix = 'sanic_request_stage_seconds_total{stage="handler"}'
+    line = next(
+        line for line in rendered.splitlines() if line.startswith(prefix)
+    )
+    assert float(line.split()[-1]) >= 0.1
+
+
+def test_metrics_skip_missing_stages():
+    table = MetricsTable(rows=1, shared=False)
+    metrics = table.worker("Worker")
+    trace = RequestTrace()
+    trace.begin(HANDLER)
+    trace.end(HANDLER)
+
+    metrics.request_traced(trace, False)
+    stages = table.collect()["stages"]
+    metrics.release()
+
+    assert stages["head"] == 0
+    assert stages["handler"] >= 0
+
+
+def test_traces_are_batched():
+    batches = []
+    app = Mock(metrics=None)
+    tracer = Tracer(app, [batches.append], 0, batch_size=2, interval=1)
+
+    for _ in range(3):
+        tracer.finish(_request(), RequestTrace())
+
+    assert [len(batch) for batch in batches] == [2]
+    assert app.loop.call_later.call_count == 2
+
+    tracer.flush()
+    tracer.flush()
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert batches[1][0].status == 200
+
+
+async def test_sinks_are_run_on_close(caplog):
+    async_batches = []
+
+    def broken(traces):
+        raise RuntimeError("Broken")
+
+    async def export(traces):
+        async_batches.append(traces)
+
+    tracer = Tracer(Mock(metrics=None), [broken, export], 0, 10, 1)
+    tracer.finish(_request(404), RequestTrace())
+
+    with caplog.at_level(logging.ERROR):
+        await tracer.close()
+
+    assert async_batches[0][0].status == 404
+    assert "Exception in trace sink" in caplog.text
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        Tracer(Mock(), [], 0, batch_size=0, interval=1)
@@ -4,6 +4,7 @@ except ModuleNotFoundError:  # no cov
     from json import dumps  # type: ignore
 
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import Mock, patch
 from urllib.error import URLError
 
@@ -14,6 +15,7 @@ from sanic_testing import TestManager
 from sanic.cli.inspector_client import InspectorClient
 from sanic.helpers import Default
 from sanic.log import Colors
+from sanic.metrics import BYTES_SENT, MetricsTable
 from sanic.worker.inspector import Inspector
 
 
@@ -139,3 +141,83 @@ def test_run_inspector_authentication():
         "/", headers={"Authorization": "Bearer super-secret"}
     )
     assert response.status == 200
+
+
+def test_run_inspector_metrics():
+    table = MetricsTable(rows=2, routes=4, buckets=(0.1, 1), shared=False)
+    metrics = table.worker("Sanic-Server-0-0")
+    metrics.add(BYTES_SENT, 42)
+    inspector = Inspector(
+        Mock(),
+        {},
+        {},
+        "",
+        0,
+        "",
+        Default(),
+        Default(),
+        metrics=table,
+    )(False)
+    manager = TestManager(inspector.app)
+
+    _, response = manager.test_client.get("/metrics")
+    assert response.status == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    assert "sanic_sent_bytes_total 42\n" in response.text
+
+
+def test_run_inspector_metrics_disabled(http_client):
+    _, response = http_client.get("/metrics")
+    assert response.status == 404
+
+
+def test_run_inspector_profile():
+    worker_state = {
+        "Sanic-Main": {"pid": 1},
+        "Sanic-Server-0-0": {"pid": 2, "server": True},
+        "Sanic-Server-1-0": {"pid": 3, "server": True},
+    }
+
+    def kill(pid, signal):
+        request = worker_state["Sanic-Server-1-0"]["profile"]
+        Path(request["path"]).write_text(f"-;main {pid}\n")
+
+    inspector = Inspector(
+        Mock(), {}, worker_state, "", 0, "", Default(), Default()
+    )(False)
+    manager = TestManager(inspector.app)
+
+    with patch("sanic.worker.inspector.kill", side_effect=kill):
+        _, response = manager.test_client.post(
+            "/profile", json={"seconds": 1, "worker": "1"}
+        )
+
+    assert response.json["result"] == "-;main 3\n"
+    assert worker_state["Sanic-Server-1-0"]["profile"]["seconds"] == 1.0
+    assert not Path(
+        worker_state["Sanic-Server-1-0"]["profile"]["path"]
+    ).exists()
+
+
+@pytest.mark.parametrize(
+    "params",
+    (
+        {"worker": "1"},
+        {"worker": "Sanic-Server-9-9"},
+        {"seconds": 0},
+        {"seconds": 301},
+        {"interval": 0},
+    ),
+)
+def test_run_inspector_profile_bad_request(params):
+    worker_state = {"Sanic-Server-0-0": {"pid": 2, "server": True}}
+    inspector = Inspector(
+        Mock(), {}, worker_state, "", 0, "", Default(), Default()
+    )(False)
+    manager = TestManager(inspector.app)
+
+    with patch("sanic.worker.inspector.kill") as kill:
+        _, response = manager.test_client.post("/profile", json=params)
+
+    assert response.status == 400
+    kill.assert_not_called()
@@ -2,6 +2,7 @@ import sys
 
 from multiprocessing import Event
 from os import environ, getpid
+from time import sleep
 from typing import Any, Dict, Type, Union
 from unittest.mock import Mock
 
@@ -156,3 +157,20 @@ def test_restart_params(
     else:
         with pytest.raises(expected):
             m.restart(**params)
+
+
+def test_profile_requested(
+    worker_state: Dict[str, Any], m: WorkerMultiplexer, tmp_path
+):
+    path = tmp_path / "profile.txt"
+    worker_state["Test"] = {
+        "profile": {"seconds": 0.05, "path": str(path), "interval": 0.001}
+    }
+    m.profile_requested()
+
+    for _ in range(50):
+        if path.exists():
+            break
+        sleep(0.05)
+    assert "test_profile_requested" in path.read_text()
+    assert worker_state["Test"] == {}
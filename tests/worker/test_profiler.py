@@ -0,0 +1,60 @@
+import time
+
+from threading import get_ident
+
+import pytest
+
+from sanic import Sanic
+from sanic.response import text
+from sanic.worker.profiler import SamplingProfiler
+
+
+def busy_function(seconds: float):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+def test_profiler_samples_main_thread():
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    busy_function(0.2)
+    profiler.stop()
+
+    assert profiler.samples > 0
+    lines = profiler.collapsed().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.startswith("-;")
+    assert "busy_function" in stack
+    assert int(count) > 0
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == (
+        profiler.samples
+    )
+
+
+def test_profiler_route_attribution(app: Sanic):
+    profiles = []
+
+    @app.get("/busy")
+    async def handler(request):
+        profiler = SamplingProfiler(interval=0.001, thread_id=get_ident())
+        profiler.start()
+        busy_function(0.2)
+        profiler.stop()
+        profiles.append(profiler.collapsed())
+        return text("done")
+
+    app.test_client.get("/busy")
+
+    stack = profiles[0].splitlines()[0]
+    assert stack.startswith(f"{app.name}.handler;")
+    assert "busy_function" in stack
+
+
+def test_profiler_run():
+    assert SamplingProfiler(interval=0.001).run(0.05) != ""
+
+
+def test_profiler_invalid_interval():
+    with pytest.raises(ValueError):
+        SamplingProfiler(interval=0)
@@ -0,0 +1,254 @@
+import logging
+
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from sanic.types.shared_ctx import SharedContext
+from sanic.worker.shared_memory import (
+    ROW_HEADER,
+    SharedCache,
+    SharedStateTable,
+)
+
+
+@pytest.fixture
+def cache():
+    cache = SharedCache(slots=16, slot_size=64, ways=4)
+    yield cache
+    cache.unlink()
+
+
+def _set_in_child(cache: SharedCache):
+    cache.set("child", cache.get("parent") + b" and child")
+
+
+def test_set_get(cache: SharedCache):
+    cache.set("foo", b"bar")
+    cache.set(b"baz", b"")
+
+    assert cache.get("foo") == b"bar"
+    assert cache.get(b"foo") == b"bar"
+    assert cache.get("baz") == b""
+    assert cache.get("missing") is None
+    assert cache.get("missing", b"default") == b"default"
+    assert "foo" in cache
+    assert len(cache) == 2
+
+
+def test_overwrite(cache: SharedCache):
+    cache.set("foo", b"bar")
+    cache.set("foo", b"longer value")
+
+    assert cache.get("foo") == b"longer value"
+    assert len(cache) == 1
+
+
+def test_delete_and_clear(cache: SharedCache):
+    cache.set("foo", b"bar")
+    cache.set("baz", b"qux")
+
+    assert cache.delete("foo") is True
+    assert cache.delete("foo") is False
+    assert cache.get("foo") is None
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_ttl():
+    cache = SharedCache(slots=4, slot_size=16, ttl=0.05)
+    try:
+        cache.set("default", b"1")
+        cache.set("longer", b"2", ttl=60)
+        sleep(0.1)
+
+        assert cache.get("default") is None
+        assert cache.get("longer") == b"2"
+        assert len(cache) == 1
+    finally:
+        cache.unlink()
+
+
+def test_lru_eviction():
+    cache = SharedCache(slots=3, slot_size=16, ways=3)
+    try:
+        for key in ("a", "b", "c"):
+            cache.set(key, key.encode())
+            sleep(0.01)
+        cache.get("a")
+        cache.set("d", b"d")
+
+        assert cache.get("b") is None
+        assert [cache.get(key) for key in "acd"] == [b"a", b"c", b"d"]
+    finally:
+        cache.unlink()
+
+
+@pytest.mark.parametrize(
+    "key,value", (("", b"value"), ("key", b"x" * 62), ("k" * 65, b""))
+)
+def test_invalid_entry(cache: SharedCache, key, value):
+    with pytest.raises(ValueError):
+        cache.set(key, value)
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"slots": 0}, {"slot_size": 0}, {"ways": 0})
+)
+def test_invalid_cache(kwargs):
+    with pytest.raises(ValueError):
+        SharedCache(**kwargs)
+
+
+def test_slots_rounded_to_ways():
+    cache = SharedCache(slots=10, slot_size=8, ways=4)
+    try:
+        assert cache.slots == 12
+        assert cache.size >= 12 * 8
+    finally:
+        cache.unlink()
+
+
+def test_shared_between_processes(cache: SharedCache):
+    cache.set("parent", b"parent")
+    process = get_context("spawn").Process(target=_set_in_child, args=(cache,))
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert cache.get("child") == b"parent and child"
+
+
+def test_safe_in_shared_ctx(cache: SharedCache, caplog):
+    ctx = SharedContext()
+
+    with caplog.at_level(logging.INFO):
+        ctx.cache = cache
+
+    assert len(caplog.record_tuples) == 0
+
+
+@pytest.fixture
+def table():
+    table = SharedStateTable(rows=4, extra_size=256)
+    yield table
+    table.unlink()
+
+
+def _update_in_child(table: SharedStateTable):
+    table["Child"] = {**table["Parent"], "state": "ACKED", "pid": 2}
+
+
+def test_state_table(table: SharedStateTable):
+    now = datetime.now(tz=timezone.utc)
+    table["Sanic-Server-0-0"] = {"server": True}
+    table["Sanic-Server-0-0"] = {
+        **table["Sanic-Server-0-0"],
+        "state": "STARTED",
+        "pid": 1234,
+        "start_at": now,
+        "starts": 1,
+        "custom": {"foo": "bar"},
+    }
+
+    assert table["Sanic-Server-0-0"] == {
+        "server": True,
+        "state": "STARTED",
+        "pid": 1234,
+        "start_at": now,
+        "starts": 1,
+        "custom": {"foo": "bar"},
+    }
+    assert "Sanic-Server-0-0" in table
+    assert "Sanic-Server-0-1" not in table
+    assert list(table) == ["Sanic-Server-0-0"]
+    assert len(table) == 1
+    assert table == {"Sanic-Server-0-0": table["Sanic-Server-0-0"]}
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        {"state": "NOT-A-STATE"},
+        {"server": 1},
+        {"pid": -1},
+        {"starts": "1"},
+        {"start_at": datetime(2000, 1, 1)},
+    ),
+)
+def test_state_table_other_values(table: SharedStateTable, value):
+    table["Test"] = value
+
+    assert table["Test"] == value
+
+
+def test_state_table_delete(table: SharedStateTable):
+    table["One"] = {"pid": 1}
+    table["Two"] = {"pid": 2}
+
+    del table["One"]
+    assert table.pop("Two") == {"pid": 2}
+    assert table.pop("Two", None) is None
+    assert len(table) == 0
+    with pytest.raises(KeyError):
+        table["One"]
+    with pytest.raises(KeyError):
+        del table["One"]
+
+
+def test_state_table_limits(table: SharedStateTable):
+    for index in range(4):
+        table[f"Process-{index}"] = {}
+
+    with pytest.raises(RuntimeError, match="is full"):
+        table["Process-4"] = {}
+    with pytest.raises(ValueError, match="does not fit"):
+        table["Process-0"] = {"custom": "x" * 256}
+    with pytest.raises(ValueError, match="names must be"):
+        table["x" * 65] = {}
+
+
+def test_state_table_shared_between_processes(table: SharedStateTable):
+    table["Parent"] = {"server": True, "pid": 1}
+    process = get_context("spawn").Process(
+        target=_update_in_child, args=(table,)
+    )
+    process.start()
+    process.join()
+
+    assert process.exitcode == 0
+    assert table["Child"] == {"server": True, "state": "ACKED", "pid": 2}
+
+
+def test_state_table_read_during_long_update(table: SharedStateTable):
+    table["One"] = {"pid": 1}
+    header = ROW_HEADER.unpack_from(table._buf, 0)
+
+    def finish_update():
+        sleep(0.1)
+        ROW_HEADER.pack_into(table._buf, 0, header[0] + 2, *header[1:])
+        table._lock.release()
+
+    # An update that is in progress, and outlasts the retries of a read
+    table._lock.acquire()
+    ROW_HEADER.pack_into(table._buf, 0, header[0] + 1, *header[1:])
+    Thread(target=finish_update).start()
+
+    assert table["One"] == {"pid": 1}
+
+
+def test_state_table_closed(table: SharedStateTable):
+    table["One"] = {"pid": 1}
+    table.close()
+
+    assert table.closed
+    assert len(table) == 0
+    assert "One" not in table
+    assert dict(table.items()) == {}
+    with pytest.raises(KeyError):
+        table["One"]
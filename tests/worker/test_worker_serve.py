@@ -18,6 +18,7 @@ def mock_app():
     server_info = Mock()
     server_info.settings = {"app": app}
     app.state.workers = 1
+    app.config.METRICS = False
     app.listeners = {"main_process_ready": []}
     app.get_motd_data.return_value = ({"packages": ""}, {})
     app.state.server_info = [server_info]